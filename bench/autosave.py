@@ -0,0 +1,58 @@
+"""
+Heavy editing against the autosaver: a card is replaced every few
+milliseconds on the synthetic game from `bench.lazy_open`.  The numbers
+show how long the "UI" thread is held per save (the snapshot only)
+compared with saving synchronously, and whether the worker keeps up
+(latency, queue depth).
+
+    python -m bench.autosave [MB] [seconds]
+"""
+from __future__ import annotations
+import pathlib, sys, tempfile, time
+
+from bench.lazy_open import _write
+from game.autosave   import Autosaver
+from game.card       import Card
+from game.game_file  import open_game
+from game.journal    import KINDS, Journal
+
+
+def main():
+    mb   = float(sys.argv[1]) if len(sys.argv) > 1 else 20
+    secs = float(sys.argv[2]) if len(sys.argv) > 2 else 5
+    with tempfile.TemporaryDirectory() as tmp:
+        path = pathlib.Path(tmp) / "big.json"
+        _write(path, mb)
+        gf = open_game(path)
+        jr = Journal(path, gf)
+        ents = {k: list(getattr(gf, k)) for k in KINDS}
+        boards = list(range(gf.board_count))
+        print(f"{path.stat().st_size / 1e6:.1f} MB, {gf.manifest.counts}")
+
+        t0 = time.perf_counter()
+        ents["cards"][0] = Card.new("sync edit")
+        jr.save(ents, boards)
+        print(f"  synchronous save holds the UI {(time.perf_counter() - t0) * 1e3:7.1f} ms")
+
+        snap = lambda: ({k: list(v) for k, v in ents.items()}, list(boards))
+        saver = Autosaver(snap, lambda batch: jr.save(*batch[-1]), quiet=0.05)
+        held, polls, edits = 0.0, 0, 0
+        end = time.perf_counter() + secs
+        while time.perf_counter() < end:
+            ents["cards"][edits % 1000] = Card.new(f"edit {edits}")
+            edits += 1
+            saver.mark_dirty()
+            time.sleep(0.005 if edits % 40 else 0.1)        # bursts, then a pause
+            t0 = time.perf_counter()
+            if saver.poll():
+                held = max(held, time.perf_counter() - t0); polls += 1
+        saver.close(); jr.close()
+        st = saver.stats
+        print(f"  autosave holds the UI at most   {held * 1e3:7.1f} ms"
+              f"   ({edits} edits, {st.snapshots} snapshots, {st.saves} writes)")
+        print(f"  latency mean {st.mean_latency * 1e3:.0f} ms, max {st.max_latency * 1e3:.0f} ms;"
+              f" queue depth max {st.max_queue}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Fork + mutate cost on a 64×64 board with deep stacks.
+
+Compares `Board.fork()` (copy-on-write) with copying every Cell and
+stack, the only way to branch a board before forks existed.
+
+    python -m bench.board_fork
+"""
+from __future__ import annotations
+import random, time
+
+from game.board import Board, Cell
+from game.card  import Card
+
+SIZE   = 64
+DEPTH  = 16
+FORKS  = 200
+WRITES = 8          # cells touched per fork, like one look-ahead ply
+
+
+def _board(storage: str) -> Board:
+    cards = [Card.new(f"c{i}") for i in range(32)]
+    rnd = random.Random(4)
+    bd  = Board(SIZE, SIZE, storage)
+    for y in range(SIZE):
+        for x in range(SIZE):
+            for _ in range(DEPTH):
+                bd.place(x, y, rnd.choice(cards))
+    return bd
+
+
+def _mutate(bd: Board, rnd: random.Random):
+    for _ in range(WRITES):
+        x, y = rnd.randrange(SIZE), rnd.randrange(SIZE)
+        bd.place(x, y, bd.remove_top(x, y))
+
+
+def main():
+    print(f"board {SIZE}×{SIZE}, stacks {DEPTH} deep, {WRITES} writes per fork")
+    for storage in ("dense", "compact", "sparse"):
+        bd, rnd = _board(storage), random.Random(5)
+        t0 = time.perf_counter()
+        for _ in range(FORKS):
+            _mutate(bd.fork(), rnd)
+        dt = (time.perf_counter() - t0) / FORKS
+        print(f"  fork+mutate  {storage:8}: {dt * 1e6:10.1f} µs")
+
+    bd, rnd = _board("dense"), random.Random(5)
+    t0 = time.perf_counter()
+    for _ in range(FORKS):
+        grid = [[Cell(c.x, c.y, c.stack[:]) for c in row] for row in bd.grid]
+        for _ in range(WRITES):
+            st = grid[rnd.randrange(SIZE)][rnd.randrange(SIZE)].stack
+            st.append(st.pop())
+    dt = (time.perf_counter() - t0) / FORKS
+    print(f"  copy cells+stacks    : {dt * 1e6:10.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
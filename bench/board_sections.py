@@ -0,0 +1,75 @@
+"""
+Placement throughput on a 256×256 board with a few hundred sections.
+
+Compares the rasterized cell → section table used by `Board.can_accept`
+against the old linear `_pnpoly` scan over every section.
+
+    python -m bench.board_sections
+"""
+from __future__ import annotations
+import random, time
+
+from game.board import Board, SectionType
+from game.card  import Card
+from game.piece import Piece
+
+SIZE     = 256
+SECTIONS = 400
+PLACES   = 200_000
+
+
+def _board(seed: int = 1) -> Board:
+    rnd = random.Random(seed)
+    bd  = Board(SIZE, SIZE)
+    kinds = list(SectionType)
+    for i in range(SECTIONS):
+        x, y = rnd.randrange(SIZE - 16), rnd.randrange(SIZE - 16)
+        w, h = rnd.randint(2, 16), rnd.randint(2, 16)
+        if i % 2:        # rectangle
+            pts = [(x, y), (x + w, y), (x + w, y + h), (x, y + h)]
+        else:            # hexagon-ish polygon
+            pts = [(x + w // 4, y), (x + 3 * w // 4, y), (x + w, y + h // 2),
+                   (x + 3 * w // 4, y + h), (x + w // 4, y + h), (x, y + h // 2)]
+        bd.add_section(f"S{i}", rnd.choice(kinds), pts)
+    return bd
+
+
+def _legacy_section_for(bd: Board, gx: int, gy: int):
+    for s in bd.sections:
+        if bd._pnpoly(s.points, gx + .5, gy + .5):
+            return s
+
+
+def main():
+    rnd   = random.Random(2)
+    objs  = [Card.new("c"), Piece.new("p")]
+    moves = [(rnd.randrange(SIZE), rnd.randrange(SIZE), rnd.choice(objs))
+             for _ in range(PLACES)]
+
+    bd = _board()
+    t0 = time.perf_counter()
+    bd._section_for(0, 0)                       # build the table
+    build = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for x, y, obj in moves:
+        bd.place(x, y, obj)
+    indexed = time.perf_counter() - t0
+
+    legacy_n = PLACES // 100                    # the old path is very slow
+    bd = _board()
+    bd._section_for = lambda gx, gy: _legacy_section_for(bd, gx, gy)
+    t0 = time.perf_counter()
+    for x, y, obj in moves[:legacy_n]:
+        bd.place(x, y, obj)
+    legacy = time.perf_counter() - t0
+
+    print(f"board {SIZE}×{SIZE}, {SECTIONS} sections")
+    print(f"  table build      : {build * 1e3:8.1f} ms")
+    print(f"  indexed place()  : {PLACES / indexed:12,.0f} /s")
+    print(f"  legacy  place()  : {legacy_n / legacy:12,.0f} /s")
+    print(f"  speed-up         : {(PLACES / indexed) / (legacy_n / legacy):8.1f}×")
+
+
+if __name__ == "__main__":
+    main()
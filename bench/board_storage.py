@@ -0,0 +1,50 @@
+"""
+Memory and construction time of Board storage engines on large grids.
+
+    python -m bench.board_storage [size]
+"""
+from __future__ import annotations
+import random, sys, time, tracemalloc
+
+from game.board import Board
+from game.card  import Card
+
+PLACES = 100_000
+
+
+def _measure(storage: str, size: int):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    bd = Board(size, size, storage)
+    build = time.perf_counter() - t0
+    mem = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    rnd   = random.Random(3)
+    cards = [Card.new(f"c{i}") for i in range(64)]
+    moves = [(rnd.randrange(size), rnd.randrange(size), rnd.choice(cards))
+             for _ in range(PLACES)]
+    t0 = time.perf_counter()
+    for x, y, c in moves:
+        bd.place(x, y, c)
+    for x, y, _ in moves:
+        bd.remove_top(x, y)
+    churn = time.perf_counter() - t0
+    return build, mem, churn
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    print(f"board {size}×{size}")
+    base = None
+    for storage in ("dense", "compact"):
+        build, mem, churn = _measure(storage, size)
+        base = base or (build, mem)
+        print(f"  {storage:8}: build {build * 1e3:8.1f} ms "
+              f"({base[0] / build:5.1f}×)   "
+              f"memory {mem / 2**20:8.1f} MiB ({base[1] / mem:6.1f}×)   "
+              f"place+remove {2 * PLACES / churn:10,.0f} /s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Play-test startup for the synthetic game from `bench.lazy_open`: what
+`open_game` does (skim the file, then decode and build the first board,
+resolving its placements) against opening the compiled artifact and
+building its first board from the normalized data.  Also times the one-off compile
+and the staleness check a later launch pays.
+
+    python -m bench.compiled_open [MB]
+"""
+from __future__ import annotations
+import pathlib, sys, tempfile, time
+
+from bench.lazy_open import _write
+from game.compiled   import artifact_path, compile_game, open_compiled
+from game.game_file  import open_game
+
+
+def _lazy(path: pathlib.Path):
+    gf = open_game(path)
+    gf.manifest.cards, gf.manifest.boards           # side lists and tabs
+    gf.board(0).build(gf.lookup)
+
+
+def _compiled(path: pathlib.Path):
+    with open_compiled(path) as cg:
+        cg.manifest.cards, cg.manifest.boards
+        cg.built(0)
+
+
+def main():
+    mb = float(sys.argv[1]) if len(sys.argv) > 1 else 50
+    with tempfile.TemporaryDirectory() as tmp:
+        path = pathlib.Path(tmp) / "big.json"
+        _write(path, mb)
+        print(f"{path.stat().st_size / 1e6:.1f} MB")
+
+        t0 = time.perf_counter()
+        compile_game(path)
+        print(f"  compile  : {time.perf_counter() - t0:6.2f} s"
+              f"  ({artifact_path(path).stat().st_size / 1e6:.1f} MB artifact)")
+        for name, fn in (("lazy", _lazy), ("compiled", _compiled)):
+            best = float("inf")
+            for _ in range(3):
+                t0 = time.perf_counter()
+                fn(path)
+                best = min(best, time.perf_counter() - t0)
+            print(f"  {name:9}: {best * 1e3:6.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
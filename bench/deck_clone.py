@@ -0,0 +1,65 @@
+"""
+Clone / reset / shuffle cost of a 5,000-card deck.
+
+Compares the index-array `Deck` with the old layout that kept two full
+card lists per deck and copied both on every clone.
+
+    python -m bench.deck_clone
+"""
+from __future__ import annotations
+import random, time, tracemalloc
+
+from game.card import Card
+from game.deck import Deck
+
+CARDS = 5_000
+ROUNDS = 2_000
+
+
+class _ListDeck:
+    """The previous list-based Deck, kept here for comparison."""
+
+    def __init__(self, name, cards):
+        self.name, self._original, self.cards = name, cards[:], cards[:]
+
+    def shuffle(self):
+        random.shuffle(self.cards)
+
+    def reset(self):
+        self.cards = self._original[:]
+
+    def clone(self):
+        dup = _ListDeck(self.name, self._original)
+        dup.cards = self.cards[:]
+        return dup
+
+
+def _run(deck):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    kept = [deck.clone() for _ in range(ROUNDS)]        # placements on a board
+    clone = (time.perf_counter() - t0) / ROUNDS
+    mem = tracemalloc.get_traced_memory()[0] / ROUNDS
+    tracemalloc.stop()
+    t0 = time.perf_counter()
+    for d in kept[:ROUNDS // 10]:
+        d.reset()
+    reset = (time.perf_counter() - t0) / (ROUNDS // 10)
+    t0 = time.perf_counter()
+    for d in kept[:ROUNDS // 100]:
+        d.shuffle()
+    shuffle = (time.perf_counter() - t0) / (ROUNDS // 100)
+    return clone, mem, reset, shuffle
+
+
+def main():
+    cards = [Card.new(f"c{i}") for i in range(CARDS)]
+    print(f"deck of {CARDS:,} cards, {ROUNDS:,} clones kept alive")
+    for label, deck in (("index", Deck("d", cards)), ("lists", _ListDeck("d", cards))):
+        clone, mem, reset, shuffle = _run(deck)
+        print(f"  {label}: clone {clone * 1e6:8.2f} µs ({mem / 1024:7.1f} KiB each)   "
+              f"reset {reset * 1e6:8.2f} µs   shuffle {shuffle * 1e3:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Section lookups on a free board with a few hundred sections.
+
+Compares the bucketed `FreeBoard` section index with scanning every
+section dict with `point_in_polygon`, for pixel points and for whole
+object footprints (`can_accept`).
+
+    python -m bench.free_sections
+"""
+from __future__ import annotations
+import random, time
+
+from game.free_board import FreeBoard, UNIT
+from game.geometry   import point_in_polygon, polygons_overlap
+from game.board      import SectionType
+from game.card       import Card
+from game.token      import Token
+
+SIZE     = 64           # board units a side (SIZE * UNIT px)
+SECTIONS = 400
+LOOKUPS  = 20_000
+
+
+def _board(seed: int = 1) -> FreeBoard:
+    rnd = random.Random(seed)
+    secs = []
+    for i in range(SECTIONS):
+        x, y = rnd.randrange(SIZE - 8), rnd.randrange(SIZE - 8)
+        w, h = rnd.randint(1, 8), rnd.randint(1, 8)
+        secs.append(dict(name=f"S{i}", kind=rnd.choice(list(SectionType)).value,
+                         points=[(x, y), (x + w, y), (x + w, y + h), (x, y + h)],
+                         outline="#808080", fill=""))
+    return FreeBoard(SIZE * UNIT, SIZE * UNIT, [], secs)
+
+
+def _scan_at(fb: FreeBoard, px, py):
+    for s in fb.sections:
+        if point_in_polygon([(x * UNIT, y * UNIT) for x, y in s["points"]], px, py):
+            return s
+
+
+def _scan_under(fb: FreeBoard, obj, px, py):
+    poly = fb._shape_at(obj, px, py)[1]
+    return [s for s in fb.sections
+            if polygons_overlap(poly, [(x * UNIT, y * UNIT) for x, y in s["points"]])]
+
+
+def main():
+    rnd  = random.Random(2)
+    objs = [Card.new("c"), Token.new("t", points=[(0, 0), (40, 8), (20, 50)])]
+    pts  = [(rnd.randrange(SIZE * UNIT), rnd.randrange(SIZE * UNIT), rnd.choice(objs))
+            for _ in range(LOOKUPS)]
+    fb = _board()
+
+    t0 = time.perf_counter()
+    fb.section_at(0, 0)                         # build the index
+    build = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for x, y, _ in pts:
+        fb.section_at(x, y)
+    at = (time.perf_counter() - t0) / LOOKUPS
+    t0 = time.perf_counter()
+    for x, y, obj in pts:
+        fb.can_accept(obj, x, y)
+    under = (time.perf_counter() - t0) / LOOKUPS
+
+    n = LOOKUPS // 100                          # the scan is very slow
+    t0 = time.perf_counter()
+    for x, y, _ in pts[:n]:
+        _scan_at(fb, x, y)
+    scan_at = (time.perf_counter() - t0) / n
+    t0 = time.perf_counter()
+    for x, y, obj in pts[:n]:
+        _scan_under(fb, obj, x, y)
+    scan_under = (time.perf_counter() - t0) / n
+
+    print(f"free board {SIZE * UNIT}×{SIZE * UNIT} px, {SECTIONS} sections")
+    print(f"  index build        : {build * 1e3:8.2f} ms")
+    print(f"  section_at   index : {at * 1e6:8.2f} µs   scan {scan_at * 1e6:9.2f} µs"
+          f"  ({scan_at / at:6.1f}×)")
+    print(f"  can_accept   index : {under * 1e6:8.2f} µs   scan {scan_under * 1e6:9.2f} µs"
+          f"  ({scan_under / under:6.1f}×)")
+
+
+if __name__ == "__main__":
+    main()
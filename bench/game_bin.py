@@ -0,0 +1,47 @@
+"""
+Size and access times of the same synthetic game as `.json` and `.bgc`:
+opening (manifest), reading one card by name, reading one board, and
+reading everything.  The game is the one `bench.lazy_open` builds.
+
+    python -m bench.game_bin [MB]
+"""
+from __future__ import annotations
+import json, pathlib, sys, tempfile, time
+
+from bench.lazy_open import _write
+from game.game_bin   import BinGameFile, json_to_bin
+from game.game_file  import GameFile
+
+
+def _time(fn, reps: int = 5) -> float:
+    best = float("inf")
+    for _ in range(reps):
+        t0 = time.perf_counter(); fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    mb = float(sys.argv[1]) if len(sys.argv) > 1 else 50
+    with tempfile.TemporaryDirectory() as tmp:
+        js, bg = pathlib.Path(tmp) / "big.json", pathlib.Path(tmp) / "big.bgc"
+        _write(js, mb)
+        json_to_bin(js, bg)
+        card = GameFile(js).manifest.cards[-1]
+        print(f"json {js.stat().st_size / 1e6:6.1f} MB    bgc {bg.stat().st_size / 1e6:6.1f} MB")
+        for label, opener in (("json", GameFile), ("bgc", BinGameFile)):
+            rows = {
+                "open":     lambda: opener(js if label == "json" else bg).manifest,
+                "one card": lambda g=opener(js if label == "json" else bg):
+                                g._entity_raw("cards", card),
+                "one board": lambda g=opener(js if label == "json" else bg):
+                                g.board_raw(5),
+                "all":      lambda: json.loads(js.read_text()) if label == "json"
+                                else BinGameFile(bg).to_dict(),
+            }
+            print(f"  {label:4} " + "   ".join(f"{k} {_time(f) * 1e3:8.2f} ms"
+                                              for k, f in rows.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Cost of "Save Game" after changing one card and one board of the
+synthetic game from `bench.lazy_open`: rewriting the whole file (what
+the creator did before) against appending to the game's journal.
+
+    python -m bench.journal_save [MB]
+"""
+from __future__ import annotations
+import pathlib, sys, tempfile, time
+
+from bench.lazy_open import _write
+from game.card       import Card
+from game.game_file  import open_game, write_game
+from game.journal    import KINDS, Journal, journal_path
+
+
+def main():
+    mb = float(sys.argv[1]) if len(sys.argv) > 1 else 50
+    with tempfile.TemporaryDirectory() as tmp:
+        path = pathlib.Path(tmp) / "big.json"
+        _write(path, mb)
+        gf = open_game(path)
+        jr = Journal(path, gf)
+        ents = {k: list(getattr(gf, k)) for k in KINDS}
+        boards = list(range(gf.board_count))
+        print(f"{path.stat().st_size / 1e6:.1f} MB, {gf.manifest.counts}")
+
+        for rnd in range(3):
+            ents["cards"][rnd] = Card.new(f"edited {rnd}")
+            boards[0] = dict(gf.board_raw(0), name=f"board 0 v{rnd}")
+
+            t0 = time.perf_counter()
+            write_game({"name": gf.name,
+                        **{k: [o.to_dict() for o in ents[k]] for k in KINDS},
+                        "boards": [b if isinstance(b, dict) else gf.board_raw(b)
+                                   for b in boards]}, path.with_name("full.json"))
+            full = time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            n = jr.save(ents, boards)
+            inc = time.perf_counter() - t0
+            print(f"  full rewrite {full * 1e3:8.1f} ms   journal {inc * 1e3:7.1f} ms"
+                  f" ({n} entries, journal {journal_path(path).stat().st_size / 1e3:.0f} kB)")
+        jr.close()
+
+
+if __name__ == "__main__":
+    main()
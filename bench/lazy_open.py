@@ -0,0 +1,68 @@
+"""
+Time to first window for a synthetic ~50 MB game (tens of thousands of
+cards, a dozen placed boards).
+
+"eager" is what the play-test window did before: parse the whole file,
+build every entity and every board.  "lazy" is what it does now with
+`GameFile`: read the manifest (names for the side lists, board tabs)
+and build only the board on the first tab.  Tk itself is left out.
+
+    python -m bench.lazy_open [MB]
+"""
+from __future__ import annotations
+import json, pathlib, sys, tempfile, time
+
+from game.card      import Card
+from game.deck      import Deck
+from game.game_data import BoardSpec, GameData
+from game.game_file import GameFile
+
+BOARDS = 12
+SIZE   = 48
+
+
+def _write(path: pathlib.Path, mb: float):
+    n = int(mb * 1e6 / 470)
+    cards = [Card.new(f"card {i}", "lorem ipsum dolor sit amet " * 8,
+                      f"img/{i}.png", i % 7, i % 5) for i in range(n)]
+    decks = [Deck(f"deck {k}", cards[k::40]) for k in range(40)]
+    boards = []
+    for b in range(BOARDS):
+        placed = [{"type": "Card", "name": cards[(b * 997 + i) % n].name,
+                   "x": i % SIZE, "y": i // SIZE} for i in range(SIZE * SIZE)]
+        boards.append(BoardSpec(f"board {b}", SIZE, SIZE,
+                                [{"name": "Home", "kind": "Card",
+                                  "points": [[0, 0], [SIZE, 0], [SIZE, 8], [0, 8]]}],
+                                placed=placed))
+    gd = GameData("Big", cards, [], [], decks, boards, [])
+    path.write_text(json.dumps(gd.to_dict(), indent=2))
+
+
+def _eager(path: pathlib.Path):
+    gd = GameData.from_dict(json.loads(path.read_text()))
+    by_key = {(type(o).__name__, o.name): o for seq in (gd.cards, gd.decks) for o in seq}
+    for b in gd.boards:
+        b.build(lambda r: by_key.get((r["type"], r["name"])))
+
+
+def _lazy(path: pathlib.Path):
+    gf = GameFile(path)
+    gf.manifest.cards, gf.manifest.boards           # side lists and tabs
+    BoardSpec.from_dict(gf.board_raw(0)).build(gf.lookup)
+
+
+def main():
+    mb = float(sys.argv[1]) if len(sys.argv) > 1 else 50
+    with tempfile.TemporaryDirectory() as tmp:
+        path = pathlib.Path(tmp) / "big.json"
+        _write(path, mb)
+        gf = GameFile(path)
+        print(f"{path.stat().st_size / 1e6:.1f} MB, {gf.manifest.counts}")
+        for name, fn in (("eager", _eager), ("lazy", _lazy)):
+            t0 = time.perf_counter()
+            fn(path)
+            print(f"  {name:5}: {time.perf_counter() - t0:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+All legal placements of a 7-object hand on a 128×128 board with typed
+sections and a stack limit.
+
+Compares `game.moves.legal_mask` with the double loop over every cell
+calling `Board.can_accept` and `GameEngine.can_place`, for the stock
+rules and for a custom `can_place` that forces the per-cell fallback.
+
+    python -m bench.legal_moves
+"""
+from __future__ import annotations
+import random, time
+
+import numpy as np
+
+from game.board  import Board, SectionType
+from game.card   import Card
+from game.deck   import Deck
+from game.engine import GameEngine
+from game.moves  import legal_mask
+from game.piece  import Piece
+from game.player import Player
+from game.token  import Token
+
+SIZE     = 128
+SECTIONS = 120
+REPEAT   = 5
+
+
+class Capped(GameEngine):
+    stack_limit = 2
+
+
+class EvenRows(Capped):
+    def can_place(self, x, y, card):
+        return y % 2 == 0 and super().can_place(x, y, card)
+
+
+def _engine(cls) -> GameEngine:
+    rnd = random.Random(3)
+    bd = Board(SIZE, SIZE)
+    kinds = list(SectionType)
+    for i in range(SECTIONS):
+        x, y = rnd.randrange(SIZE - 12), rnd.randrange(SIZE - 12)
+        w, h = rnd.randint(2, 12), rnd.randint(2, 12)
+        bd.add_section(f"s{i}", kinds[i % len(kinds)],
+                       [(x, y), (x + w, y), (x + w, y + h), (x, y + h)])
+    filler = Card.new("filler")
+    for _ in range(SIZE * SIZE // 2):
+        bd.place(rnd.randrange(SIZE), rnd.randrange(SIZE), filler)
+    p = Player("P1")
+    p.hand = [Card.new("a"), Card.new("b"), Piece.new("p"), Piece.new("q"),
+              Token.new("t"), Card.new("c"), Token.new("u")]
+    return cls([p], Deck("d", []), bd)
+
+
+def _loop(eng: GameEngine, objs) -> np.ndarray:
+    bd = eng.board
+    out = np.zeros((len(objs), bd.HEIGHT, bd.WIDTH), dtype=bool)
+    for i, obj in enumerate(objs):
+        for y in range(bd.HEIGHT):
+            for x in range(bd.WIDTH):
+                out[i, y, x] = bd.can_accept(x, y, obj) and eng.can_place(x, y, obj)
+    return out
+
+
+def _time(fn, *args) -> float:
+    t0 = time.perf_counter()
+    for _ in range(REPEAT):
+        fn(*args)
+    return (time.perf_counter() - t0) / REPEAT
+
+
+def main():
+    print(f"board {SIZE}×{SIZE}, {SECTIONS} sections, hand of 7")
+    for cls in (Capped, EvenRows):
+        eng = _engine(cls)
+        hand = eng.current_player.hand
+        assert (legal_mask(eng, hand) == _loop(eng, hand)).all()
+        fast, slow = _time(legal_mask, eng, hand), _time(_loop, eng, hand)
+        print(f"  {cls.__name__:9} legal_mask {fast * 1e3:8.2f} ms   "
+              f"cell loop {slow * 1e3:8.2f} ms   ({slow / fast:5.1f}×)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+MCTS playouts per second from the opening position of a 2-player game
+(40-card deck, hands of 5) on 8×8 and 32×32 boards.
+
+    python -m bench.mcts_playouts [seconds]
+"""
+from __future__ import annotations
+import sys
+
+from game.board  import Board
+from game.card   import Card
+from game.deck   import Deck
+from game.engine import GameEngine
+from game.mcts   import MCTSPlayer
+from game.player import Player
+
+
+def main():
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else 2.0
+    cards = [Card.new(f"c{i}", attack=i % 5) for i in range(40)]
+    for size in (8, 32):
+        for storage in ("dense", "sparse"):
+            ai, other = MCTSPlayer("AI", budget, seed=1), Player("P2")
+            deck = Deck("Main", cards, seed=1); deck.shuffle()
+            eng = GameEngine([ai, other], deck, Board(size, size, storage))
+            deck.deal(eng.players, 5); ai.draw(deck)
+            res = ai.search(eng)
+            print(f"  {size:2}×{size:<2} {storage:6}: {res.playouts:6,} playouts  "
+                  f"{res.playouts_per_sec:8,.0f} / s")
+
+
+if __name__ == "__main__":
+    main()
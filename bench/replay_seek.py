@@ -0,0 +1,66 @@
+"""
+Seeking into a 10,000-turn logged session on a 32×32 board.
+
+Compares `ActionLog.seek` (nearest checkpoint + bounded replay) with
+replaying every action from turn 0, the only option without checkpoints.
+
+    python -m bench.replay_seek
+"""
+from __future__ import annotations
+import random, time
+
+from game.board  import Board
+from game.card   import Card
+from game.deck   import Deck
+from game.engine import GameEngine
+from game.player import Player
+from game.replay import ActionLog, apply
+
+TURNS = 10_000
+EVERY = 25
+SEEKS = 200
+
+
+def _session() -> ActionLog:
+    cards = [Card.new(f"c{i}") for i in range(60)]
+    deck  = Deck("Main", cards * (TURNS // len(cards) + 1))
+    eng = GameEngine([Player("A"), Player("B")], deck, Board(32, 32))
+    log, rnd = ActionLog(eng, EVERY), random.Random(2)
+    for t in range(TURNS):
+        if t % 500 == 0:
+            eng.shuffle(t)
+        eng.draw()
+        hand = eng.current_player.hand
+        if hand:
+            eng.play(rnd.randrange(32), rnd.randrange(32), rnd.choice(hand))
+        cells = list(eng.board.occupied())
+        if cells and rnd.random() < .3:
+            c = rnd.choice(cells)
+            eng.move(c.x, c.y, rnd.randrange(32), rnd.randrange(32))
+        eng.end_turn()
+    return log
+
+
+def main():
+    log = _session()
+    print(f"{TURNS:,} turns, {len(log.actions):,} actions, "
+          f"checkpoint every {EVERY} turns")
+    turns = random.Random(3).sample(range(TURNS), SEEKS)
+
+    t0 = time.perf_counter()
+    for t in turns:
+        log.seek(t)
+    print(f"  seek           : {(time.perf_counter() - t0) / SEEKS * 1e3:8.2f} ms")
+
+    t0 = time.perf_counter()
+    for t in turns[:10]:
+        eng = log.checkpoints[0][2].fork()
+        for act in log.actions:
+            if act.turn >= t:
+                break
+            apply(eng, act)
+    print(f"  replay from 0  : {(time.perf_counter() - t0) / 10 * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
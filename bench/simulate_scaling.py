@@ -0,0 +1,35 @@
+"""
+Games per second of the headless simulator for 1, 2, 4 … worker processes.
+
+Uses a synthetic game (60-card deck, 12×12 board with typed sections) so
+games last long enough for the pool overhead to matter.
+
+    python -m bench.simulate_scaling [games]
+"""
+from __future__ import annotations
+import sys
+
+from game.card      import Card
+from game.deck      import Deck
+from game.game_data import BoardSpec, GameData
+from game.simulate  import run, scaling, scaling_report
+
+
+def _game() -> dict:
+    cards = [Card.new(f"c{i}", attack=i % 5, defense=i % 3) for i in range(60)]
+    sections = [dict(name="Home", kind="Card", points=[(0, 0), (12, 0), (12, 3), (0, 3)]),
+                dict(name="Wild", kind="Piece", points=[(0, 9), (12, 9), (12, 12), (0, 12)])]
+    return GameData("Bench", cards, [], [], [Deck("Main", cards)],
+                    [BoardSpec("Main", 12, 12, sections)], []).to_dict()
+
+
+def main():
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    raw = _game()
+    *_, st = run(raw, games // 4, workers=0, players=4)
+    print(f"in-process: {st.summary()}\n")
+    print(scaling_report(scaling(raw, games, players=4)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Debounced background saving.
+
+    >>> saver = Autosaver(take_snapshot, write_batch, quiet=1.5)
+    >>> saver.mark_dirty()           # after every edit
+    >>> saver.poll()                 # from the UI loop, e.g. every 200 ms
+    >>> saver.stats                  # latency, queue depth, …
+
+Once the game has been dirty and then left alone for `quiet` seconds,
+`poll` takes a snapshot on the calling (UI) thread.  That is meant to be
+cheap: list copies and plain dicts that later edits can't reach.  It
+hands the snapshot to a single worker thread, which does the slow part:
+diffing, serializing, writing.  Snapshots that pile up while the worker
+is busy go to `write` together, oldest first, so it can fold them into
+one write.  `write` is responsible for making each write atomic (the
+creator's goes through `Journal`: fsynced appends, and full rewrites via
+a temp file and a rename).
+"""
+from __future__ import annotations
+import threading, time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, List, Optional, Tuple
+
+
+@dataclass
+class AutosaveStats:
+    saves:        int = 0            # batches written
+    snapshots:    int = 0            # snapshots taken
+    queue_depth:  int = 0            # snapshots waiting for the worker
+    max_queue:    int = 0
+    busy:         bool = False       # worker writing right now
+    last_latency: float = 0.0        # s, oldest snapshot in batch → written
+    max_latency:  float = 0.0
+    total_latency: float = 0.0
+    last_saved:   Optional[float] = None    # time.time() of the last write
+    errors:       int = 0
+    last_error:   Optional[BaseException] = None
+
+    @property
+    def mean_latency(self) -> float:
+        return self.total_latency / self.saves if self.saves else 0.0
+
+    def summary(self) -> str:
+        if self.last_error is not None:
+            return f"Autosave failed: {self.last_error}"
+        if self.busy or self.queue_depth:
+            return f"Saving … (queue {self.queue_depth})"
+        if self.last_saved is None:
+            return ""
+        return (f"Saved {time.strftime('%H:%M:%S', time.localtime(self.last_saved))}"
+                f" · {self.last_latency * 1e3:,.0f} ms")
+
+
+class Autosaver:
+    """
+    Calls `snapshot()` on the caller's thread and `write(snapshots)` on
+    a worker thread, `quiet` seconds after the last `mark_dirty`.
+    """
+
+    def __init__(self, snapshot: Callable[[], Any],
+                 write: Callable[[List[Any]], Any], quiet: float = 1.5,
+                 clock: Callable[[], float] = time.monotonic):
+        self._snapshot, self._write = snapshot, write
+        self.quiet, self._clock = quiet, clock
+        self.dirty = False
+        self._dirty_at = 0.0
+        self._queue: Deque[Tuple[float, Any]] = deque()
+        self._cv = threading.Condition()
+        self._closing = False
+        self._stats = AutosaveStats()
+        self._worker = threading.Thread(target=self._run, name="autosave", daemon=True)
+        self._worker.start()
+
+    # ---------- UI thread -------------------------------------------- #
+    def mark_dirty(self):
+        self.dirty, self._dirty_at = True, self._clock()
+
+    def poll(self) -> bool:
+        """Save if the game has been quiet long enough; True if it did."""
+        if self.dirty and self._clock() - self._dirty_at >= self.quiet:
+            self.save_now()
+            return True
+        return False
+
+    def save_now(self):
+        """Snapshot now and queue it, without waiting for the write."""
+        self.dirty = False
+        snap = self._snapshot()
+        with self._cv:
+            self._queue.append((self._clock(), snap))
+            st = self._stats
+            st.snapshots += 1
+            st.queue_depth = len(self._queue)
+            st.max_queue = max(st.max_queue, st.queue_depth)
+            self._cv.notify()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Save anything unsaved and wait for the worker to catch up."""
+        if self.dirty:
+            self.save_now()
+        with self._cv:
+            return self._cv.wait_for(
+                lambda: not self._queue and not self._stats.busy, timeout)
+
+    def close(self, timeout: Optional[float] = None):
+        self.flush(timeout)
+        with self._cv:
+            self._closing = True
+            self._cv.notify()
+        self._worker.join(timeout)
+
+    @property
+    def stats(self) -> AutosaveStats:
+        with self._cv:
+            return AutosaveStats(**vars(self._stats))
+
+    # ---------- worker ----------------------------------------------- #
+    def _run(self):
+        while True:
+            with self._cv:
+                self._cv.wait_for(lambda: self._queue or self._closing)
+                if not self._queue:
+                    return
+                batch = list(self._queue)
+                self._queue.clear()
+                self._stats.queue_depth, self._stats.busy = 0, True
+            err = None
+            try:
+                self._write([snap for _, snap in batch])
+            except Exception as e:          # keep saving later snapshots
+                err = e
+            with self._cv:
+                st = self._stats
+                st.busy = False
+                if err is None:
+                    lat = self._clock() - batch[0][0]
+                    st.saves += 1
+                    st.last_latency, st.total_latency = lat, st.total_latency + lat
+                    st.max_latency = max(st.max_latency, lat)
+                    st.last_saved = time.time()
+                    st.last_error = None
+                else:                       # retry after the next quiet spell
+                    st.errors += 1
+                    st.last_error = err
+                    self.dirty, self._dirty_at = True, self._clock()
+                self._cv.notify_all()
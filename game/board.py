@@ -1,12 +1,17 @@
 from __future__ import annotations
+from array import array
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from math import ceil
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from enum import Enum
 
 from .card  import Card
 from .piece import Piece
 from .token import Token
 from .deck  import Deck
+from .board_store import Cell, STORES
+from .zobrist import placement_key
+from .geometry import point_in_polygon
 
 
 Point = Tuple[int, int] 
@@ -29,61 +34,147 @@ class Section:
     outline: str = "#808080"
     fill:    str = ""            # empty = transparent
 
-# ---------- cell holds **stack** ------------------------------------- #
+
+# ---------- batch results -------------------------------------------- #
 @dataclass
-class Cell:
+class Rejection:
+    index: int                   # position in the submitted batch
     x: int
     y: int
-    stack: List[Card | Piece | Token | Deck]
+    reason: str
+
+
+@dataclass
+class BatchResult:
+    applied:  List[Card | Piece | Token | Deck]     # placed / removed objects
+    rejected: List[Rejection]
+
+    @property
+    def ok(self) -> bool:
+        return not self.rejected
+
+
+# ---------- reverse index: object → cells ---------------------------- #
+class _PlacementIndex:
+    """Object / type / name → {(x, y): copies} maps, kept in step with the
+    stacks so lookups cost the size of the answer, not of the board."""
+
+    def __init__(self):
+        self.by_id:   Dict[int, Dict[Point, int]] = {}
+        self.by_type: Dict[type, Dict[Point, int]] = {}
+        self.by_name: Dict[str, Dict[Point, int]] = {}
+
+    @staticmethod
+    def _bump(table: dict, key, pos: Point, d: int):
+        cells = table.setdefault(key, {})
+        n = cells.get(pos, 0) + d
+        if n:
+            cells[pos] = n
+        else:
+            del cells[pos]
+            if not cells:
+                del table[key]
+
+    def add(self, x: int, y: int, obj, d: int = 1):
+        pos = (x, y)
+        self._bump(self.by_id,   id(obj),   pos, d)
+        self._bump(self.by_type, type(obj), pos, d)
+        self._bump(self.by_name, getattr(obj, "name", None), pos, d)
 
-    def top(self):
-        return self.stack[-1] if self.stack else None
+    def discard(self, x: int, y: int, obj):
+        self.add(x, y, obj, -1)
 
 
 # ---------- board ---------------------------------------------------- #
 class Board:
-    """Rectangular grid where each cell is an **ordered stack**."""
+    """Rectangular grid where each cell is an **ordered stack**.
 
-    def __init__(self, width=8, height=8):
+    `storage` picks the cell layout: "dense" keeps a `Cell` per square,
+    "compact" packs stacks into flat int arrays for very large boards and
+    "sparse" stores only occupied cells for huge, mostly empty ones.
+    """
+
+    def __init__(self, width=8, height=8, storage: str = "dense"):
+        if storage not in STORES:
+            raise ValueError(f"unknown board storage {storage!r}")
+        self.storage = storage
         self.sections: List[Section] = []
         self.resize(width, height)
 
     # ------------------------------------------------------------- #
     def resize(self, w: int, h: int):
         self.WIDTH, self.HEIGHT = w, h
-        self.grid: List[List[Cell]] = [
-            [Cell(x, y, []) for x in range(w)] for y in range(h)
-        ]
+        self._store = STORES[self.storage](w, h)
+        self._index = _PlacementIndex()
+        self.state_hash = 0                 # Zobrist hash of every stack
         self.sections.clear()
+        self.invalidate_sections()
 
     # ------------------------------------------------------------- #
     def add_section(self, name, kind: SectionType,
                     points: List[Point],
                     outline="#808080", fill=""):
         self.sections.append(Section(name, kind, points, outline, fill))
+        self.invalidate_sections()
+
+    def invalidate_sections(self):
+        """Drop the cell → section table; call after editing `sections`."""
+        self._sec_table: array | None = None
+        self._sec_count = len(self.sections)
+
+    _pnpoly = staticmethod(point_in_polygon)
+
+    def _rasterize_sections(self) -> array:
+        """
+        Build a flat WIDTH×HEIGHT table holding the index of the first
+        section whose polygon contains each cell centre (-1 = none).
+        Each polygon is scan-converted row by row with the same crossing
+        rule as `_pnpoly`, so lookups match the old per-call test.
+        """
+        w, h = self.WIDTH, self.HEIGHT
+        table = array("i", [-1]) * (w * h)
+        # walk backwards so the first matching section wins
+        for idx in range(len(self.sections) - 1, -1, -1):
+            pts = self.sections[idx].points
+            if not pts:
+                continue
+            ys = [py for _, py in pts]
+            y0 = max(0, ceil(min(ys) - .5))
+            y1 = min(h, ceil(max(ys) - .5))
+            edges = list(zip(pts, pts[1:] + pts[:1]))
+            for gy in range(y0, y1):
+                y = gy + .5
+                xs = sorted((xj - xi) * (y - yi) / (yj - yi + 1e-9) + xi
+                            for (xi, yi), (xj, yj) in edges
+                            if (yi > y) != (yj > y))
+                row = gy * w
+                for a, b in zip(xs[::2], xs[1::2]):
+                    gx0 = max(0, ceil(a - .5))
+                    gx1 = min(w, ceil(b - .5))
+                    if gx1 > gx0:
+                        table[row + gx0:row + gx1] = array("i", [idx]) * (gx1 - gx0)
+        return table
+
+    def section_index(self) -> array:
+        """Flat row-major table of the section index per cell (-1 = none);
+        read-only, rebuilt lazily after `invalidate_sections`."""
+        if self._sec_table is None or self._sec_count != len(self.sections):
+            self._sec_table = self._rasterize_sections()
+            self._sec_count = len(self.sections)
+        return self._sec_table
 
-    @staticmethod
-    def _pnpoly(pts: List[Point], x: int, y: int) -> bool:
-        inside = False
-        n = len(pts)
-        for i, (xi, yi) in enumerate(pts):
-            xj, yj = pts[(i + 1) % n]
-            if ((yi > y) != (yj > y)) and \
-               (x < (xj - xi) * (y - yi) / (yj - yi + 1e-9) + xi):
-                inside = not inside
-        return inside
-
-    # replace _section_for with:
     def _section_for(self, gx, gy):
-        for s in self.sections:
-            if self._pnpoly(s.points, gx + .5, gy + .5):
-                return s
+        idx = self.section_index()[gy * self.WIDTH + gx]
+        return self.sections[idx] if idx >= 0 else None
 
     # ------------------------------------------------------------- #
     def can_accept(self, x: int, y: int, obj) -> bool:
         if not (0 <= x < self.WIDTH and 0 <= y < self.HEIGHT):
             return False
-        sec = self._section_for(x, y)
+        return self._kind_accepts(self._section_for(x, y), obj)
+
+    @staticmethod
+    def _kind_accepts(sec: Section | None, obj) -> bool:
         if not sec or sec.kind is SectionType.ANY:
             return True
         if sec.kind is SectionType.CARD  and isinstance(obj, Card ): return True
@@ -92,18 +183,150 @@ class Board:
         if sec.kind is SectionType.DECK  and isinstance(obj, Deck ): return True
         return False
 
+    # ------------------------------------------------------------- #
+    @property
+    def grid(self) -> List[List[Cell]]:
+        """Rows of cells; read-only (built on access) unless storage is dense."""
+        return self._store.grid
+
+    def stack(self, x: int, y: int) -> List[Card | Piece | Token | Deck]:
+        """Objects on (x, y), bottom first – treat as read-only."""
+        return self._store.stack(x, y)
+
+    def occupied(self) -> Iterator[Cell]:
+        """Yield every non-empty cell (sparse boards skip empty area)."""
+        return self._store.occupied()
+
+    def depths(self) -> array:
+        """Flat row-major table of stack heights, one int per cell."""
+        return self._store.depths()
+
+    # ------------------------------------------------------------- #
+    @property
+    def _placements(self) -> _PlacementIndex:
+        if self._index is None:             # forks rebuild theirs on demand
+            self._index = _PlacementIndex()
+            for cell in self.occupied():
+                for obj in cell.stack:
+                    self._index.add(cell.x, cell.y, obj)
+        return self._index
+
+    def positions_of(self, obj) -> List[Point]:
+        """Cells whose stack holds this very object (identity, not equality)."""
+        return list(self._placements.by_id.get(id(obj), ()))
+
+    def cells_of_type(self, cls: type) -> List[Point]:
+        """Cells holding at least one instance of `cls` (or a subclass)."""
+        out: Dict[Point, None] = {}
+        for t, cells in self._placements.by_type.items():
+            if issubclass(t, cls):
+                out.update(dict.fromkeys(cells))
+        return list(out)
+
+    def cells_named(self, name: str) -> List[Point]:
+        """Cells holding at least one object called `name`."""
+        return list(self._placements.by_name.get(name, ()))
+
     # ------------------------------------------------------------- #
     def place(self, x: int, y: int, obj) -> bool:
         if self.can_accept(x, y, obj):
-            self.grid[y][x].stack.append(obj)
+            self.state_hash ^= placement_key(obj, x, y, self._store.depth(x, y))
+            self._store.push(x, y, obj)
+            if self._index is not None:
+                self._index.add(x, y, obj)
             return True
         return False
 
     def remove_top(self, x: int, y: int):
-        st = self.grid[y][x].stack
-        return st.pop() if st else None
+        obj = self._store.pop(x, y)
+        if obj is None:
+            return None
+        self.state_hash ^= placement_key(obj, x, y, self._store.depth(x, y))
+        if self._index is not None:
+            self._index.discard(x, y, obj)
+        return obj
 
     def clear_cell(self, x: int, y: int):
-        st = self.grid[y][x].stack
-        obj, self.grid[y][x].stack = st[:], []
-        return obj
+        objs = self._store.clear(x, y)
+        for d, obj in enumerate(objs):
+            self.state_hash ^= placement_key(obj, x, y, d)
+        if self._index is not None:
+            for obj in objs:
+                self._index.discard(x, y, obj)
+        return objs
+
+    # ------------------------------------------------------------- #
+    def place_many(self, items: Iterable[Tuple[int, int, object]]) -> BatchResult:
+        """
+        Validate every (x, y, obj) first, then place all of them – or none
+        if anything was rejected.  Objects stack in batch order.
+        """
+        items = list(items)
+        rejected = []
+        for i, (x, y, obj) in enumerate(items):
+            if not (0 <= x < self.WIDTH and 0 <= y < self.HEIGHT):
+                rejected.append(Rejection(i, x, y, "outside the board"))
+                continue
+            sec = self._section_for(x, y)
+            if not self._kind_accepts(sec, obj):
+                rejected.append(Rejection(i, x, y,
+                                f"section '{sec.name}' only takes {sec.kind.value}"))
+        if rejected:
+            return BatchResult([], rejected)
+
+        for x, y, obj in items:
+            self.state_hash ^= placement_key(obj, x, y, self._store.depth(x, y))
+            self._store.push(x, y, obj)
+            if self._index is not None:
+                self._index.add(x, y, obj)
+        return BatchResult([obj for _, _, obj in items], [])
+
+    def remove_many(self, cells: Iterable[Point]) -> BatchResult:
+        """Pop the top of each (x, y) in order – all or nothing.  A cell may
+        repeat to pop several levels; `applied` lists the removed objects."""
+        cells = list(cells)
+        rejected, want = [], {}
+        for i, (x, y) in enumerate(cells):
+            if not (0 <= x < self.WIDTH and 0 <= y < self.HEIGHT):
+                rejected.append(Rejection(i, x, y, "outside the board"))
+                continue
+            want[x, y] = want.get((x, y), 0) + 1
+            if want[x, y] > len(self._store.stack(x, y)):
+                rejected.append(Rejection(i, x, y, "nothing left to remove"))
+        if rejected:
+            return BatchResult([], rejected)
+        return BatchResult([self.remove_top(x, y) for x, y in cells], [])
+
+    # ------------------------------------------------------------- #
+    def recompute_hash(self) -> int:
+        """Full O(pieces) hash – should always equal `state_hash`."""
+        h = 0
+        for cell in self.occupied():
+            for d, obj in enumerate(cell.stack):
+                h ^= placement_key(obj, cell.x, cell.y, d)
+        return h
+
+    # ------------------------------------------------------------- #
+    def fork(self) -> "Board":
+        """
+        Copy-on-write clone for look-ahead: both boards share cell storage
+        until one of them writes, which copies only the touched row/stack.
+        """
+        dup = Board.__new__(Board)
+        dup.__dict__.update(self.__dict__)
+        dup.sections = self.sections[:]
+        dup._store = self._store.fork()
+        dup._index = None
+        return dup
+
+    def __getstate__(self):
+        # the placement index is keyed by id(); rebuilt on demand after loading
+        return {**self.__dict__, "_index": None}
+
+    def snapshot(self) -> "Board":
+        """Frozen fork to hand back to `restore` later."""
+        return self.fork()
+
+    def restore(self, snap: "Board"):
+        """Roll this board back to `snap`; the snapshot stays reusable."""
+        self.__dict__.update(snap.fork().__dict__)
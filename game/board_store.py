@@ -0,0 +1,326 @@
+from __future__ import annotations
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Tuple
+
+
+# ---------- cell holds **stack** ------------------------------------- #
+@dataclass
+class Cell:
+    x: int
+    y: int
+    stack: List[Any]
+
+    def top(self):
+        return self.stack[-1] if self.stack else None
+
+
+# ---------- dense: one Cell object per square ------------------------ #
+class DenseStore:
+    """Original layout – a list of rows of `Cell`s, each with its own list.
+    After `fork()` rows are shared and copied on first write."""
+
+    def __init__(self, w: int, h: int):
+        self.grid: List[List[Cell]] = [
+            [Cell(x, y, []) for x in range(w)] for y in range(h)
+        ]
+        self._owned = bytearray(b"\x01") * h        # row is private to us
+
+    def _own(self, y: int):
+        if not self._owned[y]:
+            self.grid[y] = [Cell(c.x, c.y, c.stack[:]) for c in self.grid[y]]
+            self._owned[y] = 1
+
+    def fork(self) -> "DenseStore":
+        dup = DenseStore.__new__(DenseStore)
+        dup.grid = self.grid[:]
+        dup._owned = bytearray(len(self.grid))
+        self._owned = bytearray(len(self.grid))
+        return dup
+
+    def stack(self, x: int, y: int) -> List[Any]:
+        return self.grid[y][x].stack
+
+    def depth(self, x: int, y: int) -> int:
+        return len(self.grid[y][x].stack)
+
+    def push(self, x: int, y: int, obj):
+        self._own(y)
+        self.grid[y][x].stack.append(obj)
+
+    def pop(self, x: int, y: int):
+        if not self.grid[y][x].stack:
+            return None
+        self._own(y)
+        return self.grid[y][x].stack.pop()
+
+    def clear(self, x: int, y: int) -> List[Any]:
+        self._own(y)
+        st = self.grid[y][x].stack
+        obj, self.grid[y][x].stack = st[:], []
+        return obj
+
+    def occupied(self) -> Iterator[Cell]:
+        for row in self.grid:
+            for cell in row:
+                if cell.stack:
+                    yield cell
+
+    def depths(self) -> array:
+        return array("i", [len(c.stack) for row in self.grid for c in row])
+
+
+# ---------- compact: flat slot arrays + overflow table --------------- #
+class CompactStore:
+    """
+    Flat `array('i')` with one object slot per cell (-1 = empty); objects
+    stacked above the bottom one live in a small overflow dict.  Objects
+    are interned in a ref-counted table so the grid holds plain ints.
+    """
+
+    def __init__(self, w: int, h: int):
+        self.w, self.h = w, h
+        self._cells = array("i", [-1]) * (w * h)     # bottom object slot
+        self._deep: Dict[int, List[int]] = {}        # cell → slots above
+        self._objs: List[Any] = []                   # slot → object
+        self._refs: List[int] = []                   # slot → ref-count
+        self._slot: Dict[int, int] = {}              # id(obj) → slot
+        self._free: List[int] = []
+        self._mine: set | None = None                # deep lists we own (None = all)
+
+    def fork(self) -> "CompactStore":
+        """Flat arrays are memcpy'd; overflow lists are shared until written."""
+        dup = CompactStore.__new__(CompactStore)
+        dup.w, dup.h = self.w, self.h
+        dup._cells = self._cells[:]
+        dup._deep  = dict(self._deep)
+        dup._objs, dup._refs = self._objs[:], self._refs[:]
+        dup._slot, dup._free = dict(self._slot), self._free[:]
+        dup._mine = set()
+        self._mine = set()
+        return dup
+
+    def __getstate__(self):
+        # `_slot` is keyed by id(), so it is rebuilt from `_objs` on load
+        return {k: v for k, v in self.__dict__.items() if k != "_slot"}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._slot = {id(o): s for s, o in enumerate(self._objs) if o is not None}
+
+    def _deep_list(self, i: int) -> List[int]:
+        deep = self._deep.get(i)
+        if deep is None:
+            deep = self._deep[i] = []
+        elif self._mine is not None and i not in self._mine:
+            deep = self._deep[i] = deep[:]
+        if self._mine is not None:
+            self._mine.add(i)
+        return deep
+
+    # -- object table -------------------------------------------------- #
+    def _intern(self, obj) -> int:
+        s = self._slot.get(id(obj))
+        if s is None:
+            if self._free:
+                s = self._free.pop()
+                self._objs[s], self._refs[s] = obj, 0
+            else:
+                s = len(self._objs)
+                self._objs.append(obj); self._refs.append(0)
+            self._slot[id(obj)] = s
+        self._refs[s] += 1
+        return s
+
+    def _release(self, s: int):
+        obj = self._objs[s]
+        self._refs[s] -= 1
+        if not self._refs[s]:
+            del self._slot[id(obj)]
+            self._objs[s] = None
+            self._free.append(s)
+        return obj
+
+    # -- stack API ----------------------------------------------------- #
+    def stack(self, x: int, y: int) -> List[Any]:
+        i = y * self.w + x
+        b = self._cells[i]
+        if b < 0:
+            return []
+        return [self._objs[b]] + [self._objs[s] for s in self._deep.get(i, ())]
+
+    def depth(self, x: int, y: int) -> int:
+        i = y * self.w + x
+        return 0 if self._cells[i] < 0 else 1 + len(self._deep.get(i, ()))
+
+    def push(self, x: int, y: int, obj):
+        i, s = y * self.w + x, self._intern(obj)
+        if self._cells[i] < 0:
+            self._cells[i] = s
+        else:
+            self._deep_list(i).append(s)
+
+    def pop(self, x: int, y: int):
+        i = y * self.w + x
+        if self._cells[i] < 0:
+            return None
+        if i in self._deep:
+            deep = self._deep_list(i)
+            s = deep.pop()
+            if not deep:
+                del self._deep[i]
+        else:
+            s, self._cells[i] = self._cells[i], -1
+        return self._release(s)
+
+    def clear(self, x: int, y: int) -> List[Any]:
+        i = y * self.w + x
+        if self._cells[i] < 0:
+            return []
+        slots = [self._cells[i]] + self._deep.pop(i, [])
+        self._cells[i] = -1
+        return [self._release(s) for s in slots]
+
+    def occupied(self) -> Iterator[Cell]:
+        w = self.w
+        for i, b in enumerate(self._cells):
+            if b >= 0:
+                y, x = divmod(i, w)
+                yield Cell(x, y, self.stack(x, y))
+
+    def depths(self) -> array:
+        out = array("i", [b >= 0 for b in self._cells])
+        for i, deep in self._deep.items():
+            out[i] += len(deep)
+        return out
+
+    @property
+    def grid(self) -> "_GridView":
+        return _GridView(self, self.w, self.h)
+
+
+# ---------- sparse: only occupied cells exist ------------------------ #
+class SparseStore:
+    """Coordinate-keyed dict of non-empty stacks – cost scales with pieces,
+    not board area."""
+
+    def __init__(self, w: int, h: int):
+        self.w, self.h = w, h
+        self._cells: Dict[Tuple[int, int], List[Any]] = {}
+        self._mine: set | None = None                # stacks we own (None = all)
+
+    def fork(self) -> "SparseStore":
+        """Copies the (small) key map; stacks are shared until written."""
+        dup = SparseStore.__new__(SparseStore)
+        dup.w, dup.h = self.w, self.h
+        dup._cells = dict(self._cells)
+        dup._mine = set()
+        self._mine = set()
+        return dup
+
+    def _own(self, pos: Tuple[int, int]) -> List[Any] | None:
+        st = self._cells.get(pos)
+        if st is not None and self._mine is not None and pos not in self._mine:
+            st = self._cells[pos] = st[:]
+            self._mine.add(pos)
+        return st
+
+    def stack(self, x: int, y: int) -> List[Any]:
+        return self._cells.get((x, y)) or []
+
+    def depth(self, x: int, y: int) -> int:
+        return len(self._cells.get((x, y), ()))
+
+    def push(self, x: int, y: int, obj):
+        st = self._own((x, y))
+        if st is None:
+            self._cells[(x, y)] = [obj]
+            if self._mine is not None:
+                self._mine.add((x, y))
+        else:
+            st.append(obj)
+
+    def pop(self, x: int, y: int):
+        if not self._cells.get((x, y)):
+            return None
+        st = self._own((x, y))
+        obj = st.pop()
+        if not st:
+            del self._cells[(x, y)]
+        return obj
+
+    def clear(self, x: int, y: int) -> List[Any]:
+        if self._mine is not None:
+            self._mine.discard((x, y))
+        return self._cells.pop((x, y), [])[:]
+
+    def occupied(self) -> Iterator[Cell]:
+        for (x, y), st in self._cells.items():
+            yield Cell(x, y, st[:])
+
+    def depths(self) -> array:
+        out = array("i", [0]) * (self.w * self.h)
+        for (x, y), st in self._cells.items():
+            out[y * self.w + x] = len(st)
+        return out
+
+    @property
+    def grid(self) -> "_GridView":
+        return _GridView(self, self.w, self.h)
+
+
+# ---------- read-only grid facade for non-dense stores --------------- #
+class _GridView:
+    """`board.grid[y][x]` for stores that keep no Cell objects.
+
+    Cells are built on access, so mutate through `Board.place` /
+    `remove_top` / `clear_cell`, never through `.stack`.
+    """
+
+    def __init__(self, store, w: int, h: int):
+        self._store, self._w, self._h = store, w, h
+
+    def __len__(self):
+        return self._h
+
+    def __getitem__(self, y: int) -> "_RowView":
+        if not -self._h <= y < self._h:
+            raise IndexError(y)
+        return _RowView(self._store, y % self._h, self._w)
+
+    def __iter__(self):
+        return (_RowView(self._store, y, self._w) for y in range(self._h))
+
+
+class _RowView:
+    def __init__(self, store, y: int, w: int):
+        self._store, self._y, self._w = store, y, w
+
+    def __len__(self):
+        return self._w
+
+    def __getitem__(self, x: int) -> Cell:
+        if not -self._w <= x < self._w:
+            raise IndexError(x)
+        x %= self._w
+        return Cell(x, self._y, self._store.stack(x, self._y))
+
+    def __iter__(self):
+        return (self[x] for x in range(self._w))
+
+
+STORES = {"dense": DenseStore, "compact": CompactStore, "sparse": SparseStore}
+
+BIG = 250_000           # cells; below this a Cell per square is cheap enough
+
+
+def pick_storage(width: int, height: int, filled: int = 0) -> str:
+    """
+    Storage for a `width`×`height` board with `filled` occupied cells:
+    "dense" while small, then "compact" if at least half the cells are
+    occupied and "sparse" otherwise.
+    """
+    cells = width * height
+    if cells < BIG:
+        return "dense"
+    return "compact" if 2 * filled >= cells else "sparse"
@@ -0,0 +1,245 @@
+"""
+One canonical schema for saved games, and a compiled artifact that lets
+play-test start without re-parsing anything.
+
+Saved games have grown several layouts.  Grid boards can use `w`/`h` or
+`width`/`height`, with or without "mode".  Sections can be `x0..y1`
+rectangles or polygons.  Free and tile-grid boards are raw dicts.
+`normalize` maps any of them to one layout (`SCHEMA`).  `migrate`
+rewrites a game file in that layout once, folding its journal in:
+
+    python -m game.compiled --migrate "data/games/Bird of Prey.json"
+
+`compile_game` goes further.  It writes `.compiled/<game file>.bgc`
+beside the game: the normalized game in the binary format, with its
+journal folded in, plus the images each board shows and every image
+the game uses.  `CompiledGame.built` makes a board ready to play from
+that data: a `Board` with sections rasterized and placements resolved,
+a `FreeBoard`, or a tile grid's (tile, col, row) list.  The artifact
+is keyed by the game file's (and journal's) mtime and size, falling
+back to a SHA-256 of their contents, so `open_compiled` only rebuilds
+it when the game actually changed.
+
+The artifact holds data only, never pickles: it sits in the games
+folder, so it can arrive along with a shared game, and reading it must
+be as safe as reading the game itself.
+"""
+from __future__ import annotations
+import argparse, hashlib, os, pathlib, secrets, tempfile
+from typing import Any, Dict, List, Optional, Tuple
+
+from .free_board import FreeBoard
+from .game_bin   import BinGameFile, write_bin
+from .game_data  import BoardSpec, GameData, board_from_dict, normalize_board
+from .game_file  import _KIND_OF, open_game, write_game
+from .journal    import KINDS, _next_path, journal_path
+
+SCHEMA    = 1            # canonical saved-game layout
+VERSION   = 2            # compiled artifact layout; bump to drop old caches
+CACHE_DIR = ".compiled"
+
+
+# ---------- canonical schema ------------------------------------------- #
+def normalize(d: Dict[str, Any]) -> Dict[str, Any]:
+    """A saved game (`GameData.to_dict()` form, any vintage) in `SCHEMA`."""
+    gd = GameData.from_dict(d)
+    boards = d.get("boards") or [BoardSpec("Main", 8, 8, []).to_dict()]
+    return {"name": gd.name, "schema": SCHEMA,
+            **{k: [o.to_dict() for o in getattr(gd, k)] for k in KINDS},
+            "boards": [normalize_board(b) for b in boards]}
+
+
+def migrate(path: str | pathlib.Path) -> bool:
+    """
+    Rewrite the game at `path` in the canonical schema, journal folded
+    in.  Returns False (and writes nothing) if it already was canonical.
+    """
+    path = pathlib.Path(path)
+    game = open_game(path)
+    d = {**game.to_dict(), "schema": game.raw("schema")}
+    if hasattr(game, "close"):
+        game.close()
+    norm = normalize(d)
+    journals = [p for p in (journal_path(path), _next_path(path)) if p.exists()]
+    if not journals and all(d.get(k) == v for k, v in norm.items()):
+        return False
+    norm["rev"] = secrets.token_hex(8)      # retires the journal even if unlink fails
+    write_game(norm, path)
+    for p in journals:
+        p.unlink(missing_ok=True)
+    return True
+
+
+# ---------- source key ---------------------------------------------------- #
+def _sources(path: pathlib.Path) -> List[pathlib.Path]:
+    return [path, journal_path(path), _next_path(path)]
+
+
+def _stat(path: pathlib.Path) -> List[Optional[List[int]]]:
+    out = []
+    for p in _sources(path):
+        try:
+            st = p.stat()
+            out.append([st.st_mtime_ns, st.st_size])
+        except FileNotFoundError:
+            out.append(None)
+    return out
+
+
+def _digest(path: pathlib.Path) -> str:
+    h = hashlib.sha256()
+    for p in _sources(path):
+        h.update(b"\0")
+        try:
+            with open(p, "rb") as fh:
+                for chunk in iter(lambda: fh.read(1 << 20), b""):
+                    h.update(chunk)
+        except FileNotFoundError:
+            h.update(b"-")
+    return h.hexdigest()
+
+
+def artifact_path(path: str | pathlib.Path) -> pathlib.Path:
+    path = pathlib.Path(path)
+    return path.parent / CACHE_DIR / f"{path.name}.bgc"
+
+
+# ---------- compile --------------------------------------------------------- #
+def _images(objs) -> List[str]:
+    return sorted({o.image_path for o in objs if getattr(o, "image_path", None)})
+
+
+def _build(raw: Dict, spec: Any, lookup, tiles: Dict[str, Any]) -> Tuple[Tuple[str, Any], List]:
+    """(mode, ready object) for one normalized board, and what it shows."""
+    mode = raw["mode"]
+    if mode == "free":
+        fb = FreeBoard(raw["width"], raw["height"], [], raw["sections"])
+        for rec in raw["placed"]:
+            obj = lookup(rec)
+            if obj: fb.add(obj, rec["x"], rec["y"])
+        return (mode, fb), [p.obj for p in fb.placed]
+    if mode == "tilegrid":
+        if raw["cols"] is None or raw["rows"] is None:
+            return (mode, None), []
+        placed = [(tiles[r["name"]], r["col"], r["row"])
+                  for r in raw["placed"] if r["name"] in tiles]
+        return (mode, {"shape": raw["shape"], "cols": raw["cols"], "rows": raw["rows"],
+                       "placed": placed}), [t for t, _, _ in placed]
+    board = spec.build(lookup)
+    board.section_index()                       # rasterized now, not at first hover
+    return (mode, board), [o for cell in board.occupied() for o in cell.stack]
+
+
+def compile_game(path: str | pathlib.Path,
+                 dst: Optional[str | pathlib.Path] = None) -> pathlib.Path:
+    """Build the play-test artifact for the game at `path`."""
+    path = pathlib.Path(path)
+    dst = pathlib.Path(dst) if dst else artifact_path(path)
+    stat, digest = _stat(path), _digest(path)
+    game = open_game(path)
+    d = normalize(game.to_dict())
+    if hasattr(game, "close"):
+        game.close()
+
+    gd = GameData.from_dict(d)
+    ents = {k: {o.name: o for o in getattr(gd, k)} for k in KINDS}
+
+    def lookup(rec):
+        kind = _KIND_OF.get(rec.get("type"))
+        return ents[kind].get(rec.get("name")) if kind else None
+
+    blobs: Dict[str, bytes] = {}
+    for i, (raw, spec) in enumerate(zip(d["boards"], gd.boards)):
+        _, shown = _build(raw, spec, lookup, ents["tiles"])
+        blobs[f"images.{i}"] = "\n".join(_images(shown)).encode()
+    # own sections, so opening the artifact doesn't decode them
+    blobs["images"] = "\n".join(
+        _images(o for objs in ents.values() for o in objs.values())).encode()
+
+    d["compiled"] = {"version": VERSION, "stat": stat, "sha256": digest}
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    write_bin(d, dst, extra=blobs)
+    return dst
+
+
+# ---------- load -------------------------------------------------------------- #
+class CompiledGame(BinGameFile):
+    """A compiled artifact: a normalized `BinGameFile` that builds its
+    boards ready to play."""
+
+    def __init__(self, path: str | pathlib.Path):
+        super().__init__(path)
+        self.info: Dict[str, Any] = self._meta.get("compiled") or {}
+
+    def _lines(self, key: str) -> List[str]:
+        data = self.section(key)
+        return data.decode("utf-8").split("\n") if data else []
+
+    @property
+    def images(self) -> List[str]:
+        """Every image path the game's entities use."""
+        return self._lines("images")
+
+    def board_images(self, i: int) -> List[str]:
+        """Image paths of what sits on board `i`."""
+        return self._lines(f"images.{i}")
+
+    def built(self, i: int) -> Tuple[str, Any]:
+        """
+        (mode, object) for board `i`, fresh on every call: a `Board` for
+        "grid", a `FreeBoard` for "free", and for "tilegrid" a dict of
+        shape / cols / rows / placed (tile, col, row) – or None if the
+        board has no size.
+        """
+        raw = self.board_raw(i)
+        return _build(raw, board_from_dict(raw), self.lookup,
+                      {t.name: t for t in self.tiles})[0]
+
+    def fresh_for(self, path: str | pathlib.Path) -> bool:
+        """True if this artifact was compiled from `path` as it is now."""
+        path = pathlib.Path(path)
+        if self.info.get("version") != VERSION:
+            return False
+        if self.info.get("stat") == _stat(path):
+            return True
+        return self.info.get("sha256") == _digest(path)     # touched, not changed
+
+
+def open_compiled(path: str | pathlib.Path) -> CompiledGame:
+    """The compiled artifact for the game at `path`, rebuilt if stale."""
+    path = pathlib.Path(path)
+    art = artifact_path(path)
+    if art.exists():
+        try:
+            cg = CompiledGame(art)
+        except (ValueError, KeyError, OSError):     # older or damaged: rebuild
+            cg = None
+        if cg is not None:
+            if cg.fresh_for(path):
+                return cg
+            cg.close()
+    try:
+        compile_game(path, art)
+    except OSError:                                 # e.g. read-only games dir
+        art = pathlib.Path(tempfile.mkdtemp()) / art.name
+        compile_game(path, art)
+    return CompiledGame(art)
+
+
+def main(argv: Optional[List[str]] = None):
+    ap = argparse.ArgumentParser(prog="python -m game.compiled",
+                                 description="Normalize a game and build its play-test artifact.")
+    ap.add_argument("game", type=pathlib.Path)
+    ap.add_argument("--migrate", action="store_true",
+                    help="first rewrite the game file in the canonical schema")
+    a = ap.parse_args(argv)
+    if a.migrate:
+        print(f"{a.game}: {'migrated' if migrate(a.game) else 'already canonical'}")
+    dst = compile_game(a.game)
+    with CompiledGame(dst) as cg:
+        print(f"{dst} ({os.path.getsize(dst):,} B): {cg.manifest.counts},"
+              f" {len(cg.images)} images")
+
+
+if __name__ == "__main__":
+    main()
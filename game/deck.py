@@ -1,38 +1,121 @@
 from __future__ import annotations
-from typing import List
+from array import array
+from collections.abc import Sequence
+from typing import Iterable, List, Optional, Tuple
 from .card import Card
-import random, copy
+import random
 
 
 class Deck:
-    def __init__(self, name: str, cards: List[Card]):
+    """
+    Named pile of cards.  The cards live once in a table shared by every
+    clone; a deck is just an `array` of indices into it (bottom first) plus
+    how many are still in the pile.  Index arrays are never written in
+    place – shuffle builds a new one – so clones share them freely and
+    clone / draw / reset never copy anything.
+
+    Each deck shuffles with its own `random.Random`, so a deck given a
+    `seed` replays the same shuffles in any process.
+    """
+
+    def __init__(self, name: str, cards: Iterable[Card] = (), seed=None):
         self.name       = name
-        self._original  = cards[:]          # pristine order
-        self.cards      = cards[:]          # working stack
+        self.seed_value = seed              # None = seeded from the OS
+        self._rng: Optional[random.Random] = None           # made on first shuffle
+        self._table: Tuple[Card, ...] = tuple(cards)        # pristine order
+        self._full  = array("I", range(len(self._table)))   # shared by clones
+        self._order = self._full            # working stack (indices)
+        self._n     = len(self._table)      # cards left = _order[:_n]
+
+    @property
+    def cards(self) -> "_Pile":
+        """Cards still in the pile, bottom first (read-only, live)."""
+        return _Pile(self)
 
     # ---------- gameplay -------------------------------------------- #
+    def seed(self, seed=None):
+        """Restart this deck's shuffle sequence."""
+        self.seed_value, self._rng = seed, None
+
     def shuffle(self):
-        random.shuffle(self.cards)
+        if self._rng is None:
+            self._rng = random.Random(self.seed_value)
+        left = self._order[:self._n].tolist()     # list shuffles faster
+        self._rng.shuffle(left)
+        self._order = array("I", left)
 
     def draw(self) -> Card | None:
-        return self.cards.pop() if self.cards else None
+        if not self._n:
+            return None
+        self._n -= 1
+        return self._table[self._order[self._n]]
+
+    def draw_many(self, n: int) -> List[Card]:
+        """Up to `n` cards off the top, in the order `draw` would give them."""
+        n = max(0, min(n, self._n))
+        top, self._n = self._n, self._n - n
+        return [self._table[i] for i in reversed(self._order[self._n:top])]
+
+    def deal(self, players, n: int) -> List[List[Card]]:
+        """
+        Deal `n` cards to each player round-robin, as if by hand, in one
+        slice; runs short if the pile does.  Cards go onto each player's
+        `hand` and the dealt hands are returned.
+        """
+        dealt = self.draw_many(n * len(players))
+        hands = [dealt[k::len(players)] for k in range(len(players))]
+        for p, hand in zip(players, hands):
+            p.hand.extend(hand)
+        return hands
 
     def reset(self):
-        self.cards = self._original[:]
+        self._order, self._n = self._full, len(self._table)
 
     def clone(self) -> "Deck":
-        dup = Deck(self.name, self._original)
-        dup.cards = self.cards[:]            # keep remaining stack
+        dup = Deck.__new__(Deck)
+        dup.__dict__.update(self.__dict__)
+        if self._rng is not None:           # carry on the same shuffle sequence
+            dup._rng = random.Random()
+            dup._rng.setstate(self._rng.getstate())
         return dup
 
     # ---------- (de)serialise --------------------------------------- #
     def to_dict(self):
         """Save just card **names** to keep file small and avoid duplication."""
-        return {"name": self.name,
-                "cards": [c.name for c in self._original]}
+        d = {"name": self.name,
+             "cards": [c.name for c in self._table]}
+        if self.seed_value is not None:
+            d["seed"] = self.seed_value
+        return d
 
     @classmethod
     def from_dict(cls, d, card_lookup: dict[str, Card]):
         """card_lookup maps name → Card object reconstructed once."""
         card_objs = [card_lookup[n] for n in d["cards"] if n in card_lookup]
-        return cls(d["name"], card_objs)
+        return cls(d["name"], card_objs, d.get("seed"))
+
+
+class _Pile(Sequence):
+    """`Deck.cards` – indexes the deck's table on access, never copies."""
+    __slots__ = ("_deck",)
+
+    def __init__(self, deck: Deck):
+        self._deck = deck
+
+    def __len__(self):
+        return self._deck._n
+
+    def __getitem__(self, i):
+        d = self._deck
+        if isinstance(i, slice):
+            return [d._table[k] for k in d._order[:d._n][i]]
+        if not -d._n <= i < d._n:
+            raise IndexError(i)
+        return d._table[d._order[i % d._n]]
+
+    def __iter__(self):
+        d = self._deck
+        return (d._table[d._order[k]] for k in range(d._n))
+
+    def __repr__(self):
+        return repr(list(self))
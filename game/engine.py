@@ -1,17 +1,27 @@
 from __future__ import annotations
-from typing import List
+import copy, random
+from typing import List, Optional
 from .player import Player
 from .deck import Deck
 from .board import Board
 
 class GameEngine:
-    """Turn-based engine (extend to add rules)."""
+    """
+    Turn-based engine (extend to add rules).  Rule hooks can find things
+    on the board with `board.positions_of`, `cells_of_type` and
+    `cells_named`.
+    """
+
+    stack_limit: Optional[int] = None     # max objects per cell (None = no cap)
 
     def __init__(self, players: List[Player], deck: Deck, board: Board):
         self.players = players
         self.current_idx = 0
         self.deck = deck
         self.board = board
+        self.played = [0] * len(players)    # cards each seat has put down
+        self.turn   = 0                     # end_turn() calls so far
+        self.log    = None                  # game.replay.ActionLog, if recording
 
     # ---------- turn helpers ---------------------------------------------
     @property
@@ -19,11 +29,109 @@ class GameEngine:
         return self.players[self.current_idx]
 
     def end_turn(self):
+        self._record("end_turn", self.board.state_hash)
         self.current_idx = (self.current_idx + 1) % len(self.players)
+        self.turn += 1
+        if self.log is not None:
+            self.log.turn_started(self)
+
+    def _record(self, kind: str, *args):
+        if self.log is not None:
+            self.log.record(self, kind, *args)
+
+    def fork(self) -> "GameEngine":
+        """
+        Independent copy for look-ahead: the board is forked copy-on-write,
+        the deck cloned and hands copied, so a fork costs only what it
+        changes.  Subclasses with extra mutable state should extend this.
+        """
+        dup = copy.copy(self)
+        dup.board  = self.board.fork()
+        dup.deck   = self.deck.clone()
+        dup.played = self.played[:]
+        dup.log    = None                   # forks never write the log
+        dup.players = []
+        for p in self.players:
+            q = copy.copy(p); q.hand = p.hand[:]
+            dup.players.append(q)
+        return dup
 
     # ---------- rule hooks ------------------------------------------------
     def can_place(self, x, y, card):
-        return True   # override for custom rules
+        # override for custom rules; honour stack_limit or call super()
+        return (self.stack_limit is None
+                or len(self.board.stack(x, y)) < self.stack_limit)
+
+    def place_mask(self, objs, mask):
+        """
+        Vectorised `can_place` for `game.moves`: given the bool mask
+        (objs × H × W) of placements the board and `stack_limit` allow,
+        return it narrowed by the custom rules – or None to have
+        `can_place` called on every still-legal cell instead.
+        """
+        return None
 
     def after_place(self, x, y, card):
         pass
+
+    def is_over(self) -> bool:
+        """Default: nothing left to draw and nobody holds a card."""
+        return not self.deck.cards and not any(p.hand for p in self.players)
+
+    def score(self, player) -> float:
+        return self.played[self.players.index(player)]   # override for real scoring
+
+    def winner(self):
+        """Highest score, or None on a tie."""
+        scores = [self.score(p) for p in self.players]
+        best = max(scores, default=None)
+        return (self.players[scores.index(best)]
+                if best is not None and scores.count(best) == 1 else None)
+
+    # ---------- moves ------------------------------------------------------
+    def legal_moves(self, objs=None):
+        """All legal (x, y, obj) for `objs` (default: the current hand)."""
+        from .moves import legal_moves      # numpy only when asked for
+        return legal_moves(self, objs)
+
+    def play(self, x, y, card) -> bool:
+        """Put `card` from the current hand on (x, y) if the rules allow it."""
+        if card not in self.current_player.hand:        # before the board changes
+            raise ValueError(f"{getattr(card, 'name', card)!r} is not in "
+                             f"{self.current_player.name}'s hand")
+        if not self.can_place(x, y, card) or not self.board.place(x, y, card):
+            return False
+        self.current_player.hand.remove(card)
+        self.played[self.current_idx] += 1
+        self._record("place", x, y, card)
+        # whatever the rule does is replayed by replaying this placement
+        log, self.log = self.log, None
+        try:
+            self.after_place(x, y, card)
+        finally:
+            self.log = log
+        return True
+
+    def move(self, x0, y0, x1, y1) -> bool:
+        """Move the top object of (x0, y0) onto (x1, y1)."""
+        obj = self.board.remove_top(x0, y0)
+        if obj is None:
+            return False
+        if not self.board.place(x1, y1, obj):
+            self.board.place(x0, y0, obj)
+            return False
+        self._record("move", x0, y0, x1, y1)
+        return True
+
+    def draw(self, n: int = 1):
+        """Current player draws `n` cards from the deck."""
+        self.current_player.draw(self.deck, n)
+        self._record("draw", n)
+
+    def shuffle(self, seed=None):
+        """Reshuffle the deck; a fresh seed is picked (and logged) if none
+        is given, so replays shuffle the same way."""
+        if seed is None:
+            seed = random.getrandbits(64)
+        self.deck.seed(seed); self.deck.shuffle()
+        self._record("shuffle", seed)
@@ -1,13 +1,89 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import List, Tuple, Dict
+from dataclasses import dataclass, field
+from math import floor
+from typing import Iterable, Iterator, List, Set, Tuple, Dict
 from .card  import Card
 from .piece import Piece
 from .token import Token
 from .deck  import Deck
+from .board import Board, Section, SectionType
+from .zobrist import MASK, placement_key
+from .geometry import Outline, outline_of, point_in_polygon, polygons_overlap
 
 Obj = Card | Piece | Token | Deck
 Point = Tuple[int, int]
+Box = Tuple[int, int, int, int]         # x0, y0, x1, y1 (half-open)
+
+SPRITE = 64             # default sprite box (px) for objects without an outline
+BUCKET = 64             # spatial-hash cell size (px)
+UNIT   = 64             # px per board unit (sections are stored in units)
+
+
+def local_box(obj: Obj) -> Box:
+    """Bounding box of an object's sprite relative to its placement point."""
+    ol = outline_of(obj)
+    if ol is not None:
+        x0, y0, x1, y1 = ol.box
+        return floor(x0), floor(y0), floor(x1) + 1, floor(y1) + 1
+    return 0, 0, SPRITE, SPRITE
+
+
+def _buckets(box: Box) -> Iterator[Point]:
+    x0, y0, x1, y1 = box
+    for by in range(y0 // BUCKET, (y1 - 1) // BUCKET + 1):
+        for bx in range(x0 // BUCKET, (x1 - 1) // BUCKET + 1):
+            yield bx, by
+
+
+def _kind(raw: str) -> SectionType:
+    try:
+        return SectionType(str(raw).capitalize())
+    except ValueError:
+        return SectionType.ANY
+
+
+class _SectionIndex:
+    """
+    `FreeBoard.sections` compiled to pixel-space `Outline`s and bucketed
+    on the same grid as placements, so a lookup only tests the handful of
+    polygons near the point.  Buckets list sections in board order, so
+    the first matching section wins, as on grid boards.
+    """
+
+    def __init__(self, raw: List[Dict]):
+        self.sections: List[Section] = []
+        self.shapes:   List[Outline] = []
+        self.grid:     Dict[Point, List[int]] = {}
+        for s in raw:
+            pts = [(x * UNIT, y * UNIT) for x, y in s.get("points", ())]
+            if len(pts) < 3:
+                continue
+            i = len(self.sections)
+            self.sections.append(Section(s.get("name", "Area"),
+                                         _kind(s.get("kind", "Any")), pts))
+            ol = Outline(pts)
+            self.shapes.append(ol)
+            x0, y0, x1, y1 = ol.box
+            for key in _buckets((floor(x0), floor(y0), floor(x1) + 1, floor(y1) + 1)):
+                self.grid.setdefault(key, []).append(i)
+
+    def at(self, px: float, py: float) -> Section | None:
+        for i in self.grid.get((int(px // BUCKET), int(py // BUCKET)), ()):
+            if self.shapes[i].contains(px, py):
+                return self.sections[i]
+        return None
+
+    def under(self, box: Box, poly: List[Point]) -> List[Section]:
+        cand = set()
+        for key in _buckets(box):
+            cand.update(self.grid.get(key, ()))
+        out = []
+        for i in sorted(cand):
+            x0, y0, x1, y1 = self.shapes[i].box
+            if x0 < box[2] and box[0] < x1 and y0 < box[3] and box[1] < y1 and \
+                    polygons_overlap(poly, self.sections[i].points):
+                out.append(self.sections[i])
+        return out
 
 
 @dataclass
@@ -15,6 +91,56 @@ class Placed:
     obj: Obj
     x: int
     y: int
+    pid: int = field(default=0, compare=False)     # stable id, set by ZOrder
+
+
+class ZOrder:
+    """
+    Placements in z-order (bottom first), keyed by a stable `pid`.  Backed
+    by an insertion-ordered dict, so add, remove and raise-to-top are O(1)
+    and iteration order is the drawing / saving order.
+    """
+
+    def __init__(self, items: Iterable[Placed] = ()):
+        self._by_pid: Dict[int, Placed] = {}
+        self._rank:   Dict[int, int] = {}          # pid → z key (higher = on top)
+        self._next = 1
+        for p in items:
+            self.add(p)
+
+    def add(self, p: Placed) -> Placed:
+        p.pid = self._next
+        self._by_pid[p.pid] = p
+        self._rank[p.pid] = self._next
+        self._next += 1
+        return p
+
+    def discard(self, pid: int) -> Placed:
+        del self._rank[pid]
+        return self._by_pid.pop(pid)
+
+    def raise_to_top(self, pid: int):
+        self._by_pid[pid] = self._by_pid.pop(pid)
+        self._rank[pid] = self._next
+        self._next += 1
+
+    def rank(self, pid: int) -> int:
+        return self._rank[pid]
+
+    def __getitem__(self, pid: int) -> Placed:
+        return self._by_pid[pid]
+
+    def __contains__(self, p: Placed) -> bool:
+        return self._by_pid.get(p.pid) is p
+
+    def __iter__(self) -> Iterator[Placed]:
+        return iter(self._by_pid.values())
+
+    def __reversed__(self) -> Iterator[Placed]:
+        return reversed(self._by_pid.values())
+
+    def __len__(self) -> int:
+        return len(self._by_pid)
 
 
 @dataclass
@@ -22,21 +148,224 @@ class FreeBoard:
     """Pixel-coordinate board (no grid)."""
     width: int
     height: int
-    placed: List[Placed]          # every object instance
+    placed: ZOrder                # every object instance (list accepted)
     sections: List[Dict]          # same polygon sections as before
+    # order-free sum of placement keys (mod 2**64) – unlike XOR, two equal
+    # objects dropped on the same pixel don't cancel out
+    state_hash: int = field(default=0, init=False)
+    # uniform grid hash: bucket → {pid: Placed}, plus each item's absolute box
+    _grid:  Dict[Point, Dict[int, Placed]] = field(default_factory=dict, init=False,
+                                                   repr=False, compare=False)
+    _boxes: Dict[int, Box] = field(default_factory=dict, init=False,
+                                   repr=False, compare=False)
+    # compiled outline per pid (None = plain sprite box) for exact hits
+    _shapes: Dict[int, Outline | None] = field(default_factory=dict, init=False,
+                                               repr=False, compare=False)
+    # pid → pids it overlaps; built on the first overlap query, then kept
+    # current by add / remove / move so boards that never ask pay nothing
+    _contacts: Dict[int, Set[int]] | None = field(default=None, init=False,
+                                                  repr=False, compare=False)
+    # compiled `sections`; rebuilt lazily after `invalidate_sections()`
+    _sec_index: _SectionIndex | None = field(default=None, init=False,
+                                             repr=False, compare=False)
+    _sec_count: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if not isinstance(self.placed, ZOrder):
+            self.placed = ZOrder(self.placed)
+        self.state_hash = self.recompute_hash()
+        for p in self.placed:
+            self._index(p)
+
+    # ------------------------------------------------------------------ #
+    def _index(self, p: Placed):
+        lx0, ly0, lx1, ly1 = local_box(p.obj)
+        box = (p.x + lx0, p.y + ly0, p.x + lx1, p.y + ly1)
+        self._boxes[p.pid] = box
+        if p.pid not in self._shapes:
+            self._shapes[p.pid] = outline_of(p.obj)
+        for key in _buckets(box):
+            self._grid.setdefault(key, {})[p.pid] = p
+
+    def _unindex(self, p: Placed):
+        for key in _buckets(self._boxes.pop(p.pid)):
+            bucket = self._grid[key]
+            del bucket[p.pid]
+            if not bucket:
+                del self._grid[key]
+
+    def box_of(self, p: Placed) -> Box:
+        return self._boxes[p.pid]
 
     # ------------------------------------------------------------------ #
     def objects_at(self, px: int, py: int) -> list[Placed]:
-        """Return list of placed items whose bounding box covers (px,py)."""
-        r = []
-        for p in self.placed:
-            if p.x <= px < p.x + 64 and p.y <= py < p.y + 64:
-                r.append(p)
-        return r
+        """Placed items under (px,py), bottom first: bucket + bounding-box
+        prefilter, then an exact test against custom outlines."""
+        bucket = self._grid.get((px // BUCKET, py // BUCKET), {})
+        hits = []
+        for k, p in bucket.items():
+            bx0, by0, bx1, by1 = self._boxes[k]
+            if not (bx0 <= px < bx1 and by0 <= py < by1):
+                continue
+            shape = self._shapes[k]
+            if shape is None or shape.contains(px - p.x, py - p.y):
+                hits.append(p)
+        hits.sort(key=lambda p: self.placed.rank(p.pid))
+        return hits
+
+    def objects_in_rect(self, x0: int, y0: int, x1: int, y1: int) -> list[Placed]:
+        """Placed items whose bounding box overlaps the rectangle, bottom first."""
+        x0, x1 = sorted((x0, x1)); y0, y1 = sorted((y0, y1))
+        hits: Dict[int, Placed] = {}
+        for key in _buckets((x0, y0, x1 + 1, y1 + 1)):
+            for pid, p in self._grid.get(key, {}).items():
+                bx0, by0, bx1, by1 = self._boxes[pid]
+                if bx0 <= x1 and x0 < bx1 and by0 <= y1 and y0 < by1:
+                    hits[pid] = p
+        return sorted(hits.values(), key=lambda p: self.placed.rank(p.pid))
+
+    def objects_in_polygon(self, pts: List[Point]) -> list[Placed]:
+        """Lasso: items whose bounding-box centre lies inside `pts`."""
+        if len(pts) < 3:
+            return []
+        xs = [x for x, _ in pts]; ys = [y for _, y in pts]
+        out = []
+        for p in self.objects_in_rect(min(xs), min(ys), max(xs), max(ys)):
+            bx0, by0, bx1, by1 = self._boxes[p.pid]
+            if point_in_polygon(pts, (bx0 + bx1) / 2, (by0 + by1) / 2):
+                out.append(p)
+        return out
+
+    # ------------------------------------------------------------------ #
+    #  Collision: grid-bucket broad phase, polygon narrow phase          #
+    # ------------------------------------------------------------------ #
+    def footprint(self, p: Placed) -> List[Point]:
+        """Absolute outline of a placement (its sprite box if not custom)."""
+        shape = self._shapes[p.pid]
+        if shape is None:
+            x0, y0, x1, y1 = self._boxes[p.pid]
+            return [(x0, y0), (x1, y0), (x1, y1), (x0, y1)]
+        return [(p.x + x, p.y + y) for x, y in shape.points]
+
+    @staticmethod
+    def _shape_at(obj: Obj, px: int, py: int) -> Tuple[Box, List[Point]]:
+        """Absolute box and outline `obj` would have at (px, py)."""
+        lx0, ly0, lx1, ly1 = local_box(obj)
+        box = (px + lx0, py + ly0, px + lx1, py + ly1)
+        shape = outline_of(obj)
+        if shape is not None:
+            return box, [(px + x, py + y) for x, y in shape.points]
+        return box, [(box[0], box[1]), (box[2], box[1]), (box[2], box[3]), (box[0], box[3])]
+
+    def overlaps_at(self, obj: Obj, px: int, py: int,
+                    ignore: Placed | None = None) -> list[Placed]:
+        """What `obj` would overlap if it sat at (px, py), bottom first."""
+        lx0, ly0, lx1, ly1 = local_box(obj)
+        box = (px + lx0, py + ly0, px + lx1, py + ly1)
+        shape = outline_of(obj)
+        poly = None
+        seen: Dict[int, Placed] = {}
+        for key in _buckets(box):
+            for pid, q in self._grid.get(key, {}).items():
+                if q is ignore or pid in seen:
+                    continue
+                bx0, by0, bx1, by1 = self._boxes[pid]
+                if not (box[0] < bx1 and bx0 < box[2] and box[1] < by1 and by0 < box[3]):
+                    continue
+                if shape is not None or self._shapes[pid] is not None:
+                    if poly is None:
+                        poly = self._shape_at(obj, px, py)[1]
+                    if not polygons_overlap(poly, self.footprint(q)):
+                        continue
+                seen[pid] = q
+        return sorted(seen.values(), key=lambda q: self.placed.rank(q.pid))
+
+    def overlapping(self, p: Placed) -> list[Placed]:
+        """Placements overlapping `p`, bottom first (incrementally maintained)."""
+        if self._contacts is None:
+            self._contacts = {}
+            for q in self.placed:
+                self._touch(q)
+        return sorted((self.placed[pid] for pid in self._contacts[p.pid]),
+                      key=lambda q: self.placed.rank(q.pid))
+
+    def _touch(self, p: Placed):
+        mine = self._contacts[p.pid] = {q.pid for q in
+                                        self.overlaps_at(p.obj, p.x, p.y, ignore=p)}
+        for pid in mine:
+            self._contacts.setdefault(pid, set()).add(p.pid)
+
+    def _untouch(self, p: Placed):
+        for pid in self._contacts.pop(p.pid, ()):
+            self._contacts[pid].discard(p.pid)
+
+    # ------------------------------------------------------------------ #
+    #  Sections (dicts with polygons in board units)                     #
+    # ------------------------------------------------------------------ #
+    def invalidate_sections(self):
+        """Drop the compiled section index; call after editing `sections`."""
+        self._sec_index = None
+
+    def _sections(self) -> _SectionIndex:
+        if self._sec_index is None or self._sec_count != len(self.sections):
+            self._sec_index = _SectionIndex(self.sections)
+            self._sec_count = len(self.sections)
+        return self._sec_index
+
+    def section_at(self, px: float, py: float) -> Section | None:
+        """First section whose polygon contains the pixel (px, py)."""
+        return self._sections().at(px, py)
+
+    def sections_under(self, obj: Obj, px: int, py: int) -> List[Section]:
+        """Sections the footprint of `obj` at (px, py) overlaps, board order."""
+        return self._sections().under(*self._shape_at(obj, px, py))
+
+    def can_accept(self, obj: Obj, px: int, py: int) -> bool:
+        """Every section under the footprint must take this kind of object."""
+        return all(Board._kind_accepts(sec, obj)
+                   for sec in self.sections_under(obj, px, py))
 
     # easy helpers
+    def place(self, obj: Obj, px: int, py: int) -> Placed | None:
+        """`add` if the sections allow it (None when rejected)."""
+        return self.add(obj, px, py) if self.can_accept(obj, px, py) else None
+
     def add(self, obj: Obj, px: int, py: int):
-        self.placed.append(Placed(obj, px, py))
+        p = self.placed.add(Placed(obj, px, py))
+        self._index(p)
+        if self._contacts is not None:
+            self._touch(p)
+        self.state_hash = (self.state_hash + placement_key(obj, px, py)) & MASK
+        return p
 
     def remove(self, placed: Placed):
-        self.placed.remove(placed)
+        if self._contacts is not None:
+            self._untouch(placed)
+        self.placed.discard(placed.pid)
+        self._unindex(placed)
+        del self._shapes[placed.pid]
+        self.state_hash = (self.state_hash - placement_key(placed.obj, placed.x,
+                                                           placed.y)) & MASK
+
+    def raise_to_top(self, placed: Placed):
+        self.placed.raise_to_top(placed.pid)
+
+    def move(self, placed: Placed, px: int, py: int):
+        """Reposition an existing placement (drag) keeping hash and index in step."""
+        h = self.state_hash - placement_key(placed.obj, placed.x, placed.y)
+        self._unindex(placed)
+        placed.x, placed.y = px, py
+        self._index(placed)
+        if self._contacts is not None:
+            self._untouch(placed)
+            self._touch(placed)
+        self.state_hash = (h + placement_key(placed.obj, px, py)) & MASK
+
+    def move_many(self, placed: Iterable[Placed], dx: int, dy: int):
+        """Shift a group of placements by (dx, dy)."""
+        for p in placed:
+            self.move(p, p.x + dx, p.y + dy)
+
+    def recompute_hash(self) -> int:
+        """Full O(n) hash – should always equal `state_hash`."""
+        return sum(placement_key(p.obj, p.x, p.y) for p in self.placed) & MASK
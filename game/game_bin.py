@@ -0,0 +1,387 @@
+"""
+Compact binary game files (`.bgc`) with a random-access index.
+
+Layout (little-endian):
+
+    "BGCB" u16 version  u16 sections
+    per section: u8 key length, key, u64 offset, u64 length
+    sections:
+      strings  u32 n, u32 offsets[n + 1], UTF-8 blob  – every string once
+      meta     one encoded value ({"name": …} plus any other top-level keys)
+      cards, pieces, tokens, decks, tiles, boards
+               u32 n, u32 name[n], u32 tag[n], u32 offsets[n + 1], blob
+               (name/tag are string ids; tag is a board's mode)
+
+Values are a small tagged encoding of the JSON data model: strings are
+ids into the string table, lists of small ints and of [x, y] points are
+packed int32 arrays, lists of strings are packed string ids, and lists
+of same-shaped dicts (saved placements, sections) are stored column by
+column with their keys written once.
+
+`BinGameFile` maps the file with `mmap` and decodes only what is asked
+for – the manifest from the name columns, a single card by name, one
+board – exactly like the lazy `GameFile` does for JSON.  JSON stays the
+interchange format:
+
+    python -m game.game_bin "data/games/Bird of Prey.json"     # → .bgc
+    python -m game.game_bin game.bgc game.json                  # → JSON
+"""
+from __future__ import annotations
+import json, mmap, os, pathlib, struct, sys, threading
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+from .game_data import GameData, BoardSpec
+from .game_file import LazyGame, Manifest
+
+MAGIC   = b"BGCB"
+VERSION = 1
+SUFFIX  = ".bgc"
+NONE    = 0xFFFFFFFF                 # "no string" id
+
+KINDS = ("cards", "pieces", "tokens", "decks", "tiles", "boards")
+
+# value tags
+_NULL, _FALSE, _TRUE, _INT, _FLOAT, _STR, _LIST, _DICT, \
+    _INTS, _STRS, _POINTS, _TABLE, _BIGINT = range(13)
+
+_I32 = (-(1 << 31), (1 << 31) - 1)
+_I64 = (-(1 << 63), (1 << 63) - 1)
+
+
+def _int32s(v: list) -> bool:
+    return all(type(x) is int and _I32[0] <= x <= _I32[1] for x in v)
+
+
+def _packed(a: array) -> bytes:
+    if sys.byteorder != "little":
+        a = array(a.typecode, a); a.byteswap()
+    return a.tobytes()
+
+
+def _unpacked(typecode: str, data) -> array:
+    a = array(typecode); a.frombytes(data)
+    if sys.byteorder != "little":
+        a.byteswap()
+    return a
+
+
+# ---------- writing ---------------------------------------------------- #
+class _Writer:
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.strings: List[str] = []
+
+    def sid(self, s: Optional[str]) -> int:
+        if s is None:
+            return NONE
+        i = self.ids.get(s)
+        if i is None:
+            i = self.ids[s] = len(self.strings)
+            self.strings.append(s)
+        return i
+
+    def value(self, v, out: bytearray):
+        if v is None:
+            out.append(_NULL)
+        elif v is True or v is False:
+            out.append(_TRUE if v else _FALSE)
+        elif isinstance(v, int):
+            if _I64[0] <= v <= _I64[1]:
+                out.append(_INT); out += struct.pack("<q", v)
+            else:
+                out.append(_BIGINT); out += struct.pack("<I", self.sid(str(v)))
+        elif isinstance(v, float):
+            out.append(_FLOAT); out += struct.pack("<d", v)
+        elif isinstance(v, str):
+            out.append(_STR); out += struct.pack("<I", self.sid(v))
+        elif isinstance(v, dict):
+            out.append(_DICT); out += struct.pack("<I", len(v))
+            out += _packed(array("I", [self.sid(str(k)) for k in v]))
+            for x in v.values():
+                self.value(x, out)
+        elif isinstance(v, (list, tuple)):
+            self._list(list(v), out)
+        else:
+            raise TypeError(f"can't store {type(v).__name__} in a game file")
+
+    def _list(self, v: list, out: bytearray):
+        if v and _int32s(v):
+            out.append(_INTS); out += struct.pack("<I", len(v))
+            out += _packed(array("i", v))
+        elif v and all(type(x) is str for x in v):
+            out.append(_STRS); out += struct.pack("<I", len(v))
+            out += _packed(array("I", [self.sid(x) for x in v]))
+        elif v and all(isinstance(p, (list, tuple)) and len(p) == 2 and _int32s(p)
+                       for p in v):
+            out.append(_POINTS); out += struct.pack("<I", len(v))
+            out += _packed(array("i", [c for p in v for c in p]))
+        elif len(v) > 1 and type(v[0]) is dict and v[0] and \
+                all(type(d) is dict and d.keys() == v[0].keys() for d in v):
+            # stored by column, so e.g. the x and y of saved placements
+            # become two packed int arrays
+            keys = list(v[0])
+            out.append(_TABLE); out += struct.pack("<I", len(keys))
+            out += _packed(array("I", [self.sid(str(k)) for k in keys]))
+            for k in keys:
+                self._list([d[k] for d in v], out)
+        else:
+            out.append(_LIST); out += struct.pack("<I", len(v))
+            for x in v:
+                self.value(x, out)
+
+    def column(self, items: List[dict], tag_key: Optional[str] = None) -> bytes:
+        names = array("I", [self.sid(d.get("name")) for d in items])
+        tags  = array("I", [self.sid(d.get(tag_key)) if tag_key else NONE
+                            for d in items])
+        blob, offs = bytearray(), array("I", [0])
+        for d in items:
+            self.value(d, blob)
+            offs.append(len(blob))
+        return (struct.pack("<I", len(items)) + _packed(names) + _packed(tags)
+                + _packed(offs) + bytes(blob))
+
+    def string_table(self) -> bytes:
+        encoded = [s.encode("utf-8") for s in self.strings]
+        offs = array("I", [0])
+        for b in encoded:
+            offs.append(offs[-1] + len(b))
+        return struct.pack("<I", len(encoded)) + _packed(offs) + b"".join(encoded)
+
+
+def write_bin(data: GameData | Dict, path: str | pathlib.Path,
+              extra: Optional[Dict[str, bytes]] = None):
+    """
+    Write a game (GameData or its `to_dict()` form) as a `.bgc` file;
+    `extra` adds opaque sections, read back with `BinGameFile.section`.
+    """
+    d = data.to_dict() if isinstance(data, GameData) else data
+    w = _Writer()
+    meta = bytearray()
+    w.value({"name": "", **{k: v for k, v in d.items() if k not in KINDS}}, meta)
+    boards = [b.to_dict() if isinstance(b, BoardSpec) else b for b in d.get("boards", [])]
+    sections = [("meta", bytes(meta))]
+    for kind in KINDS:
+        items = boards if kind == "boards" else d.get(kind, [])
+        sections.append((kind, w.column(items, "mode" if kind == "boards" else None)))
+    sections.insert(0, ("strings", w.string_table()))      # complete only now
+    sections += list((extra or {}).items())
+
+    head = len(MAGIC) + 4 + sum(1 + len(k) + 16 for k, _ in sections)
+    index, body, off = bytearray(), bytearray(), head
+    for key, blob in sections:
+        index += bytes([len(key)]) + key.encode() + struct.pack("<QQ", off, len(blob))
+        body += blob; off += len(blob)
+    # write beside and swap in: a reader may still have the old file mapped,
+    # and truncating a mapped file under it would crash that reader
+    path = pathlib.Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as fh:
+        fh.write(MAGIC + struct.pack("<HH", VERSION, len(sections)) + index + body)
+    os.replace(tmp, path)
+
+
+# ---------- reading ---------------------------------------------------- #
+class BinGameFile(LazyGame):
+    """A `.bgc` game, memory-mapped; parts are decoded on first use."""
+
+    def __init__(self, path: str | pathlib.Path):
+        super().__init__()
+        self.path = pathlib.Path(path)
+        # held while reading and while the map is swapped out (`release`
+        # runs on the journal's compaction thread)
+        self._lock = threading.RLock()
+        self._fh = open(self.path, "rb")
+        self._mm = mm = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+        if mm[:4] != MAGIC:
+            self.close()
+            raise ValueError(f"{self.path.name} is not a binary game file")
+        version, n = struct.unpack_from("<HH", mm, 4)
+        if version > VERSION:
+            self.close()
+            raise ValueError(f"{self.path.name} needs a newer version (format {version})")
+        self._index: Dict[str, Tuple[int, int]] = {}
+        pos = 8
+        for _ in range(n):
+            klen = mm[pos]
+            key = mm[pos + 1:pos + 1 + klen].decode()
+            self._index[key] = struct.unpack_from("<QQ", mm, pos + 1 + klen)
+            pos += 1 + klen + 16
+        s0 = self._index["strings"][0]
+        nstr = struct.unpack_from("<I", mm, s0)[0]
+        self._str_offs = _unpacked("I", mm[s0 + 4:s0 + 4 + 4 * (nstr + 1)]).tolist()
+        self._str_blob = s0 + 4 + 4 * (nstr + 1)
+        self._str: List[Optional[str]] = [None] * nstr
+        self._cols: Dict[str, Tuple[int, int]] = {}        # kind → (count, base)
+        self._ids: Dict[str, Dict[str, int]] = {}          # kind → name → item
+        self._meta = self._decode(self._index["meta"][0])[0]
+        self.manifest = Manifest(self.name, *(self._names(k) for k in KINDS[:-1]),
+                                 list(zip(self._names("boards"),
+                                          [t or "grid" for t in self._tags("boards")])))
+
+    def close(self):
+        with self._lock:
+            if isinstance(self._mm, mmap.mmap):
+                self._mm.close(); self._fh.close()
+            self._mm = None
+
+    def release(self):
+        """Copy the file into memory and unmap it (see `LazyGame.release`);
+        safe to call while another thread reads."""
+        with self._lock:
+            mm = self._mm
+            if isinstance(mm, mmap.mmap):
+                self._mm = mm[:]
+                mm.close(); self._fh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---------- primitives ------------------------------------------- #
+    def _string(self, i: int) -> Optional[str]:
+        if i == NONE:
+            return None
+        s = self._str[i]
+        if s is None:
+            lo = self._str_blob
+            s = self._str[i] = self._mm[lo + self._str_offs[i]:
+                                        lo + self._str_offs[i + 1]].decode("utf-8")
+        return s
+
+    def _strings(self, pos: int, n: int) -> List[Optional[str]]:
+        cache, get = self._str, self._string
+        return [cache[i] or get(i) for i in _unpacked("I", self._mm[pos:pos + 4 * n])]
+
+    def _decode(self, pos: int) -> Tuple[Any, int]:
+        mm, tag = self._mm, self._mm[pos]
+        pos += 1
+        if tag == _NULL:
+            return None, pos
+        if tag in (_FALSE, _TRUE):
+            return tag == _TRUE, pos
+        if tag == _INT:
+            return struct.unpack_from("<q", mm, pos)[0], pos + 8
+        if tag == _FLOAT:
+            return struct.unpack_from("<d", mm, pos)[0], pos + 8
+        if tag == _STR:
+            return self._string(struct.unpack_from("<I", mm, pos)[0]), pos + 4
+        if tag == _BIGINT:
+            return int(self._string(struct.unpack_from("<I", mm, pos)[0])), pos + 4
+        n = struct.unpack_from("<I", mm, pos)[0]
+        pos += 4
+        if tag == _INTS:
+            return _unpacked("i", mm[pos:pos + 4 * n]).tolist(), pos + 4 * n
+        if tag == _STRS:
+            return self._strings(pos, n), pos + 4 * n
+        if tag == _POINTS:
+            a = _unpacked("i", mm[pos:pos + 8 * n]).tolist()
+            return [a[i:i + 2] for i in range(0, len(a), 2)], pos + 8 * n
+        if tag == _LIST:
+            out = []
+            for _ in range(n):
+                v, pos = self._decode(pos); out.append(v)
+            return out, pos
+        if tag == _DICT:
+            out = {}
+            pos += 4 * n
+            for k in self._strings(pos - 4 * n, n):
+                out[k], pos = self._decode(pos)
+            return out, pos
+        if tag == _TABLE:
+            keys = self._strings(pos, n)
+            pos += 4 * n
+            cols = []
+            for _ in keys:
+                col, pos = self._decode(pos); cols.append(col)
+            return [dict(zip(keys, row)) for row in zip(*cols)], pos
+        raise ValueError(f"corrupt game file: unknown value tag {tag}")
+
+    # ---------- entity columns --------------------------------------- #
+    # `_col`, `_column`, `_item` and `section` are where reads start; they
+    # hold the lock so `release` can't swap the map out mid-decode
+    def _col(self, kind: str) -> Tuple[int, int]:
+        with self._lock:
+            if kind not in self._cols:
+                base = self._index[kind][0]
+                self._cols[kind] = (struct.unpack_from("<I", self._mm, base)[0], base + 4)
+            return self._cols[kind]
+
+    def _column(self, kind: str, which: int) -> List[Optional[str]]:
+        with self._lock:
+            n, base = self._col(kind)
+            lo = base + 4 * n * which
+            return [self._string(i) for i in _unpacked("I", self._mm[lo:lo + 4 * n])]
+
+    def _names(self, kind: str) -> List[str]:
+        return self._column(kind, 0)
+
+    def _tags(self, kind: str) -> List[Optional[str]]:
+        return self._column(kind, 1)
+
+    def _item(self, kind: str, i: int) -> Any:
+        with self._lock:
+            n, base = self._col(kind)
+            offs = base + 8 * n
+            start = struct.unpack_from("<I", self._mm, offs + 4 * i)[0]
+            return self._decode(offs + 4 * (n + 1) + start)[0]
+
+    def section(self, key: str) -> Optional[bytes]:
+        """Raw bytes of a section added through `write_bin(extra=…)`."""
+        if key not in self._index:
+            return None
+        off, length = self._index[key]
+        with self._lock:
+            return self._mm[off:off + length]
+
+    # ---------- LazyGame interface ------------------------------------ #
+    @property
+    def name(self) -> str:
+        return self._meta.get("name", "")
+
+    def raw(self, key: str, default=None) -> Any:
+        if key not in KINDS:
+            return self._meta.get(key, default)
+        return [self._item(key, i) for i in range(self._col(key)[0])]
+
+    @property
+    def board_count(self) -> int:
+        return self._col("boards")[0]
+
+    def board_raw(self, i: int) -> Dict[str, Any]:
+        return self._item("boards", i)
+
+    def _entity_raw(self, kind: str, name: str) -> Optional[Dict]:
+        if kind not in self._ids:
+            self._ids[kind] = {n: i for i, n in enumerate(self._names(kind))}
+        i = self._ids[kind].get(name)
+        return None if i is None else self._item(kind, i)
+
+
+# ---------- JSON import / export ---------------------------------------- #
+def json_to_bin(src: str | pathlib.Path, dst: str | pathlib.Path):
+    write_bin(json.loads(pathlib.Path(src).read_text(encoding="utf-8")), dst)
+
+
+def bin_to_json(src: str | pathlib.Path, dst: str | pathlib.Path):
+    with BinGameFile(src) as bg:
+        pathlib.Path(dst).write_text(json.dumps(bg.to_dict(), indent=2),
+                                     encoding="utf-8")
+
+
+def main(argv: Optional[List[str]] = None):
+    args = argv if argv is not None else sys.argv[1:]
+    if not 1 <= len(args) <= 2:
+        sys.exit("usage: python -m game.game_bin SRC [DST]   (.json ⇄ .bgc)")
+    src = pathlib.Path(args[0])
+    to_bin = src.suffix != SUFFIX
+    dst = pathlib.Path(args[1]) if len(args) > 1 else \
+        src.with_suffix(SUFFIX if to_bin else ".json")
+    (json_to_bin if to_bin else bin_to_json)(src, dst)
+    print(f"{src} ({src.stat().st_size:,} B) → {dst} ({dst.stat().st_size:,} B)")
+
+
+if __name__ == "__main__":
+    main()
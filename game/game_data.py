@@ -1,6 +1,6 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import List, Dict, Any
+from dataclasses import dataclass, field
+from typing import Callable, List, Dict, Any, Optional
 
 from .card  import Card
 from .piece import Piece
@@ -11,36 +11,48 @@ from .tile import Tile
 
 
 # ---------- board spec ------------------------------------------------- #
+def section_points(raw: Dict[str, Any]) -> Optional[List]:
+    """A section's polygon; legacy x0..y1 rectangles become 4 points."""
+    if raw.get("points") is None and {"x0", "y0", "x1", "y1"} <= raw.keys():
+        return [(raw["x0"],      raw["y0"]),
+                (raw["x1"] + 1, raw["y0"]),
+                (raw["x1"] + 1, raw["y1"] + 1),
+                (raw["x0"],      raw["y1"] + 1)]
+    return raw.get("points")
+
+
 @dataclass
 class BoardSpec:
     name: str
     width: int
     height: int
     sections: List[Dict[str, Any]]        # raw section dicts
+    storage: str = "dense"                # Board cell layout
+    placed: List[Dict[str, Any]] = field(default_factory=list)   # bottom-first
 
-    def build(self) -> Board:
-        bd = Board(self.width, self.height)
+    def build(self, lookup: Optional[Callable[[Dict], Any]] = None) -> Board:
+        """Create the Board; `lookup(rec)` resolves saved placements."""
+        bd = Board(self.width, self.height, self.storage)
 
         for raw in self.sections:
             # unified accessor helpers
-            pts  = raw.get("points")
+            pts  = section_points(raw)
             kind = raw.get("kind", "Any")
             name = raw.get("name", "Area")
             out  = raw.get("outline", "#808080")
             fill = raw.get("fill", "")
 
-            # legacy rectangle → make a 4-point polygon
-            if pts is None and {"x0", "y0", "x1", "y1"} <= raw.keys():
-                pts = [(raw["x0"],      raw["y0"]),
-                       (raw["x1"] + 1, raw["y0"]),
-                       (raw["x1"] + 1, raw["y1"] + 1),
-                       (raw["x0"],      raw["y1"] + 1)]
-
             bd.add_section(name,
                            SectionType(kind.capitalize()),
                            pts,
                            out,
                            fill)
+
+        for rec in (self.placed if lookup else ()):
+            obj = lookup(rec)
+            if obj is not None:
+                bd.place(rec["x"], rec["y"],
+                         obj.clone() if isinstance(obj, Deck) else obj)
         return bd
 
     def to_dict(self):
@@ -48,7 +60,9 @@ class BoardSpec:
             "name": self.name,
             "w": self.width,
             "h": self.height,
-            "sections": self.sections
+            "sections": self.sections,
+            "storage": self.storage,
+            "placed": self.placed
         }
 
     @classmethod
@@ -58,24 +72,76 @@ class BoardSpec:
         """
         # Extract the board name (should always exist)
         name = d.get("name", "")
+        storage = d.get("storage", "dense")
+        placed = d.get("placed", [])
 
         # Old style:  keys 'w' and 'h'
         if "w" in d and "h" in d:
             w = d["w"]
             h = d["h"]
             secs = d.get("sections", [])
-            return cls(name, w, h, secs)
+            return cls(name, w, h, secs, storage, placed)
 
         # New style: keys 'width' and 'height'
         if "width" in d and "height" in d:
             w = d["width"]
             h = d["height"]
             secs = d.get("sections", [])
-            return cls(name, w, h, secs)
+            return cls(name, w, h, secs, storage, placed)
 
         # Fallback: if someone saved a BoardSpec via to_dict(), 'w' & 'h' should exist.
         # If not, treat it as an empty 8×8 board.
-        return cls(name, 8, 8, d.get("sections", []))
+        return cls(name, 8, 8, d.get("sections", []), storage, placed)
+
+
+# ---------- one saved board (any format) ------------------------------ #
+def board_from_dict(bd) -> Any:
+    """BoardSpec for grid boards; free / tile-grid dicts are kept verbatim."""
+    # 1) Free‐board / tile-grid dict → keep verbatim
+    if isinstance(bd, dict) and bd.get("mode") in ("free", "tilegrid"):
+        return bd
+
+    # 2) Grid board, old style: {'name', 'w', 'h', 'sections'}
+    if isinstance(bd, dict) and "w" in bd and "h" in bd and "sections" in bd:
+        return BoardSpec(bd["name"], bd["w"], bd["h"], bd["sections"],
+                         bd.get("storage", "dense"),
+                         bd.get("placed", []))
+
+    # 3) Grid board, new style: {'name', 'width', 'height', 'sections'}
+    if isinstance(bd, dict) and "width" in bd and "height" in bd and "sections" in bd:
+        return BoardSpec(bd["name"], bd["width"], bd["height"], bd["sections"],
+                         bd.get("storage", "dense"),
+                         bd.get("placed", []))
+
+    # 4) Unexpected format, try BoardSpec.from_dict (legacy)
+    return BoardSpec.from_dict(bd)
+
+
+def _section(raw: Dict[str, Any]) -> Dict[str, Any]:
+    return {"name":    raw.get("name", "Area"),
+            "kind":    SectionType(raw.get("kind", "Any").capitalize()).value,
+            "points":  [list(p) for p in section_points(raw) or []],
+            "outline": raw.get("outline", "#808080"),
+            "fill":    raw.get("fill", "")}
+
+
+def normalize_board(bd: Dict[str, Any]) -> Dict[str, Any]:
+    """Any saved board layout → the canonical one for its mode."""
+    mode = bd.get("mode")
+    if mode == "free":
+        return {"mode": "free", "name": bd.get("name", "Board"),
+                "width": bd["width"], "height": bd["height"],
+                "sections": bd.get("sections", []), "placed": bd.get("placed", [])}
+    if mode == "tilegrid":
+        return {"mode": "tilegrid", "name": bd.get("name", "Tiles"),
+                "shape": bd.get("shape", "rect"),
+                "cols": bd.get("cols"), "rows": bd.get("rows"),
+                "placed": bd.get("placed", [])}
+    spec = board_from_dict(bd)                      # grid, in any of its layouts
+    return {"mode": "grid", "name": spec.name,
+            "width": spec.width, "height": spec.height, "storage": spec.storage,
+            "sections": [_section(s) for s in spec.sections],
+            "placed": spec.placed}
 
 
 # ---------- full game data -------------------------------------------- #
@@ -126,25 +192,7 @@ class GameData:
         tiles = [Tile.from_dict(t) for t in d.get("tiles", [])]
 
         # --- NEW format (grid + free boards mixed) -------------------
-        boards = []
-        for bd in d.get("boards", []):
-            # 1) Free‐board dict (mode:"free") → keep verbatim
-            if isinstance(bd, dict) and bd.get("mode") == "free":
-                boards.append(bd)
-                continue
-
-            # 2) Grid board, old style: {'name', 'w', 'h', 'sections'}
-            if isinstance(bd, dict) and "w" in bd and "h" in bd and "sections" in bd:
-                boards.append(BoardSpec(bd["name"], bd["w"], bd["h"], bd["sections"]))
-                continue
-
-            # 3) Grid board, new style: {'name', 'width', 'height', 'sections'}
-            if isinstance(bd, dict) and "width" in bd and "height" in bd and "sections" in bd:
-                boards.append(BoardSpec(bd["name"], bd["width"], bd["height"], bd["sections"]))
-                continue
-
-            # 4) Unexpected format, try BoardSpec.from_dict (legacy)
-            boards.append(BoardSpec.from_dict(bd))
+        boards = [board_from_dict(bd) for bd in d.get("boards", [])]
 
         # Safety default if nothing found
         if not boards:
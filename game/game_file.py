@@ -0,0 +1,334 @@
+"""
+Lazy loading of saved games.
+
+`GameFile(path)` only skims the file: it finds where each top-level
+section and each board start and collects entity names, which is enough
+to fill the launcher's lists and the board tabs.  Cards, pieces, tokens,
+decks and tiles are decoded and built the first time their collection
+is used – or one at a time through `entity` / `lookup`, which is all a
+board needs – and each board only when it is asked for (e.g. when its
+tab is first shown).
+
+The skim relies on the layout `json.dumps(..., indent=2)` writes – top-
+level keys on lines indented by two spaces, list items by four – which
+JSON strings can't fake since they never contain raw newlines.  Files in
+any other layout are parsed in full once and served from memory.
+
+    >>> gf = GameFile(path)
+    >>> gf.manifest.counts                  # no entity built yet
+    >>> spec = gf.board(0)                  # decodes just that board
+
+`open_game` picks `GameFile` or the binary `game_bin.BinGameFile` by
+the file's magic bytes, so callers don't care which format is on disk.
+"""
+from __future__ import annotations
+import json, os, pathlib, re
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Tuple
+
+from .card      import Card
+from .deck      import Deck
+from .game_data import BoardSpec, GameData, board_from_dict
+from .piece     import Piece
+from .tile      import Tile
+from .token     import Token
+
+# a literal "\n  …" prefix lets `re` jump between candidate lines instead
+# of trying every character, which is what makes the skim cheap
+_TOP  = re.compile(r'\n  "((?:[^"\\]|\\.)*)": ')
+_ITEM = re.compile(r'\n    \{')
+_NAME = re.compile(r'\n      "name": ("(?:[^"\\]|\\.)*")')
+_MODE = re.compile(r'\n      "mode": ("(?:[^"\\]|\\.)*")')
+
+Span = Tuple[int, int]
+
+SUFFIXES = (".json", ".bgc")         # saved game formats, preferred first
+
+_KINDS = {"cards": Card, "pieces": Piece, "tokens": Token, "decks": Deck, "tiles": Tile}
+_KIND_OF = {cls.__name__: kind for kind, cls in _KINDS.items()}
+
+
+@dataclass
+class Manifest:
+    """What a game holds, without building any of it."""
+    name:   str
+    cards:  List[str] = field(default_factory=list)
+    pieces: List[str] = field(default_factory=list)
+    tokens: List[str] = field(default_factory=list)
+    decks:  List[str] = field(default_factory=list)
+    tiles:  List[str] = field(default_factory=list)
+    boards: List[Tuple[str, str]] = field(default_factory=list)    # (name, mode)
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        return {k: len(getattr(self, k))
+                for k in ("cards", "pieces", "tokens", "decks", "tiles", "boards")}
+
+
+def _value(text: str, span: Span) -> Any:
+    """Decode one skimmed value (drops the separator after it)."""
+    return json.loads(text[span[0]:span[1]].rstrip().rstrip(","))
+
+
+class _Named:
+    """name → entity view handed to `Deck.from_dict`, so a deck only
+    builds the cards it holds."""
+
+    def __init__(self, gf: "GameFile", kind: str):
+        self._gf, self._kind = gf, kind
+
+    def __contains__(self, name) -> bool:
+        return self._gf.entity(self._kind, name) is not None
+
+    def __getitem__(self, name):
+        return self._gf.entity(self._kind, name)
+
+
+class LazyGame:
+    """
+    Entity and board caching shared by the lazy loaders.  Subclasses
+    provide `name`, `manifest`, `raw(kind)`, `board_count`,
+    `board_raw(i)` and `_entity_raw(kind, name)`.
+    """
+
+    def __init__(self):
+        self._boards: Dict[int, Any] = {}
+        self._built: Dict[str, Dict[str, Any]] = {}  # kind → name → object
+
+    def board(self, i: int) -> Any:
+        """Board `i` as `GameData` holds it: a BoardSpec or a raw dict."""
+        if i not in self._boards:
+            self._boards[i] = board_from_dict(self.board_raw(i))
+        return self._boards[i]
+
+    # ---------- entities (built on first use) ------------------------ #
+    def _make(self, kind: str, d: Dict) -> Any:
+        if kind == "decks":
+            return Deck.from_dict(d, _Named(self, "cards"))
+        return _KINDS[kind].from_dict(d)
+
+    def entity(self, kind: str, name: str) -> Optional[Any]:
+        """One card / piece / token / deck / tile by name, decoding only
+        that entry while its collection hasn't been built."""
+        built = self._built.setdefault(kind, {})
+        if name in built or kind in self.__dict__:
+            return built.get(name)
+        d = self._entity_raw(kind, name)
+        if d is None:
+            return None
+        obj = built[name] = self._make(kind, d)
+        return obj
+
+    def _collection(self, kind: str) -> List[Any]:
+        built = self._built.setdefault(kind, {})
+        out = [built.pop(d.get("name"), None) or self._make(kind, d)
+               for d in self.raw(kind, [])]
+        self._built[kind] = {o.name: o for o in out}
+        return out
+
+    @cached_property
+    def cards(self) -> List[Card]:
+        return self._collection("cards")
+
+    @cached_property
+    def pieces(self) -> List[Piece]:
+        return self._collection("pieces")
+
+    @cached_property
+    def tokens(self) -> List[Token]:
+        return self._collection("tokens")
+
+    @cached_property
+    def decks(self) -> List[Deck]:
+        return self._collection("decks")
+
+    @cached_property
+    def tiles(self) -> List[Tile]:
+        return self._collection("tiles")
+
+    def lookup(self, rec: Dict) -> Optional[Any]:
+        """Resolve a saved {"type", "name"} placement record."""
+        kind = _KIND_OF.get(rec.get("type"))
+        return self.entity(kind, rec.get("name")) if kind else None
+
+    # ---------- everything ------------------------------------------- #
+    def to_dict(self) -> Dict[str, Any]:
+        """The whole game in the layout `GameData.to_dict()` writes."""
+        d = {"name": self.name}
+        for kind in ("cards", "pieces", "tokens", "decks"):
+            d[kind] = self.raw(kind, [])
+        d["boards"] = [self.board_raw(i) for i in range(self.board_count)]
+        d["tiles"] = self.raw("tiles", [])
+        return d
+
+    def release(self):
+        """Stop holding the file open, keeping what's been read usable, so
+        it can be renamed over (Windows won't while it's open)."""
+
+    def to_game_data(self) -> GameData:
+        boards = [self.board(i) for i in range(self.board_count)] or \
+            [BoardSpec("Main", 8, 8, [])]
+        return GameData(self.name, self.cards, self.pieces, self.tokens,
+                        self.decks, boards, self.tiles)
+
+
+class GameFile(LazyGame):
+    """A saved `.json` game whose parts are built on first use."""
+
+    def __init__(self, path: str | pathlib.Path):
+        super().__init__()
+        self.path = pathlib.Path(path)
+        self._text = self.path.read_text(encoding="utf-8")
+        self._raw: Dict[str, Any] = {}            # decoded top-level values
+        self._spans: Dict[str, Span] = {}
+        self._board_spans: List[Span] = []
+        self._where: Dict[str, Dict[str, int]] = {}  # kind → name → offset
+        self._by_name: Dict[str, Dict[str, Dict]] = {}
+        if not self._skim():                        # not indent=2: parse once
+            self._raw = json.loads(self._text)
+            self._spans.clear(); self._board_spans.clear()
+            self._text = ""
+        self.manifest = self._manifest()
+
+    # ---------- skim ------------------------------------------------ #
+    def _skim(self) -> bool:
+        text = self._text
+        tops = list(_TOP.finditer(text))
+        end = text.rstrip().rfind("}")
+        if not tops or not text.startswith("{\n") or end < 0:
+            return False
+        for m, nxt in zip(tops, tops[1:] + [None]):
+            key = json.loads(f'"{m.group(1)}"')
+            self._spans[key] = (m.end(), nxt.start() + 1 if nxt else end)
+        try:
+            self._raw["name"] = _value(text, self._spans["name"])
+        except (KeyError, ValueError):
+            return False
+        if "boards" in self._spans:
+            lo, hi = self._spans["boards"]
+            starts = [m.start() + 1 for m in _ITEM.finditer(text, lo, hi)]
+            close = text.rfind("]", lo, hi)
+            self._board_spans = list(zip(starts, starts[1:] + [close]))
+        return True
+
+    def _names(self, key: str) -> List[str]:
+        if key in self._raw or key not in self._spans:
+            return [d.get("name", "") for d in self._raw.get(key, [])]
+        lo, hi = self._spans[key]
+        names, where = [], self._where.setdefault(key, {})
+        for m in _NAME.finditer(self._text, lo, hi):
+            n = m.group(1)
+            n = json.loads(n) if "\\" in n else n[1:-1]
+            names.append(n); where[n] = m.start()
+        return names
+
+    def _manifest(self) -> Manifest:
+        boards = []
+        for i in range(self.board_count):
+            if self._board_spans:
+                lo, hi = self._board_spans[i]
+                name = _NAME.search(self._text, lo, hi)
+                mode = _MODE.search(self._text, lo, hi)
+                boards.append((json.loads(name.group(1)) if name else "Board",
+                               json.loads(mode.group(1)) if mode else "grid"))
+            else:
+                b = self._raw["boards"][i]
+                boards.append((b.get("name", "Board"), b.get("mode", "grid")))
+        return Manifest(self.name, self._names("cards"), self._names("pieces"),
+                        self._names("tokens"), self._names("decks"),
+                        self._names("tiles"), boards)
+
+    # ---------- raw access ------------------------------------------ #
+    @property
+    def name(self) -> str:
+        return self._raw["name"]
+
+    def raw(self, key: str, default=None) -> Any:
+        """Decoded top-level value `key` (decoded once, then cached)."""
+        if key not in self._raw:
+            if key not in self._spans:
+                return default
+            self._raw[key] = _value(self._text, self._spans[key])
+        return self._raw[key]
+
+    @property
+    def board_count(self) -> int:
+        if self._board_spans or "boards" in self._spans:
+            return len(self._board_spans)
+        return len(self._raw.get("boards", []))
+
+    def board_raw(self, i: int) -> Dict[str, Any]:
+        """The saved dict of board `i`, decoding only that board."""
+        if "boards" in self._raw or not self._board_spans:
+            return self.raw("boards", [])[i]
+        return _value(self._text, self._board_spans[i])
+
+    def _entity_raw(self, kind: str, name: str) -> Optional[Dict]:
+        pos = self._where.get(kind, {}).get(name)
+        if pos is None:
+            if kind in self._where:
+                return None
+            if kind not in self._by_name:        # not skimmed: index the list
+                self._by_name[kind] = {d.get("name"): d for d in self.raw(kind, [])}
+            return self._by_name[kind].get(name)
+        text = self._text
+        lo = text.rfind("\n    {", 0, pos) + 1
+        hi = text.find("\n    }", pos) + 6
+        return json.loads(text[lo:hi])
+
+
+# ---------- either format ------------------------------------------------ #
+def _is_bin(path: pathlib.Path) -> bool:
+    from .game_bin import MAGIC
+    with open(path, "rb") as fh:
+        return fh.read(len(MAGIC)) == MAGIC
+
+
+def game_path(games_dir: pathlib.Path, name: str) -> pathlib.Path:
+    """The saved file of game `name`, in whichever format exists."""
+    for suffix in SUFFIXES:
+        p = games_dir / f"{name}{suffix}"
+        if p.exists():
+            return p
+    return games_dir / f"{name}{SUFFIXES[0]}"
+
+
+def open_game(path: str | pathlib.Path) -> LazyGame:
+    """
+    A lazy view of the saved game at `path`, JSON or binary, with any
+    unsaved-to-the-file changes from its journal laid on top.
+    """
+    from .journal import journaled
+    path = pathlib.Path(path)
+    if _is_bin(path):
+        from .game_bin import BinGameFile
+        return journaled(BinGameFile(path))
+    return journaled(GameFile(path))
+
+
+def read_game(path: str | pathlib.Path) -> Dict[str, Any]:
+    """The whole saved game at `path` as a `GameData.from_dict` dict."""
+    from .journal import journal_path
+    path = pathlib.Path(path)
+    if _is_bin(path) or journal_path(path).exists():
+        return open_game(path).to_dict()
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def write_game(gd: GameData | Dict[str, Any], path: str | pathlib.Path,
+               suffix: Optional[str] = None):
+    """
+    Save `gd` (or its `to_dict()` form) in the format `suffix` (default:
+    `path`'s own) names.  The file is written beside and renamed over the
+    old one, so a crash mid-write leaves the previous save intact.
+    """
+    path = pathlib.Path(path)
+    if (suffix or path.suffix) == SUFFIXES[1]:
+        from .game_bin import write_bin
+        write_bin(gd, path)
+        return
+    d = gd.to_dict() if isinstance(gd, GameData) else gd
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(d, indent=2), encoding="utf-8")
+    os.replace(tmp, path)
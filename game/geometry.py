@@ -0,0 +1,136 @@
+from __future__ import annotations
+from typing import Dict, List, Tuple
+
+Point = Tuple[float, float]
+
+
+def point_in_polygon(pts: List[Point], x: float, y: float) -> bool:
+    """Even-odd crossing test (the rule `Board` sections have always used)."""
+    inside = False
+    n = len(pts)
+    for i, (xi, yi) in enumerate(pts):
+        xj, yj = pts[(i + 1) % n]
+        if ((yi > y) != (yj > y)) and \
+           (x < (xj - xi) * (y - yi) / (yj - yi + 1e-9) + xi):
+            inside = not inside
+    return inside
+
+
+class Outline:
+    """
+    Polygon compiled once for repeated point tests: bounding box for a
+    cheap reject, then the crossing test over pre-split edges with the
+    slope already divided out (horizontal edges can never cross).
+    """
+    __slots__ = ("points", "box", "_edges")
+
+    def __init__(self, pts: List[Point]):
+        self.points = tuple((x, y) for x, y in pts)
+        xs = [x for x, _ in self.points]; ys = [y for _, y in self.points]
+        self.box = (min(xs), min(ys), max(xs), max(ys))
+        ring = zip(self.points, self.points[1:] + self.points[:1])
+        # same 1e-9 nudge as point_in_polygon so edge pixels agree
+        self._edges = tuple((xi, yi, yj, (xj - xi) / (yj - yi + 1e-9))
+                            for (xi, yi), (xj, yj) in ring if yi != yj)
+
+    def contains(self, x: float, y: float) -> bool:
+        x0, y0, x1, y1 = self.box
+        if not (x0 <= x <= x1 and y0 <= y <= y1):
+            return False
+        inside = False
+        for xi, yi, yj, slope in self._edges:
+            if (yi > y) != (yj > y) and x < slope * (y - yi) + xi:
+                inside = not inside
+        return inside
+
+
+_outlines: Dict[Tuple[Point, ...], Outline] = {}
+
+
+def outline_of(obj) -> Outline | None:
+    """Cached `Outline` of a Token/Piece drawn as its custom `points`;
+    None when it is drawn as a plain box (no points, or it has an image)."""
+    pts = getattr(obj, "points", None)
+    if not pts or len(pts) < 3 or getattr(obj, "image_path", None):
+        return None
+    key = tuple(map(tuple, pts))
+    ol = _outlines.get(key)
+    if ol is None:
+        ol = _outlines[key] = Outline(pts)
+    return ol
+
+
+def _orient(a: Point, b: Point, c: Point) -> float:
+    return (b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0])
+
+
+def polygons_overlap(a: List[Point], b: List[Point]) -> bool:
+    """
+    Narrow phase for two simple polygons in the same frame: True when an
+    edge of one properly crosses an edge of the other, or one lies inside
+    the other.  Edges that merely touch don't count as overlap.
+    """
+    ea = list(zip(a, a[1:] + a[:1]))
+    eb = list(zip(b, b[1:] + b[:1]))
+    for p1, p2 in ea:
+        for q1, q2 in eb:
+            if (_orient(q1, q2, p1) * _orient(q1, q2, p2) < 0 and
+                    _orient(p1, p2, q1) * _orient(p1, p2, q2) < 0):
+                return True
+    # no proper crossing: a boundary piece inside the other polygon catches
+    # grazing / collinear contacts, an inner point catches exact nesting
+    return (_boundary_enters(ea, b) or _boundary_enters(eb, a) or
+            _strictly_inside(b, *_inner_point(a)) or
+            _strictly_inside(a, *_inner_point(b)))
+
+
+def _boundary_enters(edges, pts: List[Point]) -> bool:
+    """Split each edge where it meets `pts`' boundary and test the midpoint
+    of every piece – a piece is either inside, outside or on the boundary."""
+    other = list(zip(pts, pts[1:] + pts[:1]))
+    for (x0, y0), (x1, y1) in edges:
+        dx, dy = x1 - x0, y1 - y0
+        ts = [0.0, 1.0]
+        for (qx0, qy0), (qx1, qy1) in other:
+            ex, ey = qx1 - qx0, qy1 - qy0
+            den = dx * ey - dy * ex
+            if den:
+                t = ((qx0 - x0) * ey - (qy0 - y0) * ex) / den
+                if 0 < t < 1:
+                    ts.append(t)
+            elif dx or dy:                     # parallel: project endpoints
+                for qx, qy in ((qx0, qy0), (qx1, qy1)):
+                    t = ((qx - x0) * dx + (qy - y0) * dy) / (dx * dx + dy * dy)
+                    if 0 < t < 1:
+                        ts.append(t)
+        ts.sort()
+        for t0, t1 in zip(ts, ts[1:]):
+            if t1 - t0 > 1e-9:
+                t = (t0 + t1) / 2
+                if _strictly_inside(pts, x0 + dx * t, y0 + dy * t):
+                    return True
+    return False
+
+
+def _strictly_inside(pts: List[Point], x: float, y: float) -> bool:
+    """Inside and not on the boundary, so shared edges aren't overlap."""
+    for (x0, y0), (x1, y1) in zip(pts, pts[1:] + pts[:1]):
+        tol = 1e-9 * (abs(x1 - x0) + abs(y1 - y0))
+        if (abs(_orient((x0, y0), (x1, y1), (x, y))) <= tol and
+                min(x0, x1) - 1e-9 <= x <= max(x0, x1) + 1e-9 and
+                min(y0, y1) - 1e-9 <= y <= max(y0, y1) + 1e-9):
+            return False
+    return point_in_polygon(pts, x, y)
+
+
+def _inner_point(pts: List[Point]) -> Point:
+    """A point inside `pts` when possible (vertex average, else an edge midpoint
+    nudged inward) – good enough to decide nesting once edges don't cross."""
+    cx = sum(x for x, _ in pts) / len(pts); cy = sum(y for _, y in pts) / len(pts)
+    if point_in_polygon(pts, cx, cy):
+        return cx, cy
+    (x0, y0), (x1, y1) = pts[0], pts[1]
+    mx, my = (x0 + x1) / 2, (y0 + y1) / 2
+    nx, ny = -(y1 - y0) * 1e-3, (x1 - x0) * 1e-3
+    return (mx + nx, my + ny) if point_in_polygon(pts, mx + nx, my + ny) \
+        else (mx - nx, my - ny)
@@ -0,0 +1,324 @@
+"""
+Append-only change journal beside a saved game, so saving writes only
+what changed.
+
+    >>> gf = open_game(path)                  # journal already applied
+    >>> jr = Journal(path, gf)
+    >>> jr.save({"cards": cards, …}, boards)  # appends the deltas
+
+`<game>.journal` holds one JSON line per change since the game file was
+last written in full: an entity put or delete (by kind and key), a
+board put (by position) or a board delete.  `Journal.save` compares the
+editor's entities and board dicts against what was last saved and
+appends just the differences.  The comparison is in memory; the disk
+write is proportional to what changed.
+
+Once the journal outgrows a fraction of the game file it is compacted
+on a worker thread: the full game is written beside the file and
+renamed over it, then the journal restarts.  The first line of a journal
+names the `rev` of the game file it applies to.  Compaction gives the
+file a new `rev` and writes the new journal as `.journal.next` before
+the swap, so after a crash at any point exactly one journal matches the
+game file on disk.
+
+Entities are recorded by `id` where they have one, so two cards that
+share a name stay two cards; decks and tiles, which have no id, go by
+name.  Deletes written before that (by "name") are still honoured.
+"""
+from __future__ import annotations
+import json, os, pathlib, secrets, threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from .game_data import normalize_board
+from .game_file import LazyGame, Manifest, write_game
+
+KINDS = ("cards", "pieces", "tokens", "decks", "tiles")
+
+
+def _state(obj) -> Any:
+    """Something that compares equal while `obj` hasn't changed: its
+    fields when they are all immutable (cheap), else its saved dict."""
+    try:
+        state = tuple(obj.__dict__.items())
+        hash(state)                 # lists etc. could change under us
+        return state
+    except (AttributeError, TypeError):
+        return obj.to_dict()
+
+
+def _key(obj) -> str:
+    """What an entity is recorded under: its `id` where it has one (cards,
+    pieces, tokens), else its name.  Works on objects and saved dicts."""
+    if isinstance(obj, dict):
+        return obj.get("id") or obj.get("name")
+    return getattr(obj, "id", None) or obj.name
+
+
+def journal_path(path: str | pathlib.Path) -> pathlib.Path:
+    path = pathlib.Path(path)
+    return path.with_name(path.name + ".journal")
+
+
+def _next_path(path: pathlib.Path) -> pathlib.Path:
+    return path.with_name(path.name + ".journal.next")
+
+
+def read_journal(path: str | pathlib.Path, rev: Optional[str]) -> List[Dict]:
+    """The changes recorded for the game file at `path` whose rev is
+    `rev`; a torn last line (crash mid-append) is dropped."""
+    path = pathlib.Path(path)
+    for cand in (journal_path(path), _next_path(path)):
+        try:
+            lines = cand.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            continue
+        ops = []
+        for line in lines:
+            try:
+                ops.append(json.loads(line))
+            except ValueError:
+                break
+        if ops and ops[0].get("op") == "base" and ops[0].get("rev") == rev:
+            return ops[1:]
+    return []
+
+
+class Journaled(LazyGame):
+    """A lazy game with journal entries laid over it."""
+
+    def __init__(self, base: LazyGame, ops: Iterable[Dict]):
+        super().__init__()
+        self.base = base
+        self.path = getattr(base, "path", None)
+        # kind → key (see `_key`) → saved dict, or None once deleted
+        self._ents: Dict[str, Dict[str, Optional[Dict]]] = {k: {} for k in KINDS}
+        # kind → names deleted by entries from before keys were ids
+        self._gone: Dict[str, set] = {k: set() for k in KINDS}
+        self._refs: List[Any] = list(range(base.board_count))   # int = base board
+        for op in ops:
+            kind = op.get("op")
+            if kind == "put":
+                self._ents[op["kind"]][_key(op["data"])] = op["data"]
+            elif kind == "del" and "key" in op:
+                self._ents[op["kind"]][op["key"]] = None
+            elif kind == "del":                     # older entry, by name
+                over = self._ents[op["kind"]]
+                for k, d in over.items():
+                    if d is not None and d.get("name") == op["name"]:
+                        over[k] = None
+                self._gone[op["kind"]].add(op["name"])
+            elif kind == "board":
+                if op["i"] < len(self._refs):
+                    self._refs[op["i"]] = op["data"]
+                else:
+                    self._refs.append(op["data"])
+            elif kind == "board_del":
+                del self._refs[op["i"]]
+        man = base.manifest
+        self.manifest = Manifest(
+            man.name, *(self._merged(k, getattr(man, k)) for k in KINDS),
+            [man.boards[r] if isinstance(r, int) else
+             (r.get("name", "Board"), r.get("mode", "grid")) for r in self._refs])
+
+    def _merged(self, kind: str, names: List[str]) -> List[str]:
+        if not self._ents[kind] and not self._gone[kind]:
+            return names
+        return [d.get("name", "") for d in self.raw(kind, [])]   # keys aren't skimmed
+
+    @property
+    def name(self) -> str:
+        return self.base.name
+
+    def raw(self, key: str, default=None) -> Any:
+        if key not in KINDS:
+            return self.base.raw(key, default)
+        over, gone, out, seen = self._ents[key], self._gone[key], [], set()
+        for d in self.base.raw(key, []):
+            if d.get("name") in gone:
+                continue
+            k = _key(d); seen.add(k)
+            d = over.get(k, d)
+            if d is not None:
+                out.append(d)
+        return out + [d for k, d in over.items() if d is not None and k not in seen]
+
+    @property
+    def board_count(self) -> int:
+        return len(self._refs)
+
+    def board_raw(self, i: int) -> Dict[str, Any]:
+        r = self._refs[i]
+        return self.base.board_raw(r) if isinstance(r, int) else r
+
+    def _entity_raw(self, kind: str, name: str) -> Optional[Dict]:
+        over = self._ents[kind]
+        for d in over.values():
+            if d is not None and d.get("name") == name:
+                return d
+        if name in self._gone[kind]:
+            return None
+        d = self.base._entity_raw(kind, name)
+        return None if d is None or _key(d) in over else d    # replaced or deleted
+
+    def release(self):
+        self.base.release()
+
+    def close(self):
+        if hasattr(self.base, "close"):
+            self.base.close()
+
+
+def journaled(game: LazyGame) -> LazyGame:
+    """`game` with its journal applied, or `game` itself if it has none."""
+    ops = read_journal(game.path, game.raw("rev"))
+    return Journaled(game, ops) if ops else game
+
+
+class Journal:
+    """
+    Writes the changes made to `game` (an `open_game` result) from now on.
+    Deltas are taken against `game`'s entities as they are when this is
+    created; boards are compared once the editor hands in their dicts.
+    """
+
+    def __init__(self, path: str | pathlib.Path, game: LazyGame,
+                 compact_ratio: float = 0.5, compact_min: int = 256 * 1024):
+        self.path = pathlib.Path(path)
+        self.game = game
+        self.rev: Optional[str] = game.raw("rev")
+        self.compact_ratio, self.compact_min = compact_ratio, compact_min
+        self._saved: Dict[str, Dict[str, Any]] = {     # kind → _key → _state
+            k: {_key(o): _state(o) for o in getattr(game, k)} for k in KINDS}
+        # saved dict of each board, or its index in `game` until first compared
+        self._boards: List[Any] = list(range(game.board_count))
+        self._pending: List[Dict] = []          # board deletes since last save
+        self._lock = threading.Lock()           # journal file vs compaction
+        self._worker: Optional[threading.Thread] = None
+        self.error: Optional[BaseException] = None      # of the last compaction, until
+                                                        # `save` raises it
+        jp, nxt = journal_path(self.path), _next_path(self.path)
+        if self._matches(nxt):                  # a compaction stopped before its last rename
+            os.replace(nxt, jp)
+        elif nxt.exists():
+            nxt.unlink()
+        fresh = not self._matches(jp)           # none yet, or left from an older file
+        self._fh = open(jp, "w" if fresh else "a", encoding="utf-8")
+        if fresh:
+            self._append([{"op": "base", "rev": self.rev}])
+
+    def _matches(self, jp: pathlib.Path) -> bool:
+        try:
+            with open(jp, encoding="utf-8") as fh:
+                head = json.loads(fh.readline())
+        except (FileNotFoundError, ValueError):
+            return False
+        return head.get("op") == "base" and head.get("rev") == self.rev
+
+    def _append(self, ops: List[Dict]):
+        self._fh.write("".join(json.dumps(op) + "\n" for op in ops))
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+
+    # ---------- recording ------------------------------------------- #
+    def board_deleted(self, i: int):
+        """Board `i` was removed; recorded with the next `save`."""
+        if i < len(self._boards):               # else it was never saved
+            self._pending.append({"op": "board_del", "i": i})
+            del self._boards[i]
+
+    def save(self, entities: Dict[str, List[Any]], boards: List[Any]) -> int:
+        """
+        Append what changed since the last save; returns how many entries
+        that took.  `boards` holds each board's saved dict, or anything
+        else (e.g. None) for boards the editor never opened.  Raises,
+        once this save is on disk, if the last compaction failed.
+        """
+        ops = list(self._pending)
+        current: Dict[str, Dict[str, Any]] = {}
+        for kind in KINDS:
+            saved, objs = self._saved[kind], entities.get(kind, [])
+            cur = current[kind] = {_key(o): _state(o) for o in objs}
+            ops += [{"op": "put", "kind": kind, "data": o.to_dict()}
+                    for o in objs if saved.get(_key(o)) != cur[_key(o)]]
+            ops += [{"op": "del", "kind": kind, "key": k}
+                    for k in saved if k not in cur]
+        puts = [(i, d) for i, d in enumerate(boards)
+                if isinstance(d, dict) and self._board_changed(i, d)]
+        ops += [{"op": "board", "i": i, "data": d} for i, d in puts]
+        with self._lock:
+            if ops:
+                self._append(ops)
+            size = self._fh.tell()
+        # only now that it's on disk
+        self._saved, self._pending = current, []
+        for i, d in puts:
+            if i < len(self._boards):
+                self._boards[i] = d
+            else:
+                self._boards.append(d)
+        err, self.error = self.error, None
+        if err is not None:                     # saved, but the file keeps growing
+            raise RuntimeError(f"compacting {self.path.name} failed: {err}") from err
+        if size > max(self.compact_min, self.compact_ratio * self.path.stat().st_size):
+            self.compact(entities, boards)
+        return len(ops)
+
+    def _board_changed(self, i: int, d: Dict) -> bool:
+        if i >= len(self._boards):
+            return True
+        old = self._boards[i]
+        if isinstance(old, int):                # first look: read what's saved
+            old = self._boards[i] = self.game.board_raw(old)
+        # an editor's dict and an older save can differ only in layout
+        return old != d and normalize_board(old) != normalize_board(d)
+
+    # ---------- compaction ------------------------------------------- #
+    @property
+    def compacting(self) -> bool:
+        return self._worker is not None and self._worker.is_alive()
+
+    def compact(self, entities: Dict[str, List[Any]], boards: List[Any]):
+        """
+        Rewrite the game file in full on a worker thread, from what was
+        just passed to `save`.  Board entries that aren't dicts are board
+        indices into `game`, decoded on the worker.
+        """
+        if self.compacting:
+            return
+        snap = {"name": self.game.name,
+                **{k: [o.to_dict() for o in entities.get(k, [])] for k in KINDS},
+                "boards": list(boards)}
+        with self._lock:
+            start = self._fh.tell()                 # entries after this are newer
+        self._worker = threading.Thread(target=self._compact, args=(snap, start),
+                                        daemon=True)
+        self._worker.start()
+
+    def _compact(self, snap: Dict, start: int):
+        try:
+            snap["boards"] = [b if isinstance(b, dict) else self.game.board_raw(b)
+                              for b in snap["boards"]]
+            rev = snap["rev"] = secrets.token_hex(8)
+            tmp = self.path.with_name(self.path.name + ".compact")
+            write_game(snap, tmp, self.path.suffix)
+            jp, nxt = journal_path(self.path), _next_path(self.path)
+            with self._lock:
+                with open(jp, encoding="utf-8") as fh:
+                    fh.seek(start); newer = fh.read()
+                nxt.write_text(json.dumps({"op": "base", "rev": rev}) + "\n" + newer,
+                               encoding="utf-8")
+                self.game.release()                 # e.g. a mapped .bgc
+                os.replace(tmp, self.path)          # game and .next now agree
+                self._fh.close()
+                os.replace(nxt, jp)
+                self._fh = open(jp, "a", encoding="utf-8")
+                self.rev = rev
+        except Exception as e:                      # keep journaling; `save` reports it
+            self.error = e
+
+    def close(self):
+        """Wait for a running compaction, then close the journal file."""
+        if self._worker is not None:
+            self._worker.join()
+        with self._lock:
+            self._fh.close()
@@ -0,0 +1,214 @@
+"""
+Monte Carlo tree search opponent for play-testing.
+
+`MCTSPlayer` searches for `budget` seconds per move.  Every playout
+starts from `GameEngine.fork()` (copy-on-write board, cloned deck) with
+the remaining deck reshuffled, so the AI can't peek at the draw order;
+tree edges are keyed by move rather than by state ("open loop"), which
+keeps the tree valid across those different draws.  Playouts finish with
+random moves, as in `game.simulate`.
+
+    >>> ai = MCTSPlayer("CPU", budget=0.5)
+    >>> fut = ai.think(engine)          # searches off the calling thread
+    >>> res = fut.result(); res.playouts_per_sec
+
+Turns follow `game.simulate`: the player to move has already drawn, and
+after playing (or passing) the next player draws.
+"""
+from __future__ import annotations
+import math, random, threading, time
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .engine   import GameEngine
+from .moves    import legal_mask
+from .player   import Player
+from .simulate import random_strategy
+
+Move = Tuple[int, int, object]
+HandMove = Tuple[int, int, int]         # (x, y, index into the hand)
+
+
+@dataclass
+class SearchResult:
+    move:     Optional[HandMove]        # None = pass
+    playouts: int
+    elapsed:  float
+    visits:   int = 0                   # playouts through the chosen move
+
+    @property
+    def playouts_per_sec(self) -> float:
+        return self.playouts / self.elapsed if self.elapsed else 0.0
+
+    def resolve(self, player: Player) -> Optional[Move]:
+        """The move with the actual object from `player`'s hand."""
+        if self.move is None:
+            return None
+        x, y, i = self.move
+        return x, y, player.hand[i]
+
+
+class _Node:
+    __slots__ = ("seat", "children", "visits", "value")
+
+    def __init__(self, seat: Optional[int]):
+        self.seat     = seat            # who made the move leading here
+        self.children: Dict[tuple, _Node] = {}
+        self.visits   = 0
+        self.value    = 0.0             # summed reward for `seat`
+
+
+def _advance(eng: GameEngine, move: Optional[Move]):
+    if move is not None:
+        eng.play(*move)
+    eng.end_turn()
+    eng.draw()
+
+
+def _rollout_move(eng: GameEngine, rng: random.Random) -> Optional[Move]:
+    """A few blind random tries, then an exact pick among the legal moves
+    (so crowded boards don't burn the budget on misses)."""
+    move = random_strategy(eng, eng.current_player, rng, tries=4)
+    if move is None and eng.current_player.hand:
+        legal = eng.legal_moves()
+        move = rng.choice(legal) if legal else None
+    return move
+
+
+def _rewards(eng: GameEngine) -> List[float]:
+    win = eng.winner()
+    n = len(eng.players)
+    if win is None:
+        return [1 / n] * n
+    seat = eng.players.index(win)
+    return [float(i == seat) for i in range(n)]
+
+
+class MCTSPlayer(Player):
+    """
+    Computer player: UCT search within `budget` seconds per move, looking
+    at most `horizon` turns ahead.
+    """
+
+    def __init__(self, name: str, budget: float = 1.0, exploration: float = 1.4,
+                 horizon: int = 60, seed=None):
+        super().__init__(name)
+        self.budget      = budget
+        self.exploration = exploration
+        self.horizon     = horizon
+        self.seed        = seed
+        self.last: Optional[SearchResult] = None
+
+    # ---------------------------------------------------------------- #
+    def search(self, engine: GameEngine) -> SearchResult:
+        """Best move for `engine.current_player`; `engine` is not changed."""
+        rng  = random.Random(self.seed)
+        root = _Node(None)
+        t0 = time.perf_counter()
+        deadline, playouts = t0 + self.budget, 0
+        while True:
+            sim = engine.fork()
+            sim.deck.seed(rng.getrandbits(64)); sim.deck.shuffle()
+            node, path, turns = root, [root], 0
+
+            # selection / expansion
+            while turns < self.horizon and not sim.is_over():
+                keys, by_id = self._moves(sim)
+                k = self._untried(node, keys, rng)
+                if k is not None:
+                    node.children[k] = _Node(sim.current_idx)
+                else:
+                    log_n = math.log(node.visits)
+                    k = max(keys, key=lambda k: self._ucb(node.children[k], log_n))
+                node = node.children[k]; path.append(node)
+                _advance(sim, (k[0], k[1], by_id[k[2]]) if k else None)
+                turns += 1
+                if node.visits == 0:
+                    break
+
+            # rollout
+            while turns < self.horizon and not sim.is_over():
+                _advance(sim, _rollout_move(sim, rng))
+                turns += 1
+
+            rewards = _rewards(sim)
+            for n in path:
+                n.visits += 1
+                if n.seat is not None:
+                    n.value += rewards[n.seat]
+            playouts += 1
+            if time.perf_counter() >= deadline:
+                break
+
+        elapsed = time.perf_counter() - t0
+        if not root.children:                   # game already over
+            self.last = SearchResult(None, playouts, elapsed)
+            return self.last
+        k, best = max(root.children.items(), key=lambda kv: kv[1].visits)
+        move = None
+        if k:
+            hand = engine.current_player.hand
+            move = (k[0], k[1], next(i for i, c in enumerate(hand) if id(c) == k[2]))
+        self.last = SearchResult(move, playouts, elapsed, best.visits)
+        return self.last
+
+    @staticmethod
+    def _moves(eng: GameEngine) -> Tuple[List[tuple], Dict[int, object]]:
+        """Edge keys (x, y, id(obj)) of every legal move – [()] if only a
+        pass is possible – and id → object for the current hand."""
+        hand = eng.current_player.hand
+        by_id = {id(o): o for o in hand}
+        if not hand:
+            return [()], by_id
+        ids = [id(o) for o in hand]
+        i, y, x = (a.tolist() for a in np.nonzero(legal_mask(eng, hand)))
+        return list(zip(x, y, map(ids.__getitem__, i))) or [()], by_id
+
+    @staticmethod
+    def _untried(node: _Node, keys: List[tuple], rng: random.Random):
+        """A random legal move with no child yet, or None.  Sampling finds
+        one cheaply while most are untried; the scan covers the rest."""
+        for _ in range(8):
+            k = rng.choice(keys)
+            if k not in node.children:
+                return k
+        fresh = [k for k in keys if k not in node.children]
+        return rng.choice(fresh) if fresh else None
+
+    def _ucb(self, n: _Node, log_parent: float) -> float:
+        return n.value / n.visits + self.exploration * math.sqrt(log_parent / n.visits)
+
+    def choose(self, engine: GameEngine) -> Optional[Move]:
+        """Search now and return (x, y, obj) from the current hand, or None."""
+        return self.search(engine).resolve(engine.current_player)
+
+    def think(self, engine: GameEngine,
+              executor: Optional[Executor] = None) -> "Future[SearchResult]":
+        """
+        Search a fork of `engine` in the background.  Without `executor` a
+        daemon thread is used; pass a `ProcessPoolExecutor` to keep the
+        search off the GIL entirely (the engine class must be importable).
+        Apply the result with `SearchResult.resolve`.
+        """
+        snap = engine.fork()                    # caller may keep playing
+        if executor is not None:
+            return executor.submit(self.search, snap)
+        fut: Future = Future()
+
+        def work():
+            try:
+                fut.set_result(self.search(snap))
+            except BaseException as e:
+                fut.set_exception(e)
+        threading.Thread(target=work, daemon=True).start()
+        return fut
+
+
+# ---------- game.simulate strategy ------------------------------------ #
+def mcts_strategy(engine: GameEngine, player: Player, rng: random.Random,
+                  budget: float = 0.05) -> Optional[Move]:
+    """`game.simulate` strategy: a short MCTS search for every move."""
+    return MCTSPlayer(player.name, budget, seed=rng.getrandbits(32)).choose(engine)
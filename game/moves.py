@@ -0,0 +1,66 @@
+"""
+Bulk legal-move generation: every (object, cell) placement at once.
+
+`legal_mask(engine, objs)` returns a bool array shaped
+(len(objs), HEIGHT, WIDTH).  Section rules come from the board's
+rasterized section table and the engine's `stack_limit` from the stack
+heights, so the common case is a handful of NumPy operations.  A custom
+`can_place` is only called per cell – and only on cells that survived
+the vectorized rules – when the engine doesn't supply `place_mask`.
+
+    >>> moves = legal_moves(engine)            # current player's hand
+    >>> x, y, card = rng.choice(moves)
+"""
+from __future__ import annotations
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from .board  import Board
+from .engine import GameEngine
+
+Move = Tuple[int, int, object]
+
+
+def section_mask(board: Board, objs: Sequence) -> np.ndarray:
+    """(objs × H × W) mask of the cells whose section accepts each object."""
+    h, w = board.HEIGHT, board.WIDTH
+    sec = np.frombuffer(board.section_index(), dtype=np.int32).reshape(h, w)
+    # one row of accept flags per object type; the trailing slot is "no
+    # section", which index -1 picks up
+    rows, row_of = [], {}
+    for obj in objs:
+        t = type(obj)
+        if t not in row_of:
+            row_of[t] = len(rows)
+            rows.append([Board._kind_accepts(s, obj) for s in board.sections]
+                        + [True])
+    if not rows:
+        return np.zeros((0, h, w), dtype=bool)
+    accepts = np.array(rows, dtype=bool)
+    return accepts[[row_of[type(o)] for o in objs]][:, sec]
+
+
+def legal_mask(engine: GameEngine, objs: Sequence) -> np.ndarray:
+    """(objs × H × W) mask of the placements `engine.play` would accept."""
+    board = engine.board
+    mask = section_mask(board, objs)
+    if engine.stack_limit is not None:
+        depth = np.frombuffer(board.depths(), dtype=np.int32)
+        mask &= (depth < engine.stack_limit).reshape(board.HEIGHT, board.WIDTH)
+    if type(engine).can_place is GameEngine.can_place:
+        return mask
+    refined = engine.place_mask(objs, mask)
+    if refined is not None:
+        return refined
+    hit = np.nonzero(mask)                      # per-cell fallback
+    mask[hit] = [engine.can_place(x, y, objs[i])
+                 for i, y, x in zip(*(a.tolist() for a in hit))]
+    return mask
+
+
+def legal_moves(engine: GameEngine, objs: Sequence | None = None) -> List[Move]:
+    """Every legal (x, y, obj) for `objs` (default: current player's hand)."""
+    objs = list(engine.current_player.hand if objs is None else objs)
+    hit = np.nonzero(legal_mask(engine, objs))
+    return [(x, y, objs[i]) for i, y, x in zip(*(a.tolist() for a in hit))]
@@ -7,7 +7,10 @@ class Player:
         self.name = name
         self.hand: List[Card] = []
 
-    def draw(self, deck):
+    def draw(self, deck, n: int = 1):
+        if n != 1:
+            self.hand.extend(deck.draw_many(n))
+            return
         card = deck.draw()
         if card:
             self.hand.append(card)
@@ -0,0 +1,139 @@
+"""
+Append-only action log with checkpoints, for reviewing and replaying a
+session turn by turn.
+
+    >>> log = ActionLog(engine, every=20, path="session.jsonl")
+    >>> ...                                   # play through the engine
+    >>> past = log.seek(137)                  # engine as turn 137 began
+
+Every `GameEngine` action (place, move, draw, shuffle, end_turn) is
+appended as it happens.  Every `every` turns the log keeps a checkpoint –
+an `engine.fork()`, so unchanged board rows and the deck are shared –
+and `seek` restores the nearest one and replays at most `every` turns
+on top.  `end_turn` entries carry the board's Zobrist hash, so a rule
+hook that doesn't replay deterministically is caught at that turn.
+
+With `path`, each action is also written as one JSON line; objects are
+stored as {"type", "name"} records like saved boards, and `load`
+rebuilds the log (and its checkpoints) from such a file.
+"""
+from __future__ import annotations
+import json, pathlib
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .engine import GameEngine
+
+
+@dataclass
+class Action:
+    turn: int
+    seat: int
+    kind: str               # place / move / draw / shuffle / end_turn
+    args: tuple
+
+    def to_dict(self) -> Dict:
+        args = [{"type": type(a).__name__, "name": a.name}
+                if hasattr(a, "name") else a for a in self.args]
+        return {"turn": self.turn, "seat": self.seat, "act": self.kind, "args": args}
+
+    @classmethod
+    def from_dict(cls, d: Dict, lookup: Callable[[Dict], object]) -> "Action":
+        args = tuple(lookup(a) if isinstance(a, dict) else a for a in d["args"])
+        return cls(d["turn"], d["seat"], d["act"], args)
+
+
+def apply(engine: GameEngine, act: Action):
+    """Perform `act` on `engine` through the same calls that recorded it."""
+    if act.kind == "place":
+        engine.play(*act.args)
+    elif act.kind == "move":
+        engine.move(*act.args)
+    elif act.kind == "draw":
+        engine.draw(*act.args)
+    elif act.kind == "shuffle":
+        engine.shuffle(*act.args)
+    elif act.kind == "end_turn":
+        if engine.board.state_hash != act.args[0]:
+            raise RuntimeError(f"replay diverged before the end of turn {act.turn}")
+        engine.end_turn()
+    else:
+        raise ValueError(f"unknown action {act.kind!r}")
+
+
+class ActionLog:
+    """Records `engine`'s actions from now on (attaches itself as `engine.log`)."""
+
+    def __init__(self, engine: GameEngine, every: int = 20,
+                 path: Optional[str | pathlib.Path] = None):
+        self.every   = max(1, every)
+        self.actions: List[Action] = []
+        # (turn, index of its first action, frozen engine fork)
+        self.checkpoints: List[Tuple[int, int, GameEngine]] = []
+        self._turns: List[int] = []                 # checkpoint turns, for bisect
+        self._file = open(path, "a", encoding="utf-8") if path else None
+        self._checkpoint(engine)
+        engine.log = self
+
+    # ---------- recording ------------------------------------------- #
+    def record(self, engine: GameEngine, kind: str, *args):
+        act = Action(engine.turn, engine.current_idx, kind, args)
+        self.actions.append(act)
+        if self._file:
+            self._file.write(json.dumps(act.to_dict()) + "\n")
+            self._file.flush()
+
+    def turn_started(self, engine: GameEngine):
+        if engine.turn % self.every == 0:
+            self._checkpoint(engine)
+
+    def _checkpoint(self, engine: GameEngine):
+        self.checkpoints.append((engine.turn, len(self.actions), engine.fork()))
+        self._turns.append(engine.turn)
+
+    def close(self):
+        if self._file:
+            self._file.close(); self._file = None
+
+    # ---------- replay ---------------------------------------------- #
+    def seek(self, turn: int) -> GameEngine:
+        """A fresh engine in the state it was in as `turn` began."""
+        k = bisect_right(self._turns, turn) - 1
+        if k < 0:
+            raise ValueError(f"turn {turn} is before the log starts")
+        _, i, snap = self.checkpoints[k]
+        eng = snap.fork()
+        for act in self.actions[i:]:
+            if act.turn >= turn:
+                break
+            apply(eng, act)
+        return eng
+
+    def actions_in(self, turn: int) -> List[Action]:
+        """What happened during `turn`, in order."""
+        k = bisect_right(self._turns, turn) - 1
+        start = self.checkpoints[max(k, 0)][1]
+        out = []
+        for act in self.actions[start:]:
+            if act.turn > turn:
+                break
+            if act.turn == turn:
+                out.append(act)
+        return out
+
+    # ---------- file -------------------------------------------------- #
+    @classmethod
+    def load(cls, path: str | pathlib.Path, engine: GameEngine,
+             lookup: Callable[[Dict], object], every: int = 20) -> "ActionLog":
+        """
+        Replay a JSON-lines log onto `engine` (in its starting state),
+        rebuilding checkpoints on the way; `lookup(rec)` resolves object
+        records.  `engine` is left at the end of the log.
+        """
+        log = cls(engine, every)
+        with open(path, encoding="utf-8") as fh:
+            for line in fh:
+                if line.strip():
+                    apply(engine, Action.from_dict(json.loads(line), lookup))
+        return log
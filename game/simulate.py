@@ -0,0 +1,245 @@
+"""
+Headless batch simulation: play thousands of scripted games without Tk.
+
+Each worker process loads the game once, builds the board from its
+`BoardSpec` and then `fork()`s it per game, so a game costs only the
+moves it makes.  Games are dealt to a process pool in chunks and the
+runner yields merged `Stats` as each chunk comes back.
+
+    python -m game.simulate "data/games/Bird of Prey.json" --games 20000
+    python -m game.simulate game.json --scaling      # games/s per core count
+
+Game `i` of a run always uses seed `seed + i` (deck shuffle and player
+choices), so results don't depend on how games land on workers.
+"""
+from __future__ import annotations
+import argparse, importlib, os, pathlib, random, time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from .board     import Board
+from .deck      import Deck
+from .engine    import GameEngine
+from .game_data import BoardSpec, GameData
+from .game_file import read_game
+from .player    import Player
+
+Move = Tuple[int, int, object]
+Strategy = Callable[[GameEngine, Player, random.Random], Optional[Move]]
+
+
+# ---------- scripted players ------------------------------------------ #
+def random_strategy(engine: GameEngine, player: Player,
+                    rng: random.Random, tries: int = 32) -> Optional[Move]:
+    """A random card from hand on a random cell the rules allow (or pass)."""
+    if not player.hand:
+        return None
+    bd = engine.board
+    for _ in range(tries):
+        card = rng.choice(player.hand)
+        x, y = rng.randrange(bd.WIDTH), rng.randrange(bd.HEIGHT)
+        if bd.can_accept(x, y, card) and engine.can_place(x, y, card):
+            return x, y, card
+    return None
+
+
+# ---------- aggregate results ----------------------------------------- #
+@dataclass
+class Stats:
+    players: int
+    games:   int = 0
+    turns:   int = 0
+    draws:   int = 0                            # games with no single winner
+    wins:    List[int]   = field(default_factory=list)     # per seat
+    scores:  List[float] = field(default_factory=list)     # summed per seat
+    elapsed: float = 0.0
+
+    def __post_init__(self):
+        self.wins   = self.wins   or [0] * self.players
+        self.scores = self.scores or [0.0] * self.players
+
+    def merge(self, other: "Stats"):
+        self.games += other.games; self.turns += other.turns
+        self.draws += other.draws
+        self.wins   = [a + b for a, b in zip(self.wins,   other.wins)]
+        self.scores = [a + b for a, b in zip(self.scores, other.scores)]
+
+    @property
+    def games_per_sec(self) -> float:
+        return self.games / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        n = max(self.games, 1)
+        seats = "  ".join(f"P{i + 1} {w / n:6.1%} (avg {s / n:.2f})"
+                          for i, (w, s) in enumerate(zip(self.wins, self.scores)))
+        return (f"{self.games:,} games  {self.turns / n:.1f} turns/game  "
+                f"draws {self.draws / n:.1%}  {self.games_per_sec:,.0f} games/s\n"
+                f"  wins: {seats}")
+
+
+# ---------- one game --------------------------------------------------- #
+@dataclass
+class _Setup:
+    board:    Board
+    deck:     Deck
+    engine:   type
+    strategy: Strategy
+    players:  int
+    hand:     int
+    max_turns: int
+
+
+def _setup(raw: dict, board: Optional[str], deck: Optional[str], engine: type,
+           strategy: Strategy, players: int, hand: int, max_turns: int) -> _Setup:
+    gd = GameData.from_dict(raw)
+    specs = [b for b in gd.boards if isinstance(b, BoardSpec)]
+    spec = next((b for b in specs if b.name == board), None) if board else \
+        (specs[0] if specs else None)
+    if spec is None:
+        raise ValueError(f"no grid board {board!r} in {gd.name!r}" if board
+                         else f"{gd.name!r} has no grid board to simulate on")
+    by_key = {(type(o).__name__, o.name): o
+              for o in (*gd.cards, *gd.pieces, *gd.tokens, *gd.decks)}
+    bd = spec.build(lambda rec: by_key.get((rec.get("type"), rec.get("name"))))
+    if deck:
+        dk = next((d for d in gd.decks if d.name == deck), None)
+        if dk is None:
+            raise ValueError(f"no deck {deck!r} in {gd.name!r}")
+    else:                                       # default: the whole card pool
+        dk = gd.decks[0] if len(gd.decks) == 1 else Deck("All cards", gd.cards)
+    return _Setup(bd, dk, engine, strategy, players, hand, max_turns)
+
+
+def play_game(s: _Setup, seed: int) -> Tuple[int, Optional[int], List[float]]:
+    """Play one game; returns (turns, winning seat or None, scores)."""
+    rng = random.Random(seed)
+    deck = s.deck.clone()
+    deck.seed(seed); deck.shuffle()
+    players = [Player(f"P{i + 1}") for i in range(s.players)]
+    eng = s.engine(players, deck, s.board.fork())
+    deck.deal(players, s.hand)
+    turns = 0
+    while turns < s.max_turns and not eng.is_over():
+        p = eng.current_player
+        eng.draw()
+        move = s.strategy(eng, p, rng)
+        if move:
+            eng.play(*move)
+        eng.end_turn()
+        turns += 1
+    win = eng.winner()
+    return turns, (players.index(win) if win is not None else None), \
+        [eng.score(p) for p in players]
+
+
+# ---------- worker side ------------------------------------------------ #
+_worker: Optional[_Setup] = None
+
+
+def _init(*args):
+    global _worker
+    _worker = _setup(*args)
+
+
+def _chunk(seeds: range) -> Stats:
+    st = Stats(_worker.players)
+    for seed in seeds:
+        turns, win, scores = play_game(_worker, seed)
+        st.games += 1; st.turns += turns
+        if win is None:
+            st.draws += 1
+        else:
+            st.wins[win] += 1
+        st.scores = [a + b for a, b in zip(st.scores, scores)]
+    return st
+
+
+# ---------- runner ----------------------------------------------------- #
+def run(raw: dict, games: int, workers: Optional[int] = None, seed: int = 0,
+        chunk: int = 250, board: Optional[str] = None, deck: Optional[str] = None,
+        engine: type = GameEngine, strategy: Strategy = random_strategy,
+        players: int = 2, hand: int = 5, max_turns: int = 200) -> Iterator[Stats]:
+    """
+    Play `games` games of the saved game `raw` (a GameData dict) across
+    `workers` processes (default: every core; 0 = in this process) and
+    yield the running totals after every finished chunk.  `engine` and
+    `strategy` must be importable top-level objects so workers can load
+    them.
+    """
+    args = (raw, board, deck, engine, strategy, players, hand, max_turns)
+    jobs = [range(s, min(s + chunk, seed + games)) for s in range(seed, seed + games, chunk)]
+    total = Stats(players)
+    t0 = time.perf_counter()
+    if workers == 0:
+        _init(*args)
+        for seeds in jobs:
+            total.merge(_chunk(seeds))
+            total.elapsed = time.perf_counter() - t0
+            yield total
+        return
+    with ProcessPoolExecutor(workers, initializer=_init, initargs=args) as pool:
+        for fut in as_completed([pool.submit(_chunk, seeds) for seeds in jobs]):
+            total.merge(fut.result())
+            total.elapsed = time.perf_counter() - t0
+            yield total
+
+
+def scaling(raw: dict, games: int, counts: Optional[List[int]] = None,
+            **opts) -> Dict[int, float]:
+    """Games/s for each worker count (1, 2, 4 … cores by default)."""
+    cores = os.cpu_count() or 1
+    counts = counts or sorted({1, *(1 << i for i in range(cores.bit_length())), cores})
+    out = {}
+    for w in counts:
+        *_, st = run(raw, games, workers=w, **opts)
+        out[w] = st.games_per_sec
+    return out
+
+
+def scaling_report(rates: Dict[int, float]) -> str:
+    base = rates[min(rates)] / min(rates)      # single-core games/s
+    lines = ["workers   games/s   speed-up   per-core"]
+    for w, r in rates.items():
+        lines.append(f"{w:7}  {r:9,.0f}   {r / base:7.2f}×   {r / base / w:7.0%}")
+    return "\n".join(lines)
+
+
+# ---------- command line ----------------------------------------------- #
+def _load_engine(spec: str) -> type:
+    mod, _, name = spec.partition(":")
+    return getattr(importlib.import_module(mod), name or "GameEngine")
+
+
+def main(argv: Optional[List[str]] = None):
+    ap = argparse.ArgumentParser(prog="python -m game.simulate",
+                                 description="Play scripted games headlessly.")
+    ap.add_argument("game", type=pathlib.Path, help="saved game (.json or .bgc)")
+    ap.add_argument("--games",   type=int, default=10_000)
+    ap.add_argument("--workers", type=int, default=None, help="0 = no pool")
+    ap.add_argument("--players", type=int, default=2)
+    ap.add_argument("--hand",    type=int, default=5)
+    ap.add_argument("--turns",   type=int, default=200, help="turn cap per game")
+    ap.add_argument("--seed",    type=int, default=0)
+    ap.add_argument("--board"); ap.add_argument("--deck")
+    ap.add_argument("--engine",  default="game.engine:GameEngine",
+                    help="module:Class with the rule hooks")
+    ap.add_argument("--scaling", action="store_true",
+                    help="report games/s for 1, 2, 4 … workers")
+    a = ap.parse_args(argv)
+
+    raw = read_game(a.game)
+    opts = dict(board=a.board, deck=a.deck, engine=_load_engine(a.engine),
+                players=a.players, hand=a.hand, max_turns=a.turns, seed=a.seed)
+    if a.scaling:
+        print(scaling_report(scaling(raw, a.games, **opts)))
+        return
+    shown = 0.0
+    for st in run(raw, a.games, a.workers, **opts):
+        if st.elapsed - shown >= 1 or st.games == a.games:
+            shown = st.elapsed
+            print(st.summary(), flush=True)
+
+
+if __name__ == "__main__":
+    main()
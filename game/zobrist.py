@@ -0,0 +1,37 @@
+"""
+64-bit Zobrist-style keys for hashing board state.
+
+Keys are derived from an object's stable identity (its uuid, or its name
+for decks) rather than `id()` or Python's salted `hash()`, so separate
+processes and networked peers compute the same value for the same state.
+"""
+from __future__ import annotations
+from hashlib import blake2b
+from typing import Dict, Tuple
+
+MASK = (1 << 64) - 1
+
+_obj_keys: Dict[Tuple[str, str], int] = {}
+
+
+def _mix(z: int) -> int:
+    """splitmix64 finaliser – spreads every input bit over the output."""
+    z = (z + 0x9E3779B97F4A7C15) & MASK
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK
+    return z ^ (z >> 31)
+
+
+def object_key(obj) -> int:
+    ident = (type(obj).__name__, getattr(obj, "id", None) or obj.name)
+    k = _obj_keys.get(ident)
+    if k is None:
+        digest = blake2b(f"{ident[0]}:{ident[1]}".encode(), digest_size=8)
+        k = _obj_keys[ident] = int.from_bytes(digest.digest(), "little")
+    return k
+
+
+def placement_key(obj, x: int, y: int, depth: int = 0) -> int:
+    """Key for `obj` at (x, y), `depth` levels up its stack."""
+    pos = ((x & 0xFFFFFF) << 40) | ((y & 0xFFFFFF) << 16) | (depth & 0xFFFF)
+    return _mix(object_key(obj) ^ _mix(pos))
@@ -0,0 +1,36 @@
+import random
+
+import pytest
+
+from game.board import Board, SectionType
+from game.geometry import point_in_polygon
+
+
+def _polygon(rng, w, h, snap):
+    coord = rng.randint if snap else rng.uniform     # grid vertices hit ties
+    n = rng.randint(3, 8)
+    return [(coord(-2, w + 2), coord(-2, h + 2)) for _ in range(n)]
+
+
+@pytest.mark.parametrize("snap", [False, True])
+def test_raster_matches_point_in_polygon(snap):
+    rng = random.Random(1234)
+    for _ in range(200):
+        w, h = rng.randint(1, 24), rng.randint(1, 24)
+        bd = Board(w, h)
+        polys = [_polygon(rng, w, h, snap) for _ in range(rng.randint(1, 4))]
+        for i, pts in enumerate(polys):
+            bd.add_section(f"S{i}", SectionType.ANY, pts)
+        table = bd.section_index()
+        for gy in range(h):
+            for gx in range(w):
+                want = next((i for i, pts in enumerate(polys)
+                             if point_in_polygon(pts, gx + .5, gy + .5)), -1)
+                assert table[gy * w + gx] == want, (w, h, gx, gy, polys)
+
+
+def test_raster_follows_added_sections():
+    bd = Board(4, 4)
+    assert list(bd.section_index()) == [-1] * 16
+    bd.add_section("Left", SectionType.CARD, [(0, 0), (2, 0), (2, 4), (0, 4)])
+    assert list(bd.section_index()) == [0, 0, -1, -1] * 4
@@ -0,0 +1,35 @@
+import pathlib
+import pickle
+import shutil
+
+from game.board import Board
+from game.compiled import CompiledGame, artifact_path, compile_game, open_compiled
+from game.game_bin import write_bin
+
+SAMPLE = pathlib.Path(__file__).parent.parent / "data" / "games" / "Bird of Prey.json"
+
+
+class _Payload:
+    def __init__(self, marker):
+        self.marker = marker
+
+    def __reduce__(self):
+        return open, (str(self.marker), "w")
+
+
+def test_planted_pickle_is_never_loaded(tmp_path):
+    path = tmp_path / SAMPLE.name
+    shutil.copy(SAMPLE, path)
+    art = compile_game(path)
+    with CompiledGame(art) as cg:
+        d = {**cg.to_dict(), "compiled": cg.info}
+        extra = {k: cg.section(k) for k in ("images", "images.0")}
+    marker = tmp_path / "ran"
+    extra["board.0"] = pickle.dumps(_Payload(marker))
+    write_bin(d, art, extra=extra)
+
+    with open_compiled(path) as cg:
+        assert artifact_path(path) == art and cg.fresh_for(path)
+        mode, board = cg.built(0)
+    assert not marker.exists()
+    assert mode == "grid" and isinstance(board, Board)
@@ -0,0 +1,91 @@
+import json
+import pathlib
+import threading
+
+import pytest
+
+from game.game_bin import KINDS, BinGameFile, bin_to_json, json_to_bin, write_bin
+
+GAMES = sorted((pathlib.Path(__file__).parent.parent / "data" / "games").glob("*.json"))
+
+
+def _full(d):
+    return {**{k: [] for k in KINDS}, **d}
+
+
+@pytest.mark.parametrize("src", GAMES, ids=lambda p: p.stem)
+def test_sample_games_round_trip(src, tmp_path):
+    bgc, back = tmp_path / "game.bgc", tmp_path / "game.json"
+    json_to_bin(src, bgc)
+    bin_to_json(bgc, back)
+    assert json.loads(back.read_text(encoding="utf-8")) == \
+        _full(json.loads(src.read_text(encoding="utf-8")))
+
+    again = tmp_path / "again.bgc"
+    json_to_bin(back, again)
+    assert again.read_bytes() == bgc.read_bytes()
+
+
+def test_values_round_trip(tmp_path):
+    values = {
+        "ints":    [0, -1, (1 << 31) - 1, -(1 << 31)],
+        "wide":    [1 << 31, -(1 << 63), (1 << 63) - 1],
+        "big":     [1 << 64, -(1 << 80)],
+        "floats":  [0.0, -2.5, 1e300, 1 / 3],
+        "mixed":   [1, "a", None, True, False, 2.5, [], {}],
+        "strs":    ["", "é", "🃏", "a\nb"],
+        "points":  [[0, 0], [-3, 7], [1 << 20, -(1 << 20)]],
+        "fpoints": [[0.5, 1], [2, 3.25]],
+        "nested":  [[[1, 2], [3]], [{"k": [None]}], {"deep": {"er": [[]]}}],
+        "table":   [{"x": 1, "y": 2, "name": "A"}, {"x": -1, "y": 1 << 40, "name": None}],
+        "ragged":  [{"x": 1}, {"y": 2}],
+        "empty":   [],
+        "bool":    True,
+    }
+    d = _full({"name": "Values",
+               "cards": [{"id": "c1", "name": "Twin", "attack": 1 << 70},
+                         {"id": "c2", "name": "Twin", "description": None}],
+               "boards": [{"mode": "free", "name": "Free", "width": 640,
+                           "height": 480, "sections": [], "placed": [],
+                           "extra": values}]})
+    path = tmp_path / "values.bgc"
+    write_bin(d, path)
+    with BinGameFile(path) as bg:
+        # as JSON text, so True vs 1, 1.0 vs 1 and key order all count
+        back = bg.to_dict()
+        assert back.keys() == d.keys()
+        for k in d:
+            assert json.dumps(back[k]) == json.dumps(d[k]), k
+
+
+
+
+
+def test_release_waits_for_readers(tmp_path):
+    src = next(p for p in GAMES if p.stem == "Bird of Prey")
+    path = tmp_path / "game.bgc"
+    json_to_bin(src, path)
+    want = json.loads(src.read_text(encoding="utf-8"))["boards"][0]
+    inside, go = threading.Event(), threading.Event()
+
+    with BinGameFile(path) as bg:
+        string = bg._string
+
+        def slow_string(i):                 # park the reader mid-decode
+            inside.set(); go.wait(5)
+            return string(i)
+        bg._string = slow_string
+
+        out = []
+        reader = threading.Thread(target=lambda: out.append(bg.board_raw(0)))
+        reader.start()
+        assert inside.wait(5)
+        releaser = threading.Thread(target=bg.release)      # as compaction does
+        releaser.start()
+        releaser.join(0.2)
+        assert releaser.is_alive()          # waits for the decode to finish
+        go.set()
+        reader.join(5); releaser.join(5)
+        assert out == [want]
+        del bg._string
+        assert bg.board_raw(0) == want      # read from the in-memory copy
@@ -0,0 +1,84 @@
+import json
+import pathlib
+
+import pytest
+
+from game.card import Card
+from game.game_file import open_game, write_game
+from game.journal import KINDS, Journal, journal_path
+
+SAMPLE = pathlib.Path(__file__).parent.parent / "data" / "games" / "Bird of Prey.json"
+
+
+@pytest.fixture(params=[".json", ".bgc"])
+def path(request, tmp_path):
+    p = tmp_path / f"game{request.param}"
+    write_game(json.loads(SAMPLE.read_text(encoding="utf-8")), p)
+    return p
+
+
+def _entities(game):
+    return {k: list(getattr(game, k)) for k in KINDS}
+
+
+def _close(game):
+    if hasattr(game, "close"):
+        game.close()
+
+
+def _contents(path):
+    game = open_game(path)
+    d = game.to_dict()
+    _close(game)
+    return {k: d[k] for k in (*KINDS, "boards")}
+
+
+def _expected(ents, boards):
+    return {**{k: [o.to_dict() for o in objs] for k, objs in ents.items()},
+            "boards": boards}
+
+
+def test_save_reopen_compact_reopen(path):
+    game = open_game(path)
+    jr = Journal(path, game)
+    ents = _entities(game)
+    boards = [game.board_raw(i) for i in range(game.board_count)]
+    assert len(boards) == 3 and ents["pieces"]
+
+    # edit, add a card sharing a name, delete a piece, and change / drop boards
+    ents["cards"][0].attack += 5
+    ents["cards"].append(Card.new(ents["cards"][0].name, defense=2))
+    ents["pieces"] = []
+    boards[0] = {**boards[0], "name": "Renamed"}
+    jr.board_deleted(1); del boards[1]
+    assert jr.save(ents, [boards[0], None]) == 5
+    assert jr.save(ents, [boards[0], None]) == 0        # nothing new
+    jr.close(); _close(game)
+
+    want = _expected(ents, boards)
+    assert _contents(path) == want
+
+    game = open_game(path)
+    jr = Journal(path, game)
+    jr.compact(_entities(game), list(range(game.board_count)))
+    jr._worker.join()
+    assert jr.error is None
+    lines = journal_path(path).read_text(encoding="utf-8").splitlines()
+    assert [json.loads(ln)["op"] for ln in lines] == ["base"]
+
+    # the journal keeps working against the rewritten file
+    ents = _entities(game)
+    ents["tokens"][0].description = "after compaction"
+    assert jr.save(ents, [None, None]) == 1
+    jr.close(); _close(game)
+
+    want["tokens"] = [o.to_dict() for o in ents["tokens"]]
+    assert _contents(path) == want
+
+
+def test_unchanged_game_saves_nothing(path):
+    game = open_game(path)
+    jr = Journal(path, game)
+    boards = [game.board_raw(i) for i in range(game.board_count)]
+    assert jr.save(_entities(game), boards) == 0
+    jr.close(); _close(game)
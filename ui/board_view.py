@@ -6,11 +6,12 @@ from tkinter import ttk, simpledialog, colorchooser, messagebox
 from typing import Dict, List, Tuple
 
 from PIL import Image, ImageTk
-from game.board  import Board, SectionType
+from game.board  import Board, BatchResult, SectionType
 from game.card   import Card
 from game.piece  import Piece
 from game.token  import Token
 from game.deck   import Deck
+from game.geometry import outline_of
 from ui.view.zoom import ZoomMixin           # ← fixed import
 
 # -------------------------------------------------------------------- #
@@ -36,6 +37,7 @@ class BoardView(ZoomMixin, tk.Canvas):        # ← inherit mix-in first
         self.img_dir = img_dir
         self._bind_zoom()                # now resolves via ZoomMixin
         self.board_name = "Board"        # overwritten by play_window.py
+        self.on_change = None            # called after each edit (creator autosave)
         self._cache: Dict[str, ImageTk.PhotoImage] = {}
         self._preview_cache: Dict[str, ImageTk.PhotoImage] = {}
 
@@ -75,10 +77,9 @@ class BoardView(ZoomMixin, tk.Canvas):        # ← inherit mix-in first
     def _redraw_all(self):
         self.delete("all")
         self._grid(); self._sections()
-        for row in self.board.grid:
-            for cell in row:
-                for i, obj in enumerate(cell.stack):
-                    self._draw_obj(cell.x, cell.y, obj, i * OFFSET)
+        for cell in self.board.occupied():
+            for i, obj in enumerate(cell.stack):
+                self._draw_obj(cell.x, cell.y, obj, i * OFFSET)
 
     def _grid(self):
         for x in range(self.board.WIDTH + 1):
@@ -143,6 +144,19 @@ class BoardView(ZoomMixin, tk.Canvas):        # ← inherit mix-in first
         """True if grid coordinates are inside the board."""
         return 0 <= gx < self.board.WIDTH and 0 <= gy < self.board.HEIGHT
 
+    def _hits_top(self, ev, gx: int, gy: int) -> bool:
+        """Is the pointer on the top object of (gx, gy)?  Custom-shaped
+        tokens/pieces are tested against their outline, the rest by cell."""
+        stack = self.board.stack(gx, gy)
+        if not stack:
+            return False
+        top = stack[-1]
+        shape = outline_of(top)
+        if shape is None:
+            return True
+        off = (len(stack) - 1) * OFFSET          # same origin as _draw_obj
+        return shape.contains(ev.x - gx * CELL - off, ev.y - gy * CELL - off)
+
     # ================================================================ #
     #  Mouse handlers                                                  #
     # ================================================================ #
@@ -153,12 +167,12 @@ class BoardView(ZoomMixin, tk.Canvas):        # ← inherit mix-in first
         tool = self.mode.get()
 
         if tool == "erase":
-            if self.board.remove_top(gx, gy):
-                self._redraw_all()
+            if self._hits_top(ev, gx, gy) and self.board.remove_top(gx, gy):
+                self._redraw_all(); self._edited()
             return
 
         if tool == "move":
-            if self.board.grid[gy][gx].stack:
+            if self._hits_top(ev, gx, gy):
                 self.drag_src = (gx, gy)
             return
 
@@ -169,7 +183,7 @@ class BoardView(ZoomMixin, tk.Canvas):        # ← inherit mix-in first
             placed = self.board.place(gx, gy,
                                        sel.clone() if isinstance(sel, Deck) else sel)
             if placed:
-                self._redraw_all()
+                self._redraw_all(); self._edited()
                 # ── broadcast placement ──────────────────────────── #
                 self._broadcast_place(sel, gx, gy)
 
@@ -184,12 +198,33 @@ class BoardView(ZoomMixin, tk.Canvas):        # ← inherit mix-in first
             obj = self.board.remove_top(gx0, gy0)
             if obj and self.board.place(gx1, gy1, obj):
                 self.drag_src = (gx1, gy1)
-                self._redraw_all()
+                self._redraw_all(); self._edited()
 
     def _drop(self, _ev):
         self.drag_src = None
 
     # ---------------------------------------------------------------- #
+    def place_many(self, items, drop_rejected: bool = False) -> BatchResult:
+        """
+        Place a batch of (gx, gy, obj) with one validation pass and one
+        redraw.  By default the batch is all-or-nothing; `drop_rejected`
+        applies whatever is valid instead (used for network bursts).
+        """
+        items = list(items)
+        res = self.board.place_many(items)
+        if res.rejected and drop_rejected:
+            bad = {r.index for r in res.rejected}
+            res = BatchResult(self.board.place_many(
+                      it for i, it in enumerate(items) if i not in bad).applied,
+                      res.rejected)
+        if res.applied:
+            self._redraw_all(); self._edited()
+        return res
+
+    def _edited(self):
+        if self.on_change:
+            self.on_change()
+
     def _broadcast_place(self, sel, gx, gy):
         root  = self.winfo_toplevel()
         out_q = getattr(root, "out_q", None)
@@ -207,10 +242,9 @@ class BoardView(ZoomMixin, tk.Canvas):        # ← inherit mix-in first
         gx, gy = ev.x // CELL, ev.y // CELL
         if not self._in_bounds(gx, gy):
             return
-        cell = self.board.grid[gy][gx]
-        if not cell.stack:
+        if not self._hits_top(ev, gx, gy):
             return
-        top = cell.stack[-1]
+        top = self.board.stack(gx, gy)[-1]
 
         if isinstance(top, Deck):
             menu = tk.Menu(self, tearoff=0)
@@ -225,11 +259,12 @@ class BoardView(ZoomMixin, tk.Canvas):        # ← inherit mix-in first
             menu.add_separator()
             menu.add_command(label="Delete",
                              command=lambda x=gx, y=gy:
-                                        (self.board.remove_top(x, y), self._redraw_all()))
+                                        (self.board.remove_top(x, y), self._redraw_all(),
+                                         self._edited()))
             menu.tk_popup(ev.x_root, ev.y_root)
             return
 
-        self.board.remove_top(gx, gy); self._redraw_all()
+        self.board.remove_top(gx, gy); self._redraw_all(); self._edited()
     
     def _draw_card(self, deck: Deck, gx: int, gy: int):
         if not deck.cards:
@@ -244,9 +279,8 @@ class BoardView(ZoomMixin, tk.Canvas):        # ← inherit mix-in first
                             parent=top)
         self.winfo_toplevel().selected_obj = card      # cursor-preview & place
         if deck.cards:
-            cell = self.board.grid[gy][gx]
-            if deck not in cell.stack:       # avoid duplicate pile
-                self.board.place(gx, gy, deck)
+            if deck not in self.board.stack(gx, gy):   # avoid duplicate pile
+                self.board.place(gx, gy, deck); self._edited()
         self._redraw_all()
 
     # ================================================================ #
@@ -345,7 +379,12 @@ class BoardView(ZoomMixin, tk.Canvas):        # ← inherit mix-in first
         )
 
         self._reset_sec_binds()
-        self._redraw_all()
+        self._redraw_all(); self._edited()
+
+    def sections_changed(self):
+        """SectionCatalog callback – sections were edited in place."""
+        self.board.invalidate_sections()
+        self._redraw_all(); self._edited()
 
     def _reset_sec_binds(self):
         self.sec_start = None
@@ -1,13 +1,17 @@
 # ui/creator_window.py
 from __future__ import annotations
-import json, pathlib, tkinter as tk
+import copy, dataclasses, pathlib, tkinter as tk
 from tkinter import ttk, simpledialog, messagebox
 from typing import List, Dict, Any
 
 from game import Card, Piece, Token, Deck
 from game.tile         import Tile
 from game.board        import SectionType
-from game.game_data    import GameData, BoardSpec
+from game.board_store  import BIG, pick_storage
+from game.game_data    import BoardSpec
+from game.game_file    import game_path, open_game
+from game.journal      import Journal
+from game.autosave     import Autosaver
 from game.free_board   import FreeBoard
 
 from ui.board_view      import BoardView
@@ -20,6 +24,7 @@ from ui.catalog_view    import CatalogViewer
 from ui.section_catalog import SectionCatalog
 from ui.tile_editor     import TileEditor
 from ui.tile_catalog    import TileCatalog
+from ui.deck_odds       import DeckOdds
 
 # ------------------------------------------------------------------ #
 def open_creator(games_dir: pathlib.Path,
@@ -27,18 +32,21 @@ def open_creator(games_dir: pathlib.Path,
                  game_name: str):
 
     # ---------- load ---------------------------------------------- #
-    path = games_dir / f"{game_name}.json"
-    gd   = GameData.from_dict(json.loads(path.read_text()))
+    path = game_path(games_dir, game_name)
+    gf   = open_game(path)                # boards are decoded when first shown
+    journal = Journal(path, gf)           # saves append only what changed
+    deleted : List[int] = []              # board deletions since the last snapshot
 
-    root = tk.Toplevel(); root.title(f"Creator – {gd.name}")
+    root = tk.Toplevel(); root.title(f"Creator – {gf.name}")
 
     # ---------- working copies ------------------------------------ #
-    cards  : List[Card]  = list(gd.cards)
-    pieces : List[Piece] = list(gd.pieces)
-    tokens : List[Token] = list(gd.tokens)
-    decks  : List[Deck]  = list(gd.decks)
-    tiles  : List[Tile]  = list(gd.tiles)
-    boards : List[Any]   = list(gd.boards)   # BoardSpec *or* dict
+    cards  : List[Card]  = list(gf.cards)
+    pieces : List[Piece] = list(gf.pieces)
+    tokens : List[Token] = list(gf.tokens)
+    decks  : List[Deck]  = list(gf.decks)
+    tiles  : List[Tile]  = list(gf.tiles)
+    # BoardSpec *or* dict – or the board's index in `gf` until first shown
+    boards : List[Any]   = list(range(gf.board_count))
 
     # ---------- sidebar ------------------------------------------- #
     side = ttk.Frame(root, padding=6); side.grid(row=0, column=0, sticky="ns")
@@ -53,10 +61,32 @@ def open_creator(games_dir: pathlib.Path,
     # ---------- notebook of boards -------------------------------- #
     nb_board = ttk.Notebook(root); nb_board.grid(row=0, column=1, sticky="nsew")
     root.columnconfigure(1, weight=1); root.rowconfigure(0, weight=1)
-    board_views: List[tk.Canvas] = []
+    board_views: List[tk.Canvas | None] = []     # None until first shown
 
-    # ---------- helper to add tabs -------------------------------- #
+    # ---------- helpers to add / build tabs ------------------------ #
     def _add_board_tab(bs):
+        frm = ttk.Frame(nb_board)
+        nb_board.add(frm, text=bs.get("name", "Board") if isinstance(bs, dict) else bs.name)
+        board_views.append(_build_view(bs, frm))
+        autosave.mark_dirty()
+
+    def _view(idx):
+        if board_views[idx] is None:
+            boards[idx] = _restore(gf.board(boards[idx]))
+            frm = nb_board.nametowidget(nb_board.tabs()[idx])
+            board_views[idx] = _build_view(boards[idx], frm)
+        return board_views[idx]
+
+    def _restore(bs):
+        """A loaded grid board, with storage suited to how full it is."""
+        if isinstance(bs, BoardSpec):
+            filled = len({(r["x"], r["y"]) for r in bs.placed})
+            storage = pick_storage(bs.width, bs.height, filled)
+            if storage != bs.storage and bs.width * bs.height >= BIG:   # small: as saved
+                bs = dataclasses.replace(bs, storage=storage)
+        return bs
+
+    def _build_view(bs, frm):
         if isinstance(bs, dict) and bs.get("mode") == "free":
             fb = FreeBoard(bs["width"], bs["height"], [], bs["sections"])
             for rec in bs.get("placed", []):
@@ -66,46 +96,53 @@ def open_creator(games_dir: pathlib.Path,
                        next((d for d in decks  if d.name == rec["name"]), None))
                 if obj: fb.add(obj, rec["x"], rec["y"])
 
-            frm  = ttk.Frame(nb_board)
             view = FreeBoardView(frm, fb, img_dir); view.pack(fill="both", expand=True)
             view.board_name = bs.get("name", "Board")
-            nb_board.add(frm, text=view.board_name); board_views.append(view)
 
         elif isinstance(bs, dict) and bs.get("mode") == "tilegrid":
-            frm  = ttk.Frame(nb_board)
             view = TileGridView(frm, tiles, bs["cols"], bs["rows"],
                     img_dir, shape=bs.get("shape", "rect"))
             view.pack(fill="both", expand=True)
             view.board_name = bs.get("name", "Tiles")
-            nb_board.add(frm, text=view.board_name); board_views.append(view)
 
         else:  # classic grid
-            frm  = ttk.Frame(nb_board)
-            view = BoardView(frm, bs.build(), img_dir)
+            by_key = {(type(o).__name__, o.name): o
+                      for seq in (cards, pieces, tokens, decks) for o in seq}
+            view = BoardView(frm, bs.build(lambda r: by_key.get((r["type"], r["name"]))),
+                             img_dir)
             view.pack(fill="both", expand=True)
             view.board_name = bs.name
-            nb_board.add(frm, text=view.board_name); board_views.append(view)
+        view.on_change = lambda: autosave.mark_dirty()     # edits on the board
+        return view
 
-    for b in boards:
-        _add_board_tab(b)
+    for name, _mode in gf.manifest.boards:
+        nb_board.add(ttk.Frame(nb_board), text=name); board_views.append(None)
+    nb_board.bind("<<NotebookTabChanged>>",
+                  lambda e: nb_board.tabs() and _view(nb_board.index("current")))
+    if board_views:
+        _view(0)
 
     # ---------- editors (cards / pieces / …) ----------------------- #
     editors = ttk.Notebook(root); editors.grid(row=0, column=2, sticky="n")
-    editors.add(CardEditor (editors, img_dir, lambda c:(cards.append(c), _refresh())), text="Card")
-    editors.add(PieceEditor(editors, img_dir, lambda p:(pieces.append(p),_refresh())), text="Piece")
-    editors.add(TokenEditor(editors, img_dir, lambda t:(tokens.append(t),_refresh())), text="Token")
-    editors.add(TileEditor (editors, img_dir, lambda t:(tiles.append(t), _refresh())), text="Tile")
+    editors.add(CardEditor (editors, img_dir, lambda c:(cards.append(c), _changed())), text="Card")
+    editors.add(PieceEditor(editors, img_dir, lambda p:(pieces.append(p),_changed())), text="Piece")
+    editors.add(TokenEditor(editors, img_dir, lambda t:(tokens.append(t),_changed())), text="Token")
+    editors.add(TileEditor (editors, img_dir, lambda t:(tiles.append(t), _changed())), text="Tile")
 
     # ---------- list refresh helper -------------------------------- #
     def _refresh():
         for lb, seq in ((lbC, cards), (lbP, pieces), (lbT, tokens),
                         (lbD, decks), (lbTi, tiles)):
-            lb.delete(0, "end"); [lb.insert("end", o.name) for o in seq]
+            lb.delete(0, "end")
+            if seq: lb.insert("end", *(o.name for o in seq))
     _refresh()
 
+    def _changed():
+        _refresh(); autosave.mark_dirty()
+
     # ---------- current-view convenience --------------------------- #
     def _cur_view():
-        idx = nb_board.index(nb_board.select()); return board_views[idx]
+        idx = nb_board.index(nb_board.select()); return _view(idx)
 
     # ---------- sidebar buttons ------------------------------------ #
     ttk.Button(side, text="New Deck", command=lambda:_new_deck()).pack(fill="x", pady=(2,4))
@@ -121,11 +158,13 @@ def open_creator(games_dir: pathlib.Path,
             root,
             (_cur_view().board.sections if hasattr(_cur_view(), "board")
                                        else _cur_view().fb.sections),
-            (_cur_view()._redraw_all    if hasattr(_cur_view(), "_redraw_all")
-                                       else _cur_view()._redraw)
+            (_cur_view().sections_changed if hasattr(_cur_view(), "sections_changed")
+                                           else _cur_view()._redraw)
         )).pack(fill="x", pady=(2,4))
     ttk.Button(side, text="Tiles",
-               command=lambda: TileCatalog(root, tiles, _refresh))\
+               command=lambda: TileCatalog(root, tiles, _changed))\
+        .pack(fill="x", pady=(2,4))
+    ttk.Button(side, text="Deck Odds", command=lambda:_deck_odds())\
         .pack(fill="x", pady=(2,4))
 
     # ---------- delete-board button (now on sidebar) --------------- #
@@ -133,15 +172,18 @@ def open_creator(games_dir: pathlib.Path,
     def _del_board():
         if not nb_board.tabs(): return
         idx = nb_board.index(nb_board.select())
+        del boards[idx]; del board_views[idx]      # before forget() re-selects
+        deleted.append(idx); autosave.mark_dirty()
         nb_board.forget(idx)
-        del boards[idx]; del board_views[idx]
     ttk.Button(side, text="🗑 Delete Board",
                style="Danger.TButton",
                command=_del_board).pack(fill="x", pady=(2,4))
 
-    ttk.Button(side, text="Save Game", command=lambda:_save())\
+    ttk.Button(side, text="Save Game", command=lambda:autosave.save_now())\
         .pack(fill="x", pady=(10,2))
-    ttk.Button(side, text="Close", command=root.destroy).pack(fill="x")
+    ttk.Button(side, text="Close", command=lambda:_close()).pack(fill="x")
+    save_status = tk.StringVar(value="")
+    ttk.Label(side, textvariable=save_status, wraplength=160).pack(anchor="w")
 
     # ---------- deck creator --------------------------------------- #
     def _new_deck():
@@ -152,10 +194,16 @@ def open_creator(games_dir: pathlib.Path,
         [lb.insert("end", c.name) for c in cards]
         def done():
             chosen = [cards[i] for i in lb.curselection()]
-            decks.append(Deck(name, chosen)); _refresh(); dlg.destroy()
+            decks.append(Deck(name, chosen)); _changed(); dlg.destroy()
         tk.Button(dlg, text="Create Deck", command=done).pack(pady=6)
         dlg.transient(root); dlg.grab_set(); dlg.wait_window()
 
+    def _deck_odds(_e=None):
+        deck = root.selected_obj
+        if not isinstance(deck, Deck):
+            messagebox.showinfo("Deck Odds", "Select a deck first.", parent=root); return
+        DeckOdds(root, deck)
+
     # ---------- create new board ----------------------------------- #
     def _new_board():
         bname = simpledialog.askstring("Board Name", "Board name:", parent=root)
@@ -168,7 +216,8 @@ def open_creator(games_dir: pathlib.Path,
             w = simpledialog.askinteger("Columns", "Width:",  minvalue=1, initialvalue=8, parent=root)
             h = simpledialog.askinteger("Rows",    "Height:", minvalue=1, initialvalue=8, parent=root)
             if w and h:
-                spec = BoardSpec(bname, w, h, [])
+                # empty for now: only occupied cells once a grid gets heavy
+                spec = BoardSpec(bname, w, h, [], pick_storage(w, h))
                 boards.append(spec); _add_board_tab(spec)
 
         elif style == "free":
@@ -190,22 +239,32 @@ def open_creator(games_dir: pathlib.Path,
                 boards.append(tg); _add_board_tab(tg)
 
     # ---------- save ----------------------------------------------- #
-    def _save():
+    # the snapshot is taken here on the Tk thread (lists copied, boards as
+    # fresh dicts); diffing and writing happen on the autosave worker
+    def _snapshot():
         boards_out: List[Dict[str,Any]] = []
         for idx, view in enumerate(board_views):
             tab_name = nb_board.tab(nb_board.tabs()[idx], "text")
 
-            if isinstance(view, BoardView):              # grid
+            if view is None:                             # never opened: unchanged
+                boards_out.append(boards[idx])
+
+            elif isinstance(view, BoardView):              # grid
                 bd = view.board
                 boards_out.append({
                     "mode":"grid","name":tab_name,
                     "width":bd.WIDTH,"height":bd.HEIGHT,
+                    "storage":bd.storage,
                     "sections":[{"name":getattr(s,"name",tab_name),
                                  "kind":  s.kind.value,
-                                 "points":s.points,
+                                 "points":[list(p) for p in s.points],
                                  "outline":getattr(s,"outline","#808080"),
                                  "fill":   getattr(s,"fill","")}
-                                for s in bd.sections]
+                                for s in bd.sections],
+                    # occupied cells only – sparse boards never touch empty area
+                    "placed":[{"type":type(o).__name__, "name":o.name,
+                               "x":cell.x, "y":cell.y}
+                              for cell in bd.occupied() for o in cell.stack]
                 })
 
             elif isinstance(view, FreeBoardView):        # free
@@ -213,7 +272,7 @@ def open_creator(games_dir: pathlib.Path,
                 boards_out.append({
                     "mode":"free","name":tab_name,
                     "width":fb.width,"height":fb.height,
-                    "sections":fb.sections,
+                    "sections":copy.deepcopy(fb.sections),
                     "placed":[{"type":type(p.obj).__name__,
                                "name":p.obj.name, "x":p.x,"y":p.y}
                               for p in fb.placed]
@@ -227,14 +286,38 @@ def open_creator(games_dir: pathlib.Path,
                         if t: placed.append({"name":t.name,"row":r,"col":c})
                 boards_out.append({
                     "mode":"tilegrid","name":tab_name,
-                    "shape":tg.tileset[0].shape if tg.tileset else "hex",
+                    "shape":tg.shape,
                     "cols":tg.cols,"rows":tg.rows,"placed":placed
                 })
 
-        gd.cards, gd.pieces, gd.tokens, gd.tiles, gd.decks, gd.boards = \
-            cards,    pieces,    tokens,    tiles,   decks, boards_out
-        path.write_text(json.dumps(gd.to_dict(), indent=2))
-        messagebox.showinfo("Saved", "Game saved!")
+        ents = {"cards": list(cards), "pieces": list(pieces), "tokens": list(tokens),
+                "decks": list(decks), "tiles": list(tiles)}
+        gone = deleted[:]; deleted.clear()
+        return ents, boards_out, gone
+
+    def _write(batch):
+        for _ents, _boards, gone in batch:        # deletions in the order made
+            for idx in gone:
+                journal.board_deleted(idx)
+        ents, boards_out, _ = batch[-1]
+        journal.save(ents, boards_out)
+
+    autosave = Autosaver(_snapshot, _write, quiet=1.5)
+
+    def _tick():
+        if not root.winfo_exists(): return
+        autosave.poll()
+        save_status.set(autosave.stats.summary())
+        root.after(200, _tick)
+    _tick()
+
+    def _close():
+        autosave.flush()                            # needs the views: before destroy
+        autosave.close(); journal.close()           # worker thread, .journal handle
+        if hasattr(gf, "close"):                    # a .bgc stays mapped until now
+            gf.close()
+        root.destroy()
+    root.protocol("WM_DELETE_WINDOW", _close)
 
     # ---------- selection propagation ------------------------------ #
     root.selected_obj = None
@@ -243,6 +326,7 @@ def open_creator(games_dir: pathlib.Path,
     lbP .bind("<<ListboxSelect>>", lambda e:_sel(lbP , pieces))
     lbT .bind("<<ListboxSelect>>", lambda e:_sel(lbT , tokens))
     lbD .bind("<<ListboxSelect>>", lambda e:_sel(lbD , decks ))
+    lbD .bind("<Double-Button-1>",  _deck_odds)
     lbTi.bind("<<ListboxSelect>>", lambda e:_sel(lbTi, tiles ))
 
     root.transient(); root.grab_set(); root.wait_window()
@@ -0,0 +1,79 @@
+# ui/deck_odds.py
+from __future__ import annotations
+import threading, time, tkinter as tk
+from concurrent.futures import Future
+from tkinter import ttk
+
+from game.deck import Deck
+from game.odds import deck_odds
+
+
+class DeckOdds(tk.Toplevel):
+    """
+    “What are the chances …” for one deck: opening-hand size, which cards
+    count (attack / defense thresholds) and how many shuffles to simulate.
+    The simulation runs off the Tk thread so the window stays responsive.
+    """
+
+    def __init__(self, master, deck: Deck):
+        super().__init__(master)
+        self.title(f"Deck Odds – {deck.name}")
+        self.geometry("380x420")
+        self.deck = deck
+
+        form = ttk.Frame(self, padding=8); form.pack(fill="x")
+        self.hand    = tk.IntVar(value=5)
+        self.min_atk = tk.IntVar(value=0)
+        self.min_def = tk.IntVar(value=0)
+        self.trials  = tk.IntVar(value=1_000_000)
+        for row, (label, var) in enumerate((("Hand size", self.hand),
+                                            ("Count cards with attack ≥", self.min_atk),
+                                            ("… and defense ≥", self.min_def),
+                                            ("Shuffles", self.trials))):
+            ttk.Label(form, text=label).grid(row=row, column=0, sticky="w")
+            ttk.Entry(form, textvariable=var, width=12).grid(row=row, column=1, sticky="e")
+
+        self.run_btn = ttk.Button(self, text="Run", command=self._run)
+        self.run_btn.pack(fill="x", padx=8)
+        self.out = tk.Text(self, height=14, font=("Courier", 10), state="disabled")
+        self.out.pack(fill="both", expand=True, padx=8, pady=6)
+
+    # ---------------------------------------------------------------- #
+    def _run(self):
+        try:
+            hand, atk, dfn, trials = (self.hand.get(), self.min_atk.get(),
+                                      self.min_def.get(), self.trials.get())
+        except tk.TclError:
+            self._show("Please enter whole numbers."); return
+        self.run_btn.state(["disabled"]); self._show("Shuffling …")
+
+        fut: Future = Future()
+
+        def work():                         # no Tk calls off the Tk thread
+            try:
+                t0 = time.perf_counter()
+                res = deck_odds(self.deck, hand,
+                                lambda c: c.attack >= atk and c.defense >= dfn, trials)
+                fut.set_result((res, time.perf_counter() - t0))
+            except BaseException as e:
+                fut.set_exception(e)
+        threading.Thread(target=work, daemon=True).start()
+
+        def done():
+            if not self.winfo_exists():     # window closed mid-run
+                return
+            if not fut.done():
+                self.after(50, done); return
+            try:
+                res, secs = fut.result()
+                self._show(f"{res.summary()}\n\n({secs:.2f} s)")
+            except Exception as e:
+                self._show(f"Simulation failed: {e}")
+            finally:
+                self.run_btn.state(["!disabled"])
+        self.after(50, done)
+
+    def _show(self, text: str):
+        self.out.configure(state="normal")
+        self.out.delete("1.0", "end"); self.out.insert("end", text)
+        self.out.configure(state="disabled")
@@ -28,16 +28,23 @@ class FreeBoardView(ZoomMixin, tk.Canvas):
         self.fb        = fb
         self.img_dir   = img_dir
         self.board_name = "Board"          # overwritten by play_window
+        self.on_change = None              # called after each edit (creator autosave)
 
         self._cache: Dict[str, ImageTk.PhotoImage]   = {}
         self._preview_cache: Dict[str, ImageTk.PhotoImage] = {}
 
-        # tool: place / move / erase
+        # tool: place / move / select / erase
         self.mode = tk.StringVar(value="place")
 
-        # drag state
-        self.drag: Placed | None = None
-        self.dx = self.dy = 0
+        # drag state – the group being moved, where it was grabbed and the
+        # last pointer position
+        self.drag: List[Placed] | None = None
+        self.grab = self.last = (0, 0)
+
+        # selection (pid → Placed) and the rubber-band / lasso being drawn
+        self.selection: Dict[int, Placed] = {}
+        self.sel_path: List[tuple[int, int]] = []
+        self.lasso = False
 
         # zoom
         self._bind_zoom()
@@ -59,13 +66,14 @@ class FreeBoardView(ZoomMixin, tk.Canvas):
     # =========  UI  ================================================== #
     def _build_tool_palette(self, master):
         bar = ttk.Frame(master); bar.pack(side="bottom", fill="x")
-        for txt in ("place", "move", "erase"):
+        for txt in ("place", "move", "select", "erase"):
             ttk.Radiobutton(bar, text=txt.capitalize(),
                             value=txt, variable=self.mode).pack(side="left")
-        ttk.Label(bar, text="⎵ cycles  •  Ctrl+Wheel zoom").pack(side="right")
+        ttk.Label(bar, text="⎵ cycles  •  Shift-drag lasso  •  Ctrl+Wheel zoom")\
+            .pack(side="right")
 
     def _cycle_tool(self, _e):
-        order = ("place", "move", "erase")
+        order = ("place", "move", "select", "erase")
         self.mode.set(order[(order.index(self.mode.get()) + 1) % len(order)])
 
     # =========  DRAW  ================================================= #
@@ -84,19 +92,30 @@ class FreeBoardView(ZoomMixin, tk.Canvas):
         # objects
         for p in self.fb.placed:
             self._sprite(p)
+        self._draw_selection()
 
     def _sprite(self, p: Placed):
         obj, x, y = p.obj, p.x, p.y
+        tag = f"p{p.pid}"                  # lets a drag move just this item
         if getattr(obj, "image_path", None):
-            self.create_image(x, y, image=self._img(obj.image_path), anchor="nw")
+            self.create_image(x, y, image=self._img(obj.image_path), anchor="nw",
+                              tags=tag)
         elif getattr(obj, "points", None):
             pts = [(x+px, y+py) for px,py in obj.points]
             self.create_polygon(*itertools.chain.from_iterable(pts),
-                                fill="khaki", outline="black")
+                                fill="khaki", outline="black", tags=tag)
         else:
             self.create_rectangle(x, y, x+CELL, y+CELL,
-                                  fill="lightyellow", outline="black")
-        self.create_text(x+CELL/2, y+CELL/2, text=obj.name[:6])
+                                  fill="lightyellow", outline="black", tags=tag)
+        self.create_text(x+CELL/2, y+CELL/2, text=obj.name[:6], tags=tag)
+
+    def _draw_selection(self):
+        self.delete("selection")
+        for pid in [k for k, p in self.selection.items() if p not in self.fb.placed]:
+            del self.selection[pid]
+        for pid, p in self.selection.items():
+            self.create_rectangle(*self.fb.box_of(p), dash=(3, 2),
+                                  outline="royalblue", tags=("selection", f"p{pid}"))
 
     def _img(self, path:str):
         if path not in self._cache:
@@ -111,29 +130,73 @@ class FreeBoardView(ZoomMixin, tk.Canvas):
         if tool == "erase":
             hits = self.fb.objects_at(px, py)
             if hits:
-                self.fb.remove(hits[-1]); self._redraw()
+                self.fb.remove(hits[-1]); self._redraw(); self._edited()
             return
 
         if tool == "move":
             hits = self.fb.objects_at(px, py)
             if hits:
-                self.drag = hits[-1]
-                self.dx, self.dy = px - self.drag.x, py - self.drag.y
+                top = hits[-1]             # grabbing a selected item drags the group
+                self.drag = (list(self.selection.values())
+                             if top.pid in self.selection else [top])
+                self.grab = self.last = (px, py)
+            return
+
+        if tool == "select":
+            self.sel_path = [(px, py)]
+            self.lasso = bool(ev.state & 0x0001)      # Shift held → lasso
             return
 
         if tool == "place":
             sel = getattr(self.winfo_toplevel(), "selected_obj", None)
             if not sel: return
-            self.fb.add(sel.clone() if hasattr(sel, "clone") else sel, px, py)
+            if not self.fb.place(sel.clone() if hasattr(sel, "clone") else sel, px, py):
+                self.bell(); return                  # a section doesn't take it
             self._broadcast_place(sel, px, py)
-            self._redraw()
+            self._redraw(); self._edited()
 
     def _move_drag(self, ev):
+        if self.mode.get() == "select" and self.sel_path:
+            self._rubber_band(ev.x, ev.y); return
         if self.mode.get() != "move" or not self.drag: return
-        self.drag.x, self.drag.y = ev.x - self.dx, ev.y - self.dy
-        self._redraw()
-
-    def _drop(self, _): self.drag = None
+        dx, dy = ev.x - self.last[0], ev.y - self.last[1]
+        if not (dx or dy): return
+        self.last = (ev.x, ev.y)
+        self.fb.move_many(self.drag, dx, dy)
+        for p in self.drag:                # shift existing items, no full redraw
+            self.move(f"p{p.pid}", dx, dy)
+
+    def _drop(self, ev):
+        if self.drag and not all(self.fb.can_accept(p.obj, p.x, p.y) for p in self.drag):
+            # dropped into a section that doesn't take it – snap back
+            self.fb.move_many(self.drag, self.grab[0] - self.last[0],
+                              self.grab[1] - self.last[1])
+            self.bell(); self._redraw()
+        elif self.drag and self.last != self.grab:
+            self._edited()
+        self.drag = None
+        if self.mode.get() == "select" and self.sel_path:
+            if self.lasso:
+                hits = self.fb.objects_in_polygon(self.sel_path)
+            else:
+                (x0, y0), x1, y1 = self.sel_path[0], ev.x, ev.y
+                hits = self.fb.objects_in_rect(x0, y0, x1, y1)
+            self.selection = {p.pid: p for p in hits}
+            self.sel_path = []
+            self.delete("rubber")
+            self._draw_selection()
+
+    def _rubber_band(self, x, y):
+        self.delete("rubber")
+        if self.lasso:
+            self.sel_path.append((x, y))
+            if len(self.sel_path) > 1:
+                self.create_line(*itertools.chain.from_iterable(self.sel_path),
+                                 fill="royalblue", dash=(2, 2), tags="rubber")
+        else:
+            x0, y0 = self.sel_path[0]
+            self.create_rectangle(x0, y0, x, y, outline="royalblue",
+                                  dash=(2, 2), tags="rubber")
 
     # -- context menu -------------------------------------------------- #
     def _popup(self, ev):
@@ -148,7 +211,11 @@ class FreeBoardView(ZoomMixin, tk.Canvas):
             m.add_command(label="Shuffle", command=lambda d=obj:(d.shuffle(),self._redraw()))
             m.add_command(label="Reset",   command=lambda d=obj:(d.reset(),  self._redraw()))
             m.add_separator()
-        m.add_command(label="Delete", command=lambda p=top_p:(self.fb.remove(p),self._redraw()))
+        m.add_command(label="Bring to front",
+                      command=lambda p=top_p:(self.fb.raise_to_top(p),self._redraw(),
+                                              self._edited()))
+        m.add_command(label="Delete", command=lambda p=top_p:(self.fb.remove(p),self._redraw(),
+                                                              self._edited()))
         m.tk_popup(ev.x_root, ev.y_root)
 
     def _draw_card(self, deck: Deck):
@@ -195,7 +262,17 @@ class FreeBoardView(ZoomMixin, tk.Canvas):
 
         self.fb.sections.append(dict(name=name, kind=kind.capitalize(),
                                      points=pts, outline=outline, fill=fill))
-        self._reset_sec_binds(); self._redraw()
+        self.fb.invalidate_sections()
+        self._reset_sec_binds(); self._redraw(); self._edited()
+
+    def sections_changed(self):
+        """SectionCatalog callback – sections were edited in place."""
+        self.fb.invalidate_sections()
+        self._redraw(); self._edited()
+
+    def _edited(self):
+        if self.on_change:
+            self.on_change()
 
     def _reset_sec_binds(self):
         self.sec_start = None
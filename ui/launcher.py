@@ -2,6 +2,7 @@ from __future__ import annotations
 import tkinter as tk, json, pathlib
 from tkinter import ttk, simpledialog, messagebox
 from game.game_data import GameData, BoardSpec
+from game.game_file import SUFFIXES, game_path
 from ui.creator_window import open_creator
 from ui.play_window    import open_player
 
@@ -13,8 +14,9 @@ def launch_selector(games_dir: pathlib.Path, images_dir: pathlib.Path):
 
     def refresh():
         lb.delete(0, "end")
-        for f in sorted(games_dir.glob("*.json")):
-            lb.insert("end", f.stem)
+        names = {f.stem for suffix in SUFFIXES for f in games_dir.glob(f"*{suffix}")}
+        for name in sorted(names):
+            lb.insert("end", name)
     refresh()
 
     # ------------- create blank game ---------------------------------- #
@@ -22,7 +24,7 @@ def launch_selector(games_dir: pathlib.Path, images_dir: pathlib.Path):
         name = simpledialog.askstring("New Game", "Game name:", parent=root)
         if not name:
             return
-        path = games_dir / f"{name}.json"
+        path = game_path(games_dir, name)
         if path.exists():
             messagebox.showerror("Exists", "A game with that name exists")
             return
@@ -5,10 +5,11 @@ from tkinter import ttk, messagebox, simpledialog
 from typing import Dict, List
 
 from net.sync import GameServer, GameClient, PORT
-from game import Card, Piece, Token, Deck
+from game import Deck, Player, GameEngine
+from game.mcts import MCTSPlayer
 from game.tile import Tile
-from game.game_data import BoardSpec
-from game.free_board import FreeBoard
+from game.compiled  import open_compiled
+from game.game_file import game_path
 from ui.board_view      import BoardView
 from ui.free_board_view import FreeBoardView
 from ui.tile_grid_view  import TileGridView
@@ -18,16 +19,18 @@ def open_player(games_dir: pathlib.Path,
                 img_dir: pathlib.Path,
                 game_name: str):
 
-    raw = json.loads((games_dir / f"{game_name}.json").read_text())
+    # the compiled artifact (rebuilt only if the game changed) has every
+    # board ready-built; entities are still decoded on first use
+    gf  = open_compiled(game_path(games_dir, game_name))
+    man = gf.manifest
+    stores: Dict[str, Dict[str, object]] = {}
 
-    cards  = {c["name"]: Card .from_dict(c) for c in raw.get("cards",  [])}
-    pieces = {p["name"]: Piece.from_dict(p) for p in raw.get("pieces", [])}
-    tokens = {t["name"]: Token.from_dict(t) for t in raw.get("tokens", [])}
-    decks  = {d["name"]: Deck .from_dict(d, cards)
-              for d in raw.get("decks",  [])}
-    tiles  = {t["name"]: Tile .from_dict(t) for t in raw.get("tiles",  [])}
+    def _store(kind: str) -> Dict[str, object]:
+        if kind not in stores:
+            stores[kind] = {o.name: o for o in getattr(gf, kind)}
+        return stores[kind]
 
-    root = tk.Toplevel(); root.title(f"Play-test — {raw['name']}")
+    root = tk.Toplevel(); root.title(f"Play-test — {gf.name}")
 
     # ── sidebar ───────────────────────────────────────────────────── #
     side = ttk.Frame(root, padding=6); side.grid(row=0, column=0, sticky="ns")
@@ -38,11 +41,9 @@ def open_player(games_dir: pathlib.Path,
     _lbl("Tokens");  lbT  = _lb(6)
     _lbl("Decks");   lbD  = _lb(6)
     _lbl("Tiles");   lbTi = _lb(6)
-    for nm in cards:  lbC .insert("end", nm)
-    for nm in pieces: lbP .insert("end", nm)
-    for nm in tokens: lbT .insert("end", nm)
-    for nm in decks:  lbD .insert("end", nm)
-    for nm in tiles:  lbTi.insert("end", nm)
+    for lb, names in ((lbC, man.cards), (lbP, man.pieces), (lbT, man.tokens),
+                      (lbD, man.decks), (lbTi, man.tiles)):
+        if names: lb.insert("end", *names)
 
     # ── multiplayer toolbar ───────────────────────────────────────── #
     mp_bar = ttk.Frame(root, padding=4); mp_bar.grid(row=1, column=1, sticky="ew")
@@ -83,64 +84,114 @@ def open_player(games_dir: pathlib.Path,
     # ── notebook of boards ────────────────────────────────────────── #
     centre   = ttk.Frame(root, padding=6); centre.grid(row=0, column=1, sticky="nsew")
     nb_board = ttk.Notebook(centre); nb_board.pack(fill="both", expand=True)
-    board_views: List[tk.Canvas] = []
-
-    def _obj_from_rec(rec: Dict):
-        typ, name = rec["type"], rec["name"]
-        return (cards .get(name) if typ == "Card"  else
-                pieces.get(name) if typ == "Piece" else
-                tokens.get(name) if typ == "Token" else
-                decks .get(name) if typ == "Deck"  else
-                tiles .get(name) if typ == "Tile"  else None)
-
-    for b in raw.get("boards", []):
-        tab = ttk.Frame(nb_board)
-
-        if b.get("mode") == "free":
-            fb = FreeBoard(b["width"], b["height"], [], b["sections"])
-            for rec in b.get("placed", []):
-                obj = _obj_from_rec(rec)
-                if obj: fb.add(obj, rec["x"], rec["y"])
-            view = FreeBoardView(tab, fb, img_dir)
-
-        elif b.get("mode") == "tilegrid":
-            cols, rows = b.get("cols"), b.get("rows")
-            if cols is None or rows is None:
-                continue
-            tg = TileGridView(tab, list(tiles.values()), cols, rows, img_dir)
-            for rec in b.get("placed", []):
-                tile = tiles.get(rec["name"])
-                if tile:
-                    tg.place_tile(tile.clone(), rec["col"], rec["row"])
+    board_views: List[tk.Canvas | None] = []      # None until first shown
+
+    def _view(i: int):
+        """Board view for tab `i`, unpickled from the artifact on first use."""
+        if board_views[i] is not None:
+            return board_views[i]
+        (mode, b), tab = gf.built(i), tabs[i]
+
+        if mode == "free":
+            view = FreeBoardView(tab, b, img_dir)
+
+        elif mode == "tilegrid":
+            if b is None:
+                ttk.Label(tab, text="This tile board has no size.").pack()
+                return None
+            tg = TileGridView(tab, list(_store("tiles").values()),
+                              b["cols"], b["rows"], img_dir)
+            for tile, col, row in b["placed"]:
+                tg.place_tile(tile.clone(), col, row)
             view = tg
 
         else:   # classic grid
-            spec = BoardSpec.from_dict(b)
-            view = BoardView(tab, spec.build(), img_dir)
+            view = BoardView(tab, b, img_dir)
 
-        view.board_name = b.get("name", "Board")   # for network msgs
+        view.board_name = man.boards[i][0]          # for network msgs
         view.pack(fill="both", expand=True)
-        nb_board.add(tab, text=view.board_name)
-        board_views.append(view)
+        board_views[i] = view
+        return view
+
+    tabs: List[ttk.Frame] = []
+    for name, _mode in man.boards:
+        tab = ttk.Frame(nb_board)
+        nb_board.add(tab, text=name)
+        tabs.append(tab); board_views.append(None)
+    nb_board.bind("<<NotebookTabChanged>>",
+                  lambda e: _view(nb_board.index("current")))
+    if tabs:
+        _view(0)
+
+    # the artifact lists every image up front: report missing ones once,
+    # not as each board first draws
+    missing = [p for p in gf.images if not (img_dir / p).exists()]
+    if missing:
+        messagebox.showwarning("Missing images",
+                               f"{len(missing)} image(s) not found in {img_dir}, e.g.\n"
+                               + "\n".join(missing[:5]), parent=root)
 
     # ── selection handling ────────────────────────────────────────── #
     root.selected_obj = None
-    def _sel(lb, store: Dict[str, object]):
+    def _sel(lb, kind: str):
         idx = lb.curselection()
-        if idx: root.selected_obj = store[lb.get(idx[0])]
+        if idx: root.selected_obj = _store(kind)[lb.get(idx[0])]
+
+    lbC .bind("<<ListboxSelect>>", lambda e:_sel(lbC , "cards" ))
+    lbP .bind("<<ListboxSelect>>", lambda e:_sel(lbP , "pieces"))
+    lbT .bind("<<ListboxSelect>>", lambda e:_sel(lbT , "tokens"))
+    lbD .bind("<<ListboxSelect>>", lambda e:_sel(lbD , "decks" ))
+    lbTi.bind("<<ListboxSelect>>", lambda e:_sel(lbTi, "tiles" ))
+
+    # ── AI placement demo (MCTS on a worker thread) ──────────────── #
+    # Play-test has no hands or deck to search, so this only shows where
+    # the search would put the selected object on an otherwise idle
+    # position – a demo of `MCTSPlayer`, not an opponent.
+    ai_status = tk.StringVar(value="")
+
+    def ai_move():
+        view = _view(nb_board.index("current")) if board_views else None
+        sel  = root.selected_obj
+        if not isinstance(view, BoardView) or sel is None or isinstance(sel, Tile):
+            messagebox.showinfo("AI placement", "Pick a card, piece, token or deck "
+                                "and open a grid board first.", parent=root)
+            return
+        ai = MCTSPlayer("AI", budget=1.0); ai.hand = [sel]
+        fut = ai.think(GameEngine([ai, Player("You")], Deck("Scratch"), view.board))
+        ai_btn.state(["disabled"]); ai_status.set("Searching …")
 
-    lbC .bind("<<ListboxSelect>>", lambda e:_sel(lbC , cards ))
-    lbP .bind("<<ListboxSelect>>", lambda e:_sel(lbP , pieces))
-    lbT .bind("<<ListboxSelect>>", lambda e:_sel(lbT , tokens))
-    lbD .bind("<<ListboxSelect>>", lambda e:_sel(lbD , decks ))
-    lbTi.bind("<<ListboxSelect>>", lambda e:_sel(lbTi, tiles ))
+        def done():
+            if not root.winfo_exists():     # play-test closed mid-search
+                return
+            if not fut.done():
+                root.after(50, done); return
+            ai_btn.state(["!disabled"])
+            try:
+                res = fut.result()
+            except Exception as e:
+                ai_status.set("")
+                messagebox.showerror("AI placement", f"Search failed: {e}", parent=root)
+                return
+            if res.move is None:
+                ai_status.set("No legal cell."); return
+            x, y, _ = res.move
+            ai_status.set(f"Placed at ({x}, {y})")
+            if view.place_many([(x, y, sel.clone() if isinstance(sel, Deck) else sel)]).ok:
+                view._broadcast_place(sel, x, y)
+        root.after(50, done)
+
+    ai_btn = ttk.Button(side, text="AI Placement (demo)", command=ai_move)
+    ai_btn.pack(fill="x", pady=(10, 0))
+    ttk.Label(side, textvariable=ai_status).pack(anchor="w")
 
     ttk.Button(side, text="Quit", command=root.destroy).pack(fill="x", pady=10)
 
     root.columnconfigure(1, weight=1); root.rowconfigure(0, weight=1)
 
     # ── network polling loop ─────────────────────────────────────── #
-    def _apply_remote(cmd: Dict):
+    def _apply_remote(cmd: Dict, grid_batch: Dict, dirty: List):
+        """Apply one message; grid placements are queued in `grid_batch`
+        and free boards listed in `dirty` so each redraws once per poll."""
         def _dup(o):                               # ← helper inside _apply_remote
             return o.clone() if hasattr(o, "clone") else o
 
@@ -154,31 +205,37 @@ def open_player(games_dir: pathlib.Path,
             # locate view
             try:
                 idx = [nb_board.tab(i, "text") for i in nb_board.tabs()].index(board_name)
-                view = board_views[idx]
+                view = _view(idx)
             except ValueError:
                 return
             # object
-            obj = (cards.get(obj_name) or pieces.get(obj_name) or
-                   tokens.get(obj_name) or tiles .get(obj_name) or
-                   decks .get(obj_name))
+            obj = next(filter(None, (gf.entity(k, obj_name) for k in
+                        ("cards", "pieces", "tokens", "tiles", "decks"))), None)
             if not obj: return
             if isinstance(view, BoardView):            # grid
-                view.board.place(cmd["x"], cmd["y"], _dup(obj))
-                view._redraw_all()
+                grid_batch.setdefault(view, []).append(
+                    (cmd["x"], cmd["y"], _dup(obj)))
 
             elif isinstance(view, FreeBoardView):      # free
-                view.fb.add(_dup(obj), cmd["x"], cmd["y"])
-                view._redraw()
+                if view.fb.place(_dup(obj), cmd["x"], cmd["y"]) and view not in dirty:
+                    dirty.append(view)
 
             elif isinstance(view, TileGridView):       # tile-grid
                 view.place_tile(_dup(obj), cmd["col"], cmd["row"])
 
     def poll_net():
+        grid_batch: Dict[BoardView, list] = {}
+        dirty: List[FreeBoardView] = []
         for q in (getattr(srv, "in_q", None), getattr(cli, "in_q", None)):
             if not q: continue
             while not q.empty():
-                _apply_remote(json.loads(q.get()))
+                _apply_remote(json.loads(q.get()), grid_batch, dirty)
+        for view, items in grid_batch.items():
+            view.place_many(items, drop_rejected=True)
+        for view in dirty:
+            view._redraw()
         root.after(50, poll_net)
 
     poll_net()
     root.transient(); root.grab_set(); root.wait_window()
+    gf.close()
@@ -32,6 +32,7 @@ class TileGridView(ZoomMixin, tk.Canvas):
         self.grid: list[list[Tile | None]] = [[None]*cols for _ in range(rows)]
         self.img_dir = img_dir
         self._cache: Dict[str, ImageTk.PhotoImage] = {}
+        self.on_change = None               # called after each edit (creator autosave)
 
         self._bind_zoom()                   # Ctrl-wheel zoom
         self.bind("<Button-1>", self._click)
@@ -64,6 +65,8 @@ class TileGridView(ZoomMixin, tk.Canvas):
         if isinstance(sel, Tile):
             self.place_tile(sel.clone(), col, row)
             self.winfo_toplevel().selected_obj = None
+            if self.on_change:
+                self.on_change()
 
     # -------------------------------------------------------------- #
     #  Drawing                                                       #